@@ -2,7 +2,6 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import os
-import pathlib
 
 def _env_bool(name: str, default: bool = False) -> bool:
     """Parse boolean env vars safely."""
@@ -26,22 +25,45 @@ MULTI_VENUE_ENABLED = MULTI_VENUE
 import html
 import traceback
 import json
+import array
 import csv
+import gzip
+import collections
+import bisect
+import functools
+import operator
 import io
+import mmap
+import shutil
+import struct
 import hashlib
+import heapq
+import itertools
+import types
 import hmac
 import base64
 import secrets
+import tempfile
+import random
 import re
+import sys
 import time
 import datetime
 from datetime import datetime, date, timezone, timedelta
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Mapping
 
 import time
+import threading
+import atexit
 import urllib.request
 import urllib.error
-from flask import Flask, request, jsonify, send_from_directory, send_file, make_response, g, render_template, render_template_string, redirect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from flask import Flask, request, jsonify, send_from_directory, send_file, make_response, g, render_template, render_template_string, redirect, stream_with_context, Response
+
+
+def _utc_z_now() -> str:
+    """Current UTC time as `YYYY-MM-DDTHH:MM:SSZ` (no datetime object round-trip)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 # ============================================================
 # Enterprise persistence: Redis (optional, recommended)
@@ -66,6 +88,31 @@ except Exception:
     _REDIS = None
     _REDIS_ENABLED = False
 
+# Fast JSON encoder (optional). Falls back to stdlib json when orjson is missing.
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+# Compact binary cache files (optional): used for *.msgpack cache paths when installed.
+try:
+    import msgpack  # type: ignore
+except Exception:
+    msgpack = None
+
+# Brotli (optional): precompressed static JSON bodies when clients accept `br`.
+try:
+    import brotli  # type: ignore
+except Exception:
+    brotli = None
+
+# lxml (optional): C HTML parser for the qualified-teams scrape; regex fallback without it.
+try:
+    import lxml.etree  # type: ignore
+    import lxml.html  # type: ignore
+except Exception:
+    lxml = None
+
 # Namespace for keys (safe for multi-app reuse)
 _REDIS_NS = os.environ.get("REDIS_NAMESPACE", "wc26").strip() or "wc26"
 
@@ -90,9 +137,16 @@ _REDIS_PATH_KEY_MAP = {  # values are suffixes; full key includes namespace + ve
     os.environ.get("ALERT_SETTINGS_FILE", "/tmp/wc26_{venue}_alert_settings.json"): "alert_settings",
     os.environ.get("ALERT_STATE_FILE", "/tmp/wc26_{venue}_alert_state.json"): "alert_state",
     os.environ.get("POLL_STORE_FILE", "/tmp/wc26_{venue}_poll_votes.json"): "poll_store",
-    os.environ.get("FIXTURE_CACHE_FILE", "/tmp/wc26_{venue}_fixtures.json"): "fixtures_cache",
+    os.environ.get("FIXTURE_CACHE_FILE", "/tmp/wc26_{venue}_fixtures.json.gz"): "fixtures_cache",
 }
 
+
+@functools.lru_cache(maxsize=1024)
+def _redis_file_key(path_template: str, vid: str) -> str:
+    """Full Redis key for a mapped file template + venue ("" when the path isn't Redis-backed)."""
+    suffix = _REDIS_PATH_KEY_MAP.get(path_template)
+    return f"{_REDIS_NS}:{vid}:{suffix}" if suffix else ""
+
 def _redis_init_if_needed() -> None:
     """Ensure Redis is initialized under Gunicorn.
 
@@ -155,7 +209,7 @@ def _redis_get_json(key: str, default=None):
         raw = _REDIS.get(key)
         if not raw:
             return default
-        return json.loads(raw)
+        return _loads_json_bytes(raw)
     except Exception:
         return default
 
@@ -163,7 +217,71 @@ def _redis_set_json(key: str, payload) -> bool:
     if not (_REDIS_ENABLED and _REDIS and key):
         return False
     try:
-        _REDIS.set(key, json.dumps(payload, ensure_ascii=False))
+        _REDIS.set(key, _dumps_json_compact(payload))
+        return True
+    except Exception:
+        return False
+
+def _redis_pipeline_smoke(key: str, payload, ttl: int = 60):
+    """SET key EX ttl + GET key in one pipelined round-trip; returns the decoded value read back."""
+    if not (_REDIS_ENABLED and _REDIS and key):
+        return None
+    pipe = _REDIS.pipeline()
+    pipe.set(key, _dumps_json_compact(payload), ex=ttl)
+    pipe.get(key)
+    _, raw = pipe.execute()
+    return _loads_json_bytes(raw) if raw else None
+
+
+# msgpack-encoded Redis values (small shared state read on most admin requests).
+# - Stored under "<json key>:mp"; the main client decodes responses to str, so bytes go
+#   through a second client built from the same connection settings
+# - A missing packed value falls back to the legacy JSON key once and migrates it
+# - Without msgpack installed both helpers keep using the JSON key
+_REDIS_BIN = None
+_REDIS_BIN_LOCK = threading.Lock()
+
+
+def _redis_bin():
+    """Redis client returning raw bytes (same server/TLS settings as _REDIS), or None."""
+    global _REDIS_BIN
+    if _REDIS_BIN is None and msgpack is not None and _REDIS_ENABLED and _REDIS is not None:
+        with _REDIS_BIN_LOCK:
+            if _REDIS_BIN is None:
+                try:
+                    pool = _REDIS.connection_pool
+                    kwargs = {**pool.connection_kwargs, "decode_responses": False}
+                    _REDIS_BIN = redis.Redis(
+                        connection_pool=redis.ConnectionPool(connection_class=pool.connection_class, **kwargs)
+                    )
+                except Exception:
+                    return None
+    return _REDIS_BIN
+
+
+def _redis_get_pack(key: str, default=None):
+    rb = _redis_bin() if key else None
+    if rb is None:
+        return _redis_get_json(key, default=default)
+    try:
+        raw = rb.get(key + ":mp")
+        if raw:
+            return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    except Exception:
+        return default
+    legacy = _redis_get_json(key, default=None)
+    if legacy is None:
+        return default
+    _redis_set_pack(key, legacy)
+    return legacy
+
+
+def _redis_set_pack(key: str, payload) -> bool:
+    rb = _redis_bin() if key else None
+    if rb is None:
+        return _redis_set_json(key, payload)
+    try:
+        rb.set(key + ":mp", msgpack.packb(payload, use_bin_type=True))
         return True
     except Exception:
         return False
@@ -430,6 +548,62 @@ if os.environ.get("RENDER") == "true":
 
 app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
 
+# ============================================================
+# JSON responses: orjson-backed provider (when installed)
+# - Keeps Flask's defaults: sorted keys, http_date for datetimes, default() for Decimal/UUID/dataclasses
+# - Falls back to the stdlib provider for pretty-print kwargs or anything orjson rejects
+# - Non-ASCII text (es/pt/fr) is sent as UTF-8 on every path, never as \uXXXX escapes
+# ============================================================
+from flask.json.provider import DefaultJSONProvider
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    _OPTS = 0
+    if orjson is not None:
+        _OPTS = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # jsonify() always asks for compact separators, which is orjson's only layout
+        if kwargs.get("separators") == (",", ":"):
+            kwargs.pop("separators")
+        if not kwargs:
+            try:
+                return orjson.dumps(obj, default=self.default, option=self._OPTS).decode("utf-8")
+            except Exception:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if not kwargs:
+            try:
+                return orjson.loads(s)
+            except Exception:
+                pass
+        return super().loads(s, **kwargs)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+app.json.ensure_ascii = False  # stdlib provider / fallback: match orjson's UTF-8 output
+
+
+def _json_response(body: Any, status: int = 200):
+    """jsonify() equivalent for large bodies: orjson bytes go straight into the Response (no str round-trip)."""
+    if orjson is not None:
+        try:
+            raw = orjson.dumps(body, default=app.json.default, option=_OrjsonProvider._OPTS)
+            return Response(raw + b"\n", status=status, mimetype="application/json")
+        except Exception:
+            pass
+    resp = jsonify(body)
+    resp.status_code = status
+    return resp
+
 
 # ============================================================
 # Public platform probes (Azure/App Service friendly)
@@ -675,6 +849,49 @@ def add_no_cache_headers(response):
     return response
 
 
+# ============================================================
+# gzip for dynamic JSON responses
+# - Bodies of at least JSON_GZIP_MIN_BYTES (0 disables) are gzipped when the client accepts it
+# - Already-encoded (e.g. precompressed /menu.json), streamed and file responses are left alone
+# - A gzipped body gets its own strong ETag ("<etag>-gz"); handlers accept either form in
+#   If-None-Match (_etag_matches) and a 304 echoes the form the client sent
+# ============================================================
+JSON_GZIP_MIN_BYTES = int(os.environ.get("JSON_GZIP_MIN_BYTES", "1024") or 0)
+
+
+def _etag_matches(etag: str) -> bool:
+    inm = request.if_none_match
+    return inm.contains(etag) or inm.contains(etag + "-gz")
+
+
+@app.after_request
+def gzip_json_response(response):
+    try:
+        if JSON_GZIP_MIN_BYTES <= 0 or "Content-Encoding" in response.headers:
+            return response
+        etag, weak = response.get_etag()
+        if response.status_code == 304:
+            if etag and request.if_none_match.contains(etag + "-gz"):
+                response.set_etag(etag + "-gz", weak)
+            return response
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or response.mimetype != "application/json"):
+            return response
+        body = response.get_data()
+        if len(body) < JSON_GZIP_MIN_BYTES:
+            return response
+        response.vary.add("Accept-Encoding")
+        if not request.accept_encodings["gzip"]:
+            return response
+        response.set_data(gzip.compress(body, compresslevel=5, mtime=0))
+        response.headers["Content-Encoding"] = "gzip"
+        if etag:
+            response.set_etag(etag + "-gz", weak)
+    except Exception:
+        pass
+    return response
+
+
 # ============================================================
 # ENV + Config
 # ============================================================
@@ -703,13 +920,16 @@ SHEET_NAME = os.environ.get("GOOGLE_SHEET_NAME", "World Cup AI Reservations")
 VENUE_LOCK = (os.environ.get("VENUE_LOCK") or "").strip()
 DEFAULT_VENUE_ID = (os.environ.get("DEFAULT_VENUE_ID") or "default").strip() or "default"
 VENUES_DIR = os.environ.get("VENUES_DIR", os.path.join(os.path.dirname(__file__), "config", "venues"))
-_MULTI_VENUE_CACHE: Dict[str, Any] = {"ts": 0.0, "venues": {}}
+# "ver" is bumped whenever the venue set is reloaded/invalidated (keys the per-venue lru caches)
+_MULTI_VENUE_CACHE: Dict[str, Any] = {"ts": 0.0, "venues": {}, "sorted_ids": (), "ver": 0}
 
 def _invalidate_venues_cache():
     # Multi-venue list cache
     try:
         _MULTI_VENUE_CACHE["ts"] = 0.0
         _MULTI_VENUE_CACHE["venues"] = {}
+        _MULTI_VENUE_CACHE["sorted_ids"] = ()
+        _MULTI_VENUE_CACHE["ver"] = int(_MULTI_VENUE_CACHE.get("ver") or 0) + 1
     except Exception:
         pass
 
@@ -726,10 +946,14 @@ def _invalidate_venues_cache():
     except Exception:
         pass
 
+_SLUG_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+@functools.lru_cache(maxsize=2048)
 def _slugify_venue_id(s: str) -> str:
+    # Pure function over a small set of venue ids -> memoized
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    # runs of non-alnum collapse to a single "-", so no separate "-{2,}" pass is needed
+    s = _SLUG_NON_ALNUM_RE.sub("-", s).strip("-")
     return s or "default"
 
 
@@ -745,12 +969,16 @@ def _load_venues_from_disk() -> Dict[str, Any]:
         if not os.path.isdir(VENUES_DIR):
             _MULTI_VENUE_CACHE["ts"] = now
             _MULTI_VENUE_CACHE["venues"] = venues
+            _MULTI_VENUE_CACHE["sorted_ids"] = ()
+            _MULTI_VENUE_CACHE["ver"] = int(_MULTI_VENUE_CACHE.get("ver") or 0) + 1
             return venues
 
+        # scandir: names + file type come from one directory read (no per-file stat on Linux)
         files: List[str] = []
-        for fn in os.listdir(VENUES_DIR):
-            if fn.lower().endswith((".yaml", ".yml", ".json")):
-                files.append(os.path.join(VENUES_DIR, fn))
+        with os.scandir(VENUES_DIR) as it:
+            for entry in it:
+                if entry.name.lower().endswith((".yaml", ".yml", ".json")) and entry.is_file():
+                    files.append(entry.path)
         files.sort()
 
         yaml_mod = None
@@ -762,16 +990,21 @@ def _load_venues_from_disk() -> Dict[str, Any]:
 
         for fp in files:
             try:
-                raw = pathlib.Path(fp).read_text(encoding="utf-8")
+                with open(fp, "rb") as f:
+                    raw = f.read()
             except Exception:
                 continue
 
             cfg = None
             if fp.lower().endswith(".json"):
+                # Parse bytes directly (orjson decodes UTF-8 + JSON in one pass)
                 try:
-                    cfg = json.loads(raw)
+                    cfg = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 except Exception:
-                    cfg = None
+                    try:
+                        cfg = json.loads(raw)
+                    except Exception:
+                        cfg = None
             else:
                 if yaml_mod is None:
                     # YAML venue file present but PyYAML missing: skip YAML so JSON venues still work
@@ -803,9 +1036,19 @@ def _load_venues_from_disk() -> Dict[str, Any]:
 
     _MULTI_VENUE_CACHE["ts"] = now
     _MULTI_VENUE_CACHE["venues"] = venues
+    # Sorted id view is rebuilt only when the venue set is reloaded
+    _MULTI_VENUE_CACHE["sorted_ids"] = tuple(sorted(venues.keys()))
+    _MULTI_VENUE_CACHE["ver"] = int(_MULTI_VENUE_CACHE.get("ver") or 0) + 1
     return venues
 
 
+def _sorted_venue_ids() -> Tuple[str, ...]:
+    """Venue ids in sorted order, precomputed alongside the venues cache."""
+    _load_venues_from_disk()
+    ids = _MULTI_VENUE_CACHE.get("sorted_ids")
+    return ids if isinstance(ids, tuple) else ()
+
+
 def _iter_venue_json_configs() -> List[Dict[str, Any]]:
     """Return venue config descriptors from VENUES_DIR.
 
@@ -936,8 +1179,20 @@ def _venue_cfg(venue_id: Optional[str] = None) -> Dict[str, Any]:
     return cfg if isinstance(cfg, dict) else {"venue_id": vid, "status": "implicit"}
 
 
+def _venue_cache_ver() -> int:
+    """Current venue-set version (refreshes the venues cache first if it expired)."""
+    _load_venues_from_disk()
+    return int(_MULTI_VENUE_CACHE.get("ver") or 0)
+
+
 def _venue_sheet_id(venue_id: Optional[str] = None) -> str:
-    cfg = _venue_cfg(venue_id)
+    vid = _slugify_venue_id(venue_id or _venue_id())
+    return _venue_sheet_id_cached(vid, _venue_cache_ver())
+
+
+@functools.lru_cache(maxsize=512)
+def _venue_sheet_id_cached(vid: str, _ver: int) -> str:
+    cfg = _venue_cfg(vid)
     data = cfg.get("data") if isinstance(cfg.get("data"), dict) else {}
     sid = str((data or {}).get("google_sheet_id") or (cfg.get("google_sheet_id") or "")).strip()
     return sid
@@ -959,7 +1214,16 @@ def _venue_features(venue_id: Optional[str] = None) -> Dict[str, Any]:
 def _venue_is_active(venue_id: Optional[str] = None) -> bool:
     """Return whether a venue is active (fan-facing intake allowed)."""
     try:
-        cfg = _venue_cfg(venue_id)
+        vid = _slugify_venue_id(venue_id or _venue_id())
+        return _venue_is_active_cached(vid, _venue_cache_ver())
+    except Exception:
+        return True
+
+
+@functools.lru_cache(maxsize=512)
+def _venue_is_active_cached(vid: str, _ver: int) -> bool:
+    try:
+        cfg = _venue_cfg(vid)
         if not isinstance(cfg, dict):
             return True
 
@@ -988,8 +1252,8 @@ def _venue_is_active(venue_id: Optional[str] = None) -> bool:
 
 def _public_base_url() -> str:
     """Return the correct public base URL when behind proxies (Azure / Render / Cloudflare)."""
-    proto = (request.headers.get("X-Forwarded-Proto") or request.scheme or "https").split(",")[0].strip()
-    host = (request.headers.get("X-Forwarded-Host") or request.host or "").split(",")[0].strip()
+    proto = (request.headers.get("X-Forwarded-Proto") or request.scheme or "https").partition(",")[0].strip()
+    host = (request.headers.get("X-Forwarded-Host") or request.host or "").partition(",")[0].strip()
     return f"{proto}://{host}".rstrip("/")
 
 # Back-compat rules:
@@ -1018,13 +1282,120 @@ def _public_base_url() -> str:
         return True
 
 
+def _parse_creds_env() -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    raw = os.environ.get("GOOGLE_CREDS_JSON")
+    if not raw:
+        return None, None
+    try:
+        return json.loads(raw), None
+    except Exception as e:
+        return None, e
+
+
+# Service-account info from GOOGLE_CREDS_JSON, parsed once at import (the env never changes in-process).
+_CREDS_INFO, _CREDS_INFO_ERROR = _parse_creds_env()
+
+
+# ---- Sheets retry policy ----
+# Quota (429) and transient server errors (5xx) are retried with exponential backoff + jitter
+# (a Retry-After header wins), for at most SHEETS_RETRY_MAX_SECONDS per call.
+SHEETS_RETRY_MAX_SECONDS = float(os.environ.get("SHEETS_RETRY_MAX_SECONDS", "20") or 20)
+_SHEETS_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def _is_sheets_rate_limited(e: Exception) -> bool:
+    """True for Google Sheets quota errors (HTTP 429 / RESOURCE_EXHAUSTED)."""
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    msg = str(e).lower()
+    return "429" in msg or "quota" in msg or "resource_exhausted" in msg
+
+
+def _sheets_retryable(e: Exception) -> bool:
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    if status is not None:
+        return status in _SHEETS_RETRY_STATUSES
+    return _is_sheets_rate_limited(e)
+
+
+def _sheets_retry_after(e: Exception) -> Optional[float]:
+    try:
+        v = getattr(getattr(e, "response", None), "headers", None).get("Retry-After")
+        return max(0.0, float(v)) if v is not None else None
+    except Exception:
+        return None
+
+
+def _retrying_sheets_call(fn, retryable):
+    @functools.wraps(fn)
+    def inner(*args, **kwargs):
+        deadline = time.monotonic() + SHEETS_RETRY_MAX_SECONDS
+        for attempt in itertools.count():
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if not retryable(e):
+                    raise
+                delay = _sheets_retry_after(e)
+                if delay is None:
+                    delay = min(32.0, 2.0 ** attempt) + random.random()
+                if time.monotonic() + delay > deadline:
+                    raise
+                time.sleep(delay)
+    return inner
+
+
+def with_backoff(fn):
+    """Decorator: retry a Sheets call on 429/5xx (see SHEETS_RETRY_MAX_SECONDS); other errors raise at once."""
+    return _retrying_sheets_call(fn, _sheets_retryable)
+
 
+def with_rate_limit_backoff(fn):
+    """Decorator: like with_backoff, but only retries 429.
+
+    For non-idempotent calls (append_rows): after a 5xx the rows may already have been written,
+    so retrying could append them twice.
+    """
+    return _retrying_sheets_call(fn, _is_sheets_rate_limited)
+
+
+# Shared gspread client (see get_gspread_client) plus the spreadsheet/worksheet handles opened
+# through it: resolving a handle costs a metadata round-trip, so they are reused for a few minutes.
+_GC_LOCK = threading.Lock()
+_GC_CLIENT = None
+
+_SHEET_HANDLE_TTL = 300.0
+_SHEET_HANDLES: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+# One opener per handle: a burst of reservations after the TTL lapses waits for a single re-open.
+_SHEET_HANDLE_LOCKS: Dict[Tuple[str, ...], threading.Lock] = {}
+
+
+def _sheet_handle(key: Tuple[str, ...], opener):
+    hit = _SHEET_HANDLES.get(key)
+    if hit and time.time() - hit[0] < _SHEET_HANDLE_TTL:
+        return hit[1]
+    lock = _SHEET_HANDLE_LOCKS.get(key)
+    if lock is None:
+        lock = _SHEET_HANDLE_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        hit = _SHEET_HANDLES.get(key)
+        if hit and time.time() - hit[0] < _SHEET_HANDLE_TTL:
+            return hit[1]
+        handle = opener()
+        _SHEET_HANDLES[key] = (time.time(), handle)
+        return handle
+
+
+@with_backoff
 def _open_default_spreadsheet(gc, venue_id: Optional[str] = None):
     """Open the venue-scoped spreadsheet (by sheet_id if present) else fall back to SHEET_NAME."""
     sid = _venue_sheet_id(venue_id)
+    if gc is not _GC_CLIENT:
+        return gc.open_by_key(sid) if sid else gc.open(SHEET_NAME)
     if sid:
-        return gc.open_by_key(sid)
-    return gc.open(SHEET_NAME)
+        return _sheet_handle(("key", sid), lambda: gc.open_by_key(sid))
+    return _sheet_handle(("name", SHEET_NAME), lambda: gc.open(SHEET_NAME))
 
 def get_sheet(tab: Optional[str] = None, venue_id: Optional[str] = None):
     """Return a worksheet for the specified venue (or current venue)."""
@@ -1035,9 +1406,10 @@ def get_sheet(tab: Optional[str] = None, venue_id: Optional[str] = None):
     if not tab:
         tab = _venue_sheet_tab(venue_id) or ""
 
+    key = ("ws", str(getattr(sh, "id", "") or id(sh)), tab)
     if tab:
-        return sh.worksheet(tab)
-    return sh.sheet1
+        return _sheet_handle(key, with_backoff(lambda: sh.worksheet(tab)))
+    return _sheet_handle(key, with_backoff(lambda: sh.sheet1))
 
 
 def _check_sheet_id(sheet_id: str) -> Dict[str, Any]:
@@ -1157,6 +1529,20 @@ BUSINESS_RULES = {
     "match_day_banner": "🏟️ Match-day mode: Opening at 11am on match days!",
 }
 
+# (closed_dates list, frozenset of it): rebuilt only when BUSINESS_RULES gets a new list
+# (every rules load/save rebinds BUSINESS_RULES via _deep_merge).
+_CLOSED_DATES_CACHE: Tuple[Any, frozenset] = (None, frozenset())
+
+
+def _closed_dates_set() -> frozenset:
+    global _CLOSED_DATES_CACHE
+    raw = BUSINESS_RULES.get("closed_dates", [])
+    src, cached = _CLOSED_DATES_CACHE
+    if src is not raw:
+        cached = frozenset(raw or [])
+        _CLOSED_DATES_CACHE = (raw, cached)
+    return cached
+
 
 # ============================================================
 # Admin-persisted overrides (Rules + Menu)
@@ -1535,8 +1921,7 @@ def _migrate_drafts_out_of_venue_config(venue_id: str) -> None:
     if not os.path.exists(path):
         return
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            vcfg = json.load(f) or {}
+        vcfg = _read_json_bytes(path) or {}
     except Exception:
         return
     drafts = vcfg.get("drafts")
@@ -1548,8 +1933,7 @@ def _migrate_drafts_out_of_venue_config(venue_id: str) -> None:
     vcfg.pop("drafts", None)
     vcfg.pop("updated_at", None)  # draft-specific meta
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(vcfg, f, indent=2, ensure_ascii=False, sort_keys=True)
+        _write_bytes_file(path, _dumps_json_pretty(vcfg))
     except Exception:
         pass
 
@@ -3254,6 +3638,84 @@ def admin_api_whoami():
     return jsonify(ok=bool(ctx.get("ok")), role=ctx.get("role", ""), actor=ctx.get("actor", ""), venue_id=ctx.get("venue_id",""))
 
 
+# ============================================================
+# JSON persistence helpers
+# - PERSIST_ASYNC=0 makes the batched writers (leads, JSONL logs, audit) write inline (tests / debugging)
+# - Venue configs are written synchronously by _write_json_now, one writer per path at a time
+# ============================================================
+PERSIST_ASYNC = _env_bool("PERSIST_ASYNC", default=True)
+_PERSIST_LOCK = threading.Lock()
+_PERSIST_PATH_LOCKS: Dict[str, threading.Lock] = {}
+
+
+def _dumps_json_pretty(obj: Any) -> bytes:
+    """Encode config JSON as indented, key-sorted UTF-8 (same layout as hand-edited venue files)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except Exception:
+            pass
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_json_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except Exception:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json_bytes(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available); gzip payloads are detected by magic bytes."""
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except Exception:
+            pass
+    return json.loads(raw)
+
+
+def _read_json_bytes(path: str) -> Any:
+    """Read + parse a JSON file with one binary read (no separate UTF-8 decode; raises like json.load)."""
+    with open(path, "rb") as f:
+        return _loads_json_bytes(f.read())
+
+
+def _read_cache_file(path: str) -> Any:
+    """Read a cache file: msgpack for *.msgpack paths (when installed), else JSON / gzipped JSON."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if msgpack is not None and path.endswith(".msgpack"):
+        try:
+            return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+        except Exception:
+            pass  # written as JSON (msgpack was missing at write time)
+    return _loads_json_bytes(raw)
+
+
+def _write_bytes_file(path: str, raw: bytes) -> None:
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(raw)
+
+
+def _write_json_now(path: str, obj: Any) -> None:
+    """Write a pretty JSON config to path before returning; raises if the write fails."""
+    raw = _dumps_json_pretty(obj)
+    with _PERSIST_LOCK:
+        lock = _PERSIST_PATH_LOCKS.get(path)
+        if lock is None:
+            lock = _PERSIST_PATH_LOCKS[path] = threading.Lock()
+    with lock:
+        _write_bytes_file(path, raw)
+
+
 def _write_venue_config(venue_id: str, pack: Dict[str, Any]) -> Tuple[bool, str, str]:
     """Persist venue config into VENUES_DIR as <venue_id>.json (best effort)."""
     wrote = False
@@ -3262,8 +3724,7 @@ def _write_venue_config(venue_id: str, pack: Dict[str, Any]) -> Tuple[bool, str,
     try:
         os.makedirs(VENUES_DIR, exist_ok=True)
         write_path = os.path.join(VENUES_DIR, f"{venue_id}.json")
-        with open(write_path, "w", encoding="utf-8") as f:
-            json.dump(pack, f, indent=2, sort_keys=True)
+        _write_bytes_file(write_path, _dumps_json_pretty(pack))
         wrote = True
         # refresh cache immediately
         _invalidate_venues_cache()
@@ -3946,6 +4407,127 @@ def _redis_runtime_status() -> Dict[str, Any]:
         "redis_error": err,
     }
 
+def _freeze_json(obj: Any) -> Any:
+    """Read-only view of a JSON-shaped literal: dicts -> MappingProxyType, lists -> tuples."""
+    if isinstance(obj, dict):
+        return types.MappingProxyType({k: _freeze_json(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze_json(v) for v in obj)
+    return obj
+
+
+def _thaw_json(obj: Any) -> Any:
+    """Inverse of _freeze_json, for serializers that only accept dict/list."""
+    if isinstance(obj, Mapping):
+        return {k: _thaw_json(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw_json(v) for v in obj]
+    return obj
+
+
+# Non-English menu/prompt tables: I18N_DIR/<lang>.json, read lazily (most venues serve one language).
+#   {"menu": {"title": "...", "items": [[name, desc, tag], ...]}, "strings": {key: text}}
+# menu items are aligned with MENU_ITEMS.
+I18N_DIR = os.environ.get("I18N_DIR", os.path.join(_BASE_DIR, "config", "i18n"))
+# Successfully parsed I18N_DIR files by lang; a failed read isn't cached, so the next use retries it.
+_LANG_FILES: Dict[str, Dict[str, Any]] = {}
+
+
+def _load_lang(lang: str) -> Dict[str, Any]:
+    if lang == "en" or lang not in SUPPORTED_LANGS:
+        return {}
+    hit = _LANG_FILES.get(lang)
+    if hit is not None:
+        return hit
+    try:
+        with open(os.path.join(I18N_DIR, f"{lang}.json"), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    _LANG_FILES[lang] = data
+    return data
+
+
+def get_menu(lang: str) -> Tuple[str, Tuple[Tuple[str, str, str], ...]]:
+    """Built-in (title, ((name, desc, tag), ...)) for `lang`, loading it on first use; English fallback."""
+    hit = MENU_I18N.get(lang)
+    if hit is None:
+        menu = _load_lang(lang).get("menu") or {}
+        rows = tuple(tuple(str(x) for x in row) for row in (menu.get("items") or ()) if isinstance(row, list))
+        if len(rows) != len(MENU_ITEMS) or any(len(r) != 3 for r in rows):
+            return MENU_I18N["en"]
+        hit = MENU_I18N[lang] = (str(menu.get("title") or ""), rows)
+    return hit
+
+
+@functools.lru_cache(maxsize=1)
+def _builtin_menu() -> Mapping[str, Any]:
+    """Legacy {lang: {"title", "items": [...]}} view of the built-in menu (admin GET only), read-only."""
+    return _freeze_json({
+        lang: {
+            "title": title,
+            "items": [
+                {"category_id": cid, "name": name, "price": price, "desc": desc, "tag": tag}
+                for (cid, price), (name, desc, tag) in zip(MENU_ITEMS, rows)
+            ],
+        }
+        for lang, (title, rows) in ((lang, get_menu(lang)) for lang in SUPPORTED_LANGS)
+    })
+
+
+@functools.lru_cache(maxsize=16)
+def _menu_columns(lang: str) -> Dict[str, Any]:
+    """Built-in menu for `lang` as parallel, pre-normalized columns (MENU_ITEMS zipped with get_menu(lang)).
+
+    category_id is dictionary-encoded: `categories` holds the distinct ids in first-seen order and
+    `category_idx` the per-item index into it; tag strings are interned (a handful of distinct values).
+    """
+    rows = get_menu(lang)[1]
+    cols: Dict[str, Any] = {
+        "name": tuple(name.strip() for name, _, _ in rows),
+        "price": tuple(price.strip() for _, price in MENU_ITEMS),
+        "desc": tuple(desc.strip() for _, desc, _ in rows),
+        "tag": tuple(sys.intern(tag.strip()) for _, _, tag in rows),
+    }
+    cats = [cid.strip().lower() or "menu" for cid, _ in MENU_ITEMS]
+    cols["categories"] = tuple(dict.fromkeys(cats))
+    pos = {c: i for i, c in enumerate(cols["categories"])}
+    cols["category_idx"] = array.array("H", (pos[c] for c in cats))
+    return cols
+
+
+# human-ish section titles (default built-in categories)
+_MENU_SECTION_TITLES = {
+    "chef": "Chef Specials",
+    "bites": "Bites",
+    "classics": "Classics",
+    "sweets": "Sweets",
+    "drinks": "Drinks",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _menu_category_views(lang: str) -> Dict[str, Tuple[Dict[str, str], ...]]:
+    """{category_id: named built-in items} for `lang`, in category order; grouped once per language."""
+    cols = _menu_columns(lang)
+    grouped: List[List[Dict[str, str]]] = [[] for _ in cols["categories"]]
+    for ci, name, price, desc, tag in zip(cols["category_idx"], cols["name"], cols["price"], cols["desc"], cols["tag"]):
+        if name:
+            grouped[ci].append({"name": name, "price": price, "desc": desc, "tag": tag})
+    return {cid: tuple(items) for cid, items in zip(cols["categories"], grouped)}
+
+
+def _menu_section_category(section: Dict[str, Any]) -> str:
+    """category_id a /menu.json section answers to: built-in id for default titles, else the slugged title."""
+    title = str(section.get("title") or "")
+    for cid, t in _MENU_SECTION_TITLES.items():
+        if t == title:
+            return cid
+    return re.sub(r"[^a-z0-9]+", "_", title.lower()).strip("_")
+
+
 def get_menu_for_lang(lang: str) -> Dict[str, Any]:
     """Return a normalized menu payload for a given language.
 
@@ -3953,7 +4535,7 @@ def get_menu_for_lang(lang: str) -> Dict[str, Any]:
       { "lang": "en", "title": "Menu", "sections": [ { "title": "...", "items": [...] }, ... ] }
 
     - Admin overrides (uploaded via /admin) are stored in MENU_FILE and win.
-    - Otherwise, we transform the built-in flat MENU[lang]["items"] into sections.
+    - Otherwise, we group the built-in items (MENU_ITEMS + get_menu(lang)) into sections.
     """
     global _MENU_OVERRIDE
     lang = norm_lang(lang)
@@ -3962,50 +4544,18 @@ def get_menu_for_lang(lang: str) -> Dict[str, Any]:
     if isinstance(_MENU_OVERRIDE, dict):
         m = _MENU_OVERRIDE.get(lang)
         if isinstance(m, dict) and isinstance(m.get("sections"), list) and m.get("sections"):
-            base_title = "Menu"
-            try:
-                base = MENU.get(lang, MENU.get("en", {}))
-                if isinstance(base, dict) and base.get("title"):
-                    base_title = str(base.get("title"))
-            except Exception:
-                pass
+            base_title = get_menu(lang)[0] or "Menu"
             meta = _MENU_OVERRIDE.get("_meta") if isinstance(_MENU_OVERRIDE, dict) else None
             return {"title": base_title, "sections": m.get("sections"), "meta": meta or {}}
 
-    # 2) Built-in fallback: group flat items into sections
-    base = MENU.get(lang, MENU.get("en", {}))
-    base_title = (base.get("title") if isinstance(base, dict) else None) or "Menu"
-    items = []
-    if isinstance(base, dict) and isinstance(base.get("items"), list):
-        items = base.get("items") or []
-
-    # human-ish section titles (default built-in categories)
-    title_map = {
-        "chef": "Chef Specials",
-        "bites": "Bites",
-        "classics": "Classics",
-        "sweets": "Sweets",
-        "drinks": "Drinks",
-    }
-
-    buckets: Dict[str, List[Dict[str, str]]] = {}
-    for it in items:
-        if not isinstance(it, dict):
-            continue
-        cid = str(it.get("category_id") or "menu").strip().lower() or "menu"
-        buckets.setdefault(cid, []).append({
-            "name": str(it.get("name") or "").strip(),
-            "price": str(it.get("price") or "").strip(),
-            "desc": str(it.get("desc") or "").strip(),
-            "tag": str(it.get("tag") or "").strip(),
-        })
+    # 2) Built-in fallback: one section per precomputed (lang, category) view
+    base_title = get_menu(lang)[0] or "Menu"
 
     sections = []
-    for cid, arr in buckets.items():
-        arr2 = [x for x in arr if x.get("name")]
-        if not arr2:
+    for cid, items in _menu_category_views(lang).items():
+        if not items:
             continue
-        sections.append({"title": title_map.get(cid, cid.replace("_", " ").title()), "items": arr2})
+        sections.append({"title": _MENU_SECTION_TITLES.get(cid, cid.replace("_", " ").title()), "items": list(items)})
 
     # stable-ish ordering for the default categories
     order_titles = ["Chef Specials", "Bites", "Classics", "Sweets", "Drinks", "Menu"]
@@ -4015,6 +4565,97 @@ def get_menu_for_lang(lang: str) -> Dict[str, Any]:
     return {"title": str(base_title), "sections": sections, "meta": meta or {"version": 0, "updated_at": ""}}
 
 
+# Serialized (and precompressed) /menu.json bodies keyed by (lang, content-encoding, category).
+# The menu only changes via the admin menu endpoints, which call _menu_cache_clear
+# after replacing _MENU_OVERRIDE.
+_MENU_JSON_CACHE: Dict[Tuple[str, str, str], bytes] = {}
+_MENU_ETAG_CACHE: Dict[Tuple[str, str, str], str] = {}
+# category_ids the current menu has per lang; only these are accepted (and cached) as ?category=
+_MENU_CATEGORY_CACHE: Dict[str, frozenset] = {}
+# Pre-rendered /menu.json files written by build_static.py for a front proxy (kept out of static/).
+# They are deleted whenever the menu changes, so the proxy falls through to Flask from then on.
+MENU_PRERENDER_DIR = os.environ.get("MENU_PRERENDER_DIR", os.path.join(_BASE_DIR, "prerender"))
+
+
+def _menu_prerender_clear() -> None:
+    try:
+        names = os.listdir(MENU_PRERENDER_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith("menu.") and ".json" in name:
+            try:
+                os.remove(os.path.join(MENU_PRERENDER_DIR, name))
+            except OSError:
+                pass
+
+
+def _menu_cache_clear() -> None:
+    _MENU_JSON_CACHE.clear()
+    _MENU_ETAG_CACHE.clear()
+    _MENU_CATEGORY_CACHE.clear()
+    _menu_prerender_clear()
+
+
+def _menu_categories(lang: str) -> frozenset:
+    cats = _MENU_CATEGORY_CACHE.get(lang)
+    if cats is None:
+        sections = (get_menu_for_lang(lang) or {}).get("sections", [])
+        cats = frozenset(_menu_section_category(sec) for sec in sections if isinstance(sec, dict))
+        _MENU_CATEGORY_CACHE[lang] = cats
+    return cats
+
+
+def _menu_json_bytes(lang: str, encoding: str = "", category: str = "") -> bytes:
+    """/menu.json body for `lang`; encoding is "" (identity), "gzip" or "br".
+
+    A non-empty `category` keeps only the sections for that category_id.
+    """
+    key = (lang, encoding, category)
+    raw = _MENU_JSON_CACHE.get(key)
+    if raw is not None:
+        return raw
+    if encoding == "br":
+        raw = brotli.compress(_menu_json_bytes(lang, "", category), quality=11)
+    elif encoding == "gzip":
+        raw = gzip.compress(_menu_json_bytes(lang, "", category), compresslevel=9, mtime=0)
+    else:
+        payload = get_menu_for_lang(lang) or {}
+        sections = payload.get("sections", [])
+        if category:
+            sections = [sec for sec in sections if isinstance(sec, dict) and _menu_section_category(sec) == category]
+        raw = app.json.response({
+            "lang": lang,
+            "title": payload.get("title", "Menu"),
+            "sections": sections,
+        }).get_data()
+    _MENU_JSON_CACHE[key] = raw
+    return raw
+
+
+def _menu_etag(lang: str, encoding: str = "", category: str = "") -> str:
+    """Strong ETag (content hash, unquoted) of the cached /menu.json body for (lang, encoding, category)."""
+    key = (lang, encoding, category)
+    tag = _MENU_ETAG_CACHE.get(key)
+    if tag is None:
+        tag = hashlib.blake2b(_menu_json_bytes(lang, encoding, category), digest_size=8).hexdigest()
+        _MENU_ETAG_CACHE[key] = tag
+    return tag
+
+
+def _pick_static_encoding() -> str:
+    """Best precompressed encoding the client accepts ("br" > "gzip" > identity)."""
+    try:
+        accepted = request.accept_encodings
+        if brotli is not None and accepted["br"]:
+            return "br"
+        if accepted["gzip"]:
+            return "gzip"
+    except Exception:
+        pass
+    return ""
+
+
 
 # ============================================================
 # World Cup 2026 schedule data
@@ -4029,11 +4670,12 @@ FIXTURE_FEED_URL = os.environ.get(
 # Location label used by the feed for Dallas/Arlington matches.
 # (Verified in the fixture feed as "Dallas Stadium".)
 DALLAS_LOCATION_KEYWORDS = ["dallas stadium", "arlington", "at&t"]
+_DALLAS_RE = re.compile("|".join(map(re.escape, DALLAS_LOCATION_KEYWORDS)), re.IGNORECASE)
 
 # If the remote feed is empty/unavailable (e.g., schedule not published yet),
 # we serve a small premium "demo" dataset so the Schedule UI never goes blank.
 # As soon as the feed returns real matches, the app automatically switches to it.
-DEMO_FIXTURES_RAW: List[Dict[str, Any]] = [
+DEMO_FIXTURES_RAW: Tuple[Dict[str, Any], ...] = (
     {
         "MatchNumber": 1,
         "RoundNumber": 1,
@@ -4082,60 +4724,130 @@ DEMO_FIXTURES_RAW: List[Dict[str, Any]] = [
         "AwayTeamScore": None,
         "Status": "Scheduled",
     },
-]
+)
 
 # In-memory cache (plus optional disk cache) so we don't hit the feed too often.
-_fixtures_cache: Dict[str, Any] = {"loaded_at": 0, "matches": [], "source": "empty", "last_error": None}
+_fixtures_cache: Dict[str, Any] = {"loaded_at": 0, "matches": [], "source": "empty", "last_error": None,
+                                   "etag": "", "last_modified": "", "raw": None}
 FIXTURE_CACHE_SECONDS = int(os.environ.get("FIXTURE_CACHE_SECONDS", str(6 * 60 * 60)))  # 6h
-FIXTURE_CACHE_FILE = os.environ.get("FIXTURE_CACHE_FILE", "/tmp/wc26_{venue}_fixtures.json")
+FIXTURE_CACHE_FILE = os.environ.get("FIXTURE_CACHE_FILE", "/tmp/wc26_{venue}_fixtures.json.gz")
+# Past FIXTURE_CACHE_SECONDS (and up to this age) the cached matches are still served while one
+# background fetch refreshes them; only a cold or older cache makes the request wait on the feed.
+FIXTURE_STALE_SECONDS = int(os.environ.get("FIXTURE_STALE_SECONDS", str(24 * 60 * 60)))  # 24h
+_FIXTURE_REFRESH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wc26-fixtures")
+_FIXTURE_REFRESHING = threading.Event()
+_FIXTURE_REFRESH_LOCK = threading.Lock()
+
+
+def _refresh_fixtures_bg() -> None:
+    try:
+        load_all_matches(force=True)
+    except Exception:
+        pass
+    finally:
+        _FIXTURE_REFRESHING.clear()
+
+
+def _schedule_fixture_refresh() -> None:
+    """Start one background fixture fetch unless one is already running."""
+    with _FIXTURE_REFRESH_LOCK:
+        if _FIXTURE_REFRESHING.is_set():
+            return
+        _FIXTURE_REFRESHING.set()
+    try:
+        _FIXTURE_REFRESH_POOL.submit(_refresh_fixtures_bg)
+    except Exception:
+        _FIXTURE_REFRESHING.clear()
 POLL_STORE_FILE = os.environ.get("POLL_STORE_FILE", "/tmp/wc26_{venue}_poll_votes.json")
+# Append-only vote log used instead of POLL_STORE_FILE when Redis is off (one JSON line per vote).
+POLL_VOTES_JSONL = os.environ.get("POLL_VOTES_JSONL", "/tmp/wc26_{venue}_poll_votes.jsonl")
+
+
+_FIXTURE_SESSION = None
+_FIXTURE_SESSION_LOCK = threading.Lock()
+
+
+def _fixture_session():
+    """Shared keep-alive session for the fixture feed (None when `requests` is unavailable)."""
+    global _FIXTURE_SESSION
+    if requests is None:
+        return None
+    if _FIXTURE_SESSION is None:
+        with _FIXTURE_SESSION_LOCK:
+            if _FIXTURE_SESSION is None:
+                sess = requests.Session()
+                sess.headers.update({"User-Agent": "worldcup-concierge/1.0", "Accept-Encoding": "gzip"})
+                try:
+                    from requests.adapters import HTTPAdapter  # type: ignore
+                    # Small pool (one feed host). No adapter-level retries: _fetch_fixture_feed's
+                    # attempt loop is the only retry layer (at most 3 GETs per fetch).
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+                    sess.mount("https://", adapter)
+                    sess.mount("http://", adapter)
+                except Exception:
+                    pass
+                _FIXTURE_SESSION = sess
+    return _FIXTURE_SESSION
+
+
+def _fixture_http_get(headers: Dict[str, str]) -> Tuple[int, bytes, str, str]:
+    """GET FIXTURE_FEED_URL (gzip, keep-alive) -> (status, body, etag, last_modified); 304 is not an error."""
+    sess = _fixture_session()
+    if sess is not None:
+        r = sess.get(FIXTURE_FEED_URL, headers=headers, timeout=(3, 10))
+        if r.status_code == 304:
+            return 304, b"", "", ""
+        r.raise_for_status()
+        return r.status_code, r.content, r.headers.get("ETag") or "", r.headers.get("Last-Modified") or ""
+
+    req = urllib.request.Request(FIXTURE_FEED_URL, headers={**headers, "Accept-Encoding": "gzip"}, method="GET")
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            body = resp.read()
+            if (resp.headers.get("Content-Encoding") or "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return resp.status, body, resp.headers.get("ETag") or "", resp.headers.get("Last-Modified") or ""
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, b"", "", ""
+        raise
 
 
 def _safe_read_json_file(path: str, default: Any = None) -> Any:
     """Read JSON from Redis (if enabled) or disk safely."""
     # BUG FIX: Lookup Redis key BEFORE expanding {venue} placeholder
     # The _REDIS_PATH_KEY_MAP uses template paths with {venue}
-    original_path = str(path)
+    original_path = path if isinstance(path, str) else str(path)
+    vid = _venue_id()
     try:
-        vid = _venue_id()
         # Check Redis using the TEMPLATE path (with {venue})
         if _REDIS_ENABLED:
-            suffix = _REDIS_PATH_KEY_MAP.get(original_path)
-            if suffix:
-                full_key = f"{_REDIS_NS}:{vid}:{suffix}"
+            full_key = _redis_file_key(original_path, vid)
+            if full_key:
                 return _redis_get_json(full_key, default=default)
     except Exception:
         pass
 
     # Expand {venue} for disk fallback
-    try:
-        vid = _venue_id()
-        if '{venue}' in str(path):
-            path = str(path).replace('{venue}', vid)
-    except Exception:
-        pass
+    path = original_path.replace('{venue}', vid) if '{venue}' in original_path else original_path
 
     try:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+        return _read_cache_file(path)
     except Exception:
         return default
-    return default
 
 def _safe_write_json_file(path: str, payload: Any) -> None:
     global _REDIS_FALLBACK_USED, _REDIS_FALLBACK_LAST_PATH
     """Write JSON to Redis (if enabled) or disk safely."""
     # BUG FIX: Lookup Redis key BEFORE expanding {venue} placeholder
     # The _REDIS_PATH_KEY_MAP uses template paths with {venue}
-    original_path = str(path)
+    original_path = path if isinstance(path, str) else str(path)
+    vid = _venue_id()
     try:
-        vid = _venue_id()
         # Check Redis using the TEMPLATE path (with {venue})
         if _REDIS_ENABLED:
-            suffix = _REDIS_PATH_KEY_MAP.get(original_path)
-            if suffix:
-                full_key = f"{_REDIS_NS}:{_venue_id()}:{suffix}"
+            full_key = _redis_file_key(original_path, vid)
+            if full_key:
                 ok = _redis_set_json(full_key, payload)
                 if ok:
                     return
@@ -4152,17 +4864,21 @@ def _safe_write_json_file(path: str, payload: Any) -> None:
 
 
     # Expand {venue} for disk fallback
-    try:
-        vid = _venue_id()
-        if '{venue}' in str(path):
-            path = str(path).replace('{venue}', vid)
-    except Exception:
-        pass
+    path = original_path.replace('{venue}', vid) if '{venue}' in original_path else original_path
 
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False)
+        if path.endswith(".msgpack") and msgpack is not None:
+            try:
+                _write_bytes_file(path, msgpack.packb(payload, use_bin_type=True))
+                return
+            except Exception:
+                pass  # not msgpack-encodable: fall through to JSON
+        if path.endswith(".gz"):
+            # Compressed cache files (e.g. fixtures): fast level, readers detect gzip by magic bytes
+            _write_bytes_file(path, gzip.compress(_dumps_json_compact(payload), compresslevel=1))
+            return
+        # orjson bytes (stdlib fallback) straight to disk: no str encode / text-mode writer
+        _write_bytes_file(path, _dumps_json_compact(payload))
     except Exception:
         pass
 
@@ -4181,32 +4897,45 @@ def _fetch_fixture_feed() -> List[Dict[str, Any]]:
         ...
       }
     """
-    import urllib.request
 
-    req = urllib.request.Request(
-        FIXTURE_FEED_URL,
-        headers={"User-Agent": "worldcup-concierge/1.0"},
-        method="GET",
-    )
-    # Network can be slow/unreliable on some hosts. Use a safer timeout + small retry.
+    headers = {"User-Agent": "worldcup-concierge/1.0"}
+    # Conditional GET: only when we still hold the last raw payload to fall back to on 304.
+    cached_raw = _fixtures_cache.get("raw")
+    if isinstance(cached_raw, list):
+        if _fixtures_cache.get("etag"):
+            headers["If-None-Match"] = _fixtures_cache["etag"]
+        if _fixtures_cache.get("last_modified"):
+            headers["If-Modified-Since"] = _fixtures_cache["last_modified"]
+    # Network can be slow/unreliable on some hosts. Use a safer timeout + small retry
+    # (retries reuse the pooled keep-alive connection when `requests` is available).
     last_err = None
     for _attempt in range(3):
         try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
+            status, body, etag, last_modified = _fixture_http_get(headers)
+            if status == 304 and not isinstance(cached_raw, list):
+                raise ValueError("Fixture feed returned 304 without a cached payload")
             last_err = None
             break
         except Exception as _e:
             last_err = _e
     if last_err is not None:
         raise last_err
+    if status == 304:
+        # Unchanged upstream: skip download + parse, re-normalize the payload we already have
+        return cached_raw
 
-    payload = json.loads(raw)
+    payload = json.loads(body.decode("utf-8", errors="replace"))
     if not isinstance(payload, list):
         raise ValueError("Fixture feed response was not a list")
+    _fixtures_cache["raw"] = payload
+    _fixtures_cache["etag"] = etag
+    _fixtures_cache["last_modified"] = last_modified
     return payload
 
 
+_AMPM = ("AM", "PM")
+
+
 def _fmt_time_12h(dt_utc: datetime) -> str:
     """Return a friendly 12-hour local-time string like '7:00 PM'.
 
@@ -4216,8 +4945,9 @@ def _fmt_time_12h(dt_utc: datetime) -> str:
     - Uses a cross-platform formatter (Windows doesn't support %-I).
     """
     local_dt = dt_utc.astimezone()  # local tz on host
-    # %I gives zero-padded hour; strip leading 0 for '7:00 PM'
-    return local_dt.strftime("%I:%M %p").lstrip("0")
+    # Same output as strftime("%I:%M %p").lstrip("0"), without format parsing or locale lookups
+    h = local_dt.hour
+    return f"{h % 12 or 12}:{local_dt.minute:02d} {_AMPM[h >= 12]}"
 
 
 def _parse_dateutc(date_utc_str: str) -> Optional[datetime]:
@@ -4228,19 +4958,19 @@ def _parse_dateutc(date_utc_str: str) -> Optional[datetime]:
         s = (date_utc_str or "").strip()
         if not s:
             return None
-        # Normalize to ISO-ish for fromisoformat by removing Z
-        if s.endswith("Z"):
-            s2 = s[:-1].replace(" ", "T")
-            dt = datetime.fromisoformat(s2)
-            return dt.replace(tzinfo=timezone.utc)
-        # fallback
-        s2 = s.replace(" ", "T")
-        dt = datetime.fromisoformat(s2)
-        return dt.replace(tzinfo=timezone.utc)
+        # fromisoformat accepts any date/time separator (' ' or 'T'); only the Z suffix needs dropping.
+        if s[-1] == "Z":
+            s = s[:-1]
+        return datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
     except Exception:
         return None
 
 
+def _feed_str(v: Any) -> str:
+    """Feed text field: strings pass through untouched; other truthy values are str()-ed, falsy ones become ""."""
+    return v if type(v) is str else (str(v) if v else "")
+
+
 def load_all_matches(force: bool = False) -> List[Dict[str, Any]]:
     """
     Returns a normalized list of matches.
@@ -4259,16 +4989,23 @@ def load_all_matches(force: bool = False) -> List[Dict[str, Any]]:
       }
     """
     now = int(time.time())
-    if not force and _fixtures_cache["matches"] and (now - int(_fixtures_cache["loaded_at"] or 0) < FIXTURE_CACHE_SECONDS):
-        return _fixtures_cache["matches"]
+    if not force and _fixtures_cache["matches"]:
+        age = now - int(_fixtures_cache["loaded_at"] or 0)
+        if age < FIXTURE_CACHE_SECONDS:
+            return _fixtures_cache["matches"]
+        if age < FIXTURE_STALE_SECONDS:
+            _schedule_fixture_refresh()
+            return _fixtures_cache["matches"]
 
     # Try disk cache first (fast + survives restarts)
     disk = _safe_read_json_file(FIXTURE_CACHE_FILE)
     if disk and isinstance(disk, dict) and isinstance(disk.get("matches"), list):
         loaded_at = int(disk.get("loaded_at") or 0)
-        if not force and loaded_at and (now - loaded_at < FIXTURE_CACHE_SECONDS):
+        if not force and loaded_at and (now - loaded_at < FIXTURE_STALE_SECONDS):
             _fixtures_cache["loaded_at"] = loaded_at
             _fixtures_cache["matches"] = disk["matches"]
+            if now - loaded_at >= FIXTURE_CACHE_SECONDS:
+                _schedule_fixture_refresh()
             return _fixtures_cache["matches"]
 
     # Fetch fresh (but fall back to any cache if the network times out)
@@ -4301,44 +5038,61 @@ def load_all_matches(force: bool = False) -> List[Dict[str, Any]]:
         raw_matches = list(DEMO_FIXTURES_RAW)
         _fixtures_cache["source"] = "demo"
     norm: List[Dict[str, Any]] = []
+
+    # Scores (best-effort; feed includes finals once matches are completed)
+    def _to_int(x):
+        if type(x) is int:
+            return x  # JSON feeds send scores as numbers; skip the str/float round-trip
+        try:
+            if x is None or x == "":
+                return None
+            return int(float(str(x).strip()))
+        except Exception:
+            return None
+
+    # Loop invariants: one clock read per load; a match is "live" for 2h30 after kickoff.
+    nowu = datetime.now(timezone.utc)
+    live_window = timedelta(hours=2, minutes=30)
+    append = norm.append
     for m in raw_matches:
-        dt = _parse_dateutc(m.get("DateUtc") or "")
+        g = m.get
+        date_utc = g("DateUtc") or ""
+        dt = _parse_dateutc(date_utc)
         if not dt:
             continue
+        if len(date_utc) == 20 and date_utc[10] in "T " and date_utc[19] == "Z":
+            # Canonical feed value ("YYYY-MM-DD HH:MM:SSZ"): slice instead of re-formatting dt
+            day = date_utc[:10]
+            stamp = f"{day}T{date_utc[11:19]}Z"
+        else:
+            day = dt.date().isoformat()
+            stamp = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        match_num = int(m.get("MatchNumber") or 0) or None
+        match_num = int(g("MatchNumber") or 0) or None
         match_id = f"wc-{match_num:03d}" if match_num else f"wc-{len(norm)+1:03d}"
-        # Scores (best-effort; feed includes finals once matches are completed)
-        def _to_int(x):
-            try:
-                if x is None or x == "":
-                    return None
-                return int(float(str(x).strip()))
-            except Exception:
-                return None
 
-        hs = _to_int(m.get("HomeTeamScore") if "HomeTeamScore" in m else m.get("HomeScore"))
-        as_ = _to_int(m.get("AwayTeamScore") if "AwayTeamScore" in m else m.get("AwayScore"))
+        hs = _to_int(g("HomeTeamScore") if "HomeTeamScore" in m else g("HomeScore"))
+        as_ = _to_int(g("AwayTeamScore") if "AwayTeamScore" in m else g("AwayScore"))
 
         # Status (UI hints; true "live" requires a live data provider)
-        nowu = datetime.now(timezone.utc)
-        kickoff = dt.replace(tzinfo=timezone.utc)
+        # (_parse_dateutc already returns UTC-aware datetimes)
+        ends = dt + live_window
         status = "upcoming"
-        if nowu >= kickoff and nowu <= (kickoff + timedelta(hours=2, minutes=30)):
+        if dt <= nowu <= ends:
             status = "live"
-        if nowu > (kickoff + timedelta(hours=2, minutes=30)) and (hs is not None or as_ is not None):
+        if nowu > ends and (hs is not None or as_ is not None):
             status = "finished"
 
-        norm.append({
+        append({
             "id": match_id,
             "match_number": match_num,
-            "stage": (m.get("Group") or "").strip() or "Match",
-            "date": dt.date().isoformat(),
+            "stage": _feed_str(g("Group")).strip() or "Match",
+            "date": day,
             "time": _fmt_time_12h(dt),
-            "datetime_utc": dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "venue": (m.get("Location") or "").strip(),
-            "home": (m.get("HomeTeam") or "").strip(),
-            "away": (m.get("AwayTeam") or "").strip(),
+            "datetime_utc": stamp,
+            "venue": _feed_str(g("Location")).strip(),
+            "home": _feed_str(g("HomeTeam")).strip(),
+            "away": _feed_str(g("AwayTeam")).strip(),
             "home_score": hs,
             "away_score": as_,
             "status": status,
@@ -4357,306 +5111,69 @@ def load_all_matches(force: bool = False) -> List[Dict[str, Any]]:
 
 
 def is_dallas_match(m: Dict[str, Any]) -> bool:
-    v = (m.get("venue") or "").lower()
-    return any(k in v for k in DALLAS_LOCATION_KEYWORDS)
+    return _DALLAS_RE.search(m.get("venue") or "") is not None
+
+
+# (fixtures list, lowercased "home\0away\0venue\0stage\0date" per match) for filter_matches().
+_MATCH_SEARCH_INDEX: Tuple[Any, List[str]] = (None, [])
+_MATCH_SEARCH_FIELDS = ("home", "away", "venue", "stage", "date")
+
+
+def _match_search_index(matches: List[Dict[str, Any]]) -> List[str]:
+    """Per-match search text, lowercased once per fixtures list (rebuilt when load_all_matches() reloads)."""
+    global _MATCH_SEARCH_INDEX
+    src, hay = _MATCH_SEARCH_INDEX
+    if src is not matches:
+        hay = ["\0".join(str(m.get(k) or "").lower() for k in _MATCH_SEARCH_FIELDS) for m in matches]
+        _MATCH_SEARCH_INDEX = (matches, hay)
+    return hay
 
 
 def filter_matches(scope: str, q: str = "") -> List[Dict[str, Any]]:
     scope = (scope or "all").lower().strip()
-    q = (q or "").strip().lower()
+    q = (q or "").replace("\0", "").strip().lower()
 
     matches = load_all_matches()
+    if q:
+        # One substring test per match against the prebuilt text (fields are NUL-separated,
+        # so a hit is always inside a single field, as before).
+        matches = [m for m, h in zip(matches, _match_search_index(matches)) if q in h]
     if scope != "all":
         matches = [m for m in matches if is_dallas_match(m)]
 
-    if q:
-        def hit(m):
-            return (q in (m.get("home","").lower())
-                    or q in (m.get("away","").lower())
-                    or q in (m.get("venue","").lower())
-                    or q in (m.get("stage","").lower())
-                    or q in (m.get("date","").lower()))
-        matches = [m for m in matches if hit(m)]
-
     return matches
 
 
 # ============================================================
 # Menu (4 languages) — edit/add items here
 # ============================================================
-MENU = {
-    "en": {
-        "title": "Menu",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Chef’s Wagyu Sliders",
-                "price": "$24",
-                "desc": "A5-style sear, truffle aioli, brioche. Limited matchday batch.",
-                "tag": "Chef Special"
-            },
-            {
-                "category_id": "chef",
-                "name": "Citrus Ceviche Bowl",
-                "price": "$19",
-                "desc": "Fresh catch, lime, chili, avocado, crunchy tostadas.",
-                "tag": "Chef Special"
-            },
-            {
-                "category_id": "bites",
-                "name": "Stadium Nachos XL",
-                "price": "$16",
-                "desc": "Three-cheese blend, jalapeño, pico, crema, choice of protein.",
-                "tag": "Share"
-            },
-            {
-                "category_id": "bites",
-                "name": "Peri-Peri Wings (8/16)",
-                "price": "$14/$24",
-                "desc": "Crispy wings, peri-peri glaze, citrus salt.",
-                "tag": "Hot"
-            },
-            {
-                "category_id": "classics",
-                "name": "Concierge Burger",
-                "price": "$18",
-                "desc": "Angus, cheddar, lettuce, tomato, house sauce, fries.",
-                "tag": "Classic"
-            },
-            {
-                "category_id": "classics",
-                "name": "Spicy Chicken Sandwich",
-                "price": "$16",
-                "desc": "Crispy chicken, spicy sauce, pickles, fries optional.",
-                "tag": "Fan Favorite"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Gold Medal Churros",
-                "price": "$10",
-                "desc": "Cinnamon sugar, chocolate dip.",
-                "tag": "Sweet"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Matchday Mocktail",
-                "price": "$9",
-                "desc": "Citrus, mint, sparkling finish.",
-                "tag": "Zero Proof"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Premium Espresso",
-                "price": "$5",
-                "desc": "Double shot, smooth crema.",
-                "tag": "Coffee"
-            }
-        ]
-    },
-    "es": {
-        "title": "Menú",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Mini hamburguesas Wagyu del Chef",
-                "price": "$24",
-                "desc": "Sellado estilo A5, alioli de trufa, brioche. Lote limitado.",
-                "tag": "Especial del Chef"
-            },
-            {
-                "category_id": "chef",
-                "name": "Bowl de Ceviche Cítrico",
-                "price": "$19",
-                "desc": "Pesca fresca, lima, chile, aguacate, tostadas.",
-                "tag": "Especial del Chef"
-            },
-            {
-                "category_id": "bites",
-                "name": "Nachos XL del Estadio",
-                "price": "$16",
-                "desc": "Tres quesos, jalapeño, pico, crema, proteína a elección.",
-                "tag": "Para compartir"
-            },
-            {
-                "category_id": "bites",
-                "name": "Alitas Peri-Peri (8/16)",
-                "price": "$14/$24",
-                "desc": "Alitas crujientes, glaseado peri-peri, sal cítrica.",
-                "tag": "Picante"
-            },
-            {
-                "category_id": "classics",
-                "name": "Hamburguesa Concierge",
-                "price": "$18",
-                "desc": "Angus, cheddar, lechuga, tomate, salsa de la casa, papas.",
-                "tag": "Clásico"
-            },
-            {
-                "category_id": "classics",
-                "name": "Sándwich de Pollo Picante",
-                "price": "$16",
-                "desc": "Pollo crujiente, salsa picante, pepinillos, papas opcionales.",
-                "tag": "Favorito"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Churros Medalla de Oro",
-                "price": "$10",
-                "desc": "Azúcar y canela, dip de chocolate.",
-                "tag": "Dulce"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Mocktail de Partido",
-                "price": "$9",
-                "desc": "Cítricos, menta, final espumoso.",
-                "tag": "Sin alcohol"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Espresso Premium",
-                "price": "$5",
-                "desc": "Doble shot, crema suave.",
-                "tag": "Café"
-            }
-        ]
-    },
-    "pt": {
-        "title": "Cardápio",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Mini Burgers Wagyu do Chef",
-                "price": "$24",
-                "desc": "Selagem estilo A5, aioli de trufa, brioche. Lote limitado.",
-                "tag": "Especial do Chef"
-            },
-            {
-                "category_id": "chef",
-                "name": "Bowl de Ceviche Cítrico",
-                "price": "$19",
-                "desc": "Peixe fresco, limão, pimenta, abacate, tostadas.",
-                "tag": "Especial do Chef"
-            },
-            {
-                "category_id": "bites",
-                "name": "Nachos XL do Estádio",
-                "price": "$16",
-                "desc": "Três queijos, jalapeño, pico, creme, proteína à escolha.",
-                "tag": "Compartilhar"
-            },
-            {
-                "category_id": "bites",
-                "name": "Asinhas Peri-Peri (8/16)",
-                "price": "$14/$24",
-                "desc": "Asinhas crocantes, glaze peri-peri, sal cítrico.",
-                "tag": "Picante"
-            },
-            {
-                "category_id": "classics",
-                "name": "Burger Concierge",
-                "price": "$18",
-                "desc": "Angus, cheddar, alface, tomate, molho da casa, fritas.",
-                "tag": "Clássico"
-            },
-            {
-                "category_id": "classics",
-                "name": "Sanduíche de Frango Picante",
-                "price": "$16",
-                "desc": "Frango crocante, molho picante, picles, fritas opcionais.",
-                "tag": "Favorito"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Churros Medalha de Ouro",
-                "price": "$10",
-                "desc": "Canela e açúcar, molho de chocolate.",
-                "tag": "Doce"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Mocktail de Jogo",
-                "price": "$9",
-                "desc": "Cítricos, hortelã, final com gás.",
-                "tag": "Sem álcool"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Espresso Premium",
-                "price": "$5",
-                "desc": "Dose dupla, crema suave.",
-                "tag": "Café"
-            }
-        ]
-    },
-    "fr": {
-        "title": "Menu",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Mini-burgers Wagyu du Chef",
-                "price": "$24",
-                "desc": "Saisie style A5, aïoli à la truffe, brioche. Série limitée.",
-                "tag": "Spécialité du Chef"
-            },
-            {
-                "category_id": "chef",
-                "name": "Bol de Ceviche aux Agrumes",
-                "price": "$19",
-                "desc": "Poisson frais, citron vert, piment, avocat, tostadas.",
-                "tag": "Spécialité du Chef"
-            },
-            {
-                "category_id": "bites",
-                "name": "Nachos XL du Stade",
-                "price": "$16",
-                "desc": "Trois fromages, jalapeño, pico, crème, protéine au choix.",
-                "tag": "À partager"
-            },
-            {
-                "category_id": "bites",
-                "name": "Ailes Peri-Peri (8/16)",
-                "price": "$14/$24",
-                "desc": "Ailes croustillantes, glaçage peri-peri, sel aux agrumes.",
-                "tag": "Épicé"
-            },
-            {
-                "category_id": "classics",
-                "name": "Burger Concierge",
-                "price": "$18",
-                "desc": "Angus, cheddar, salade, tomate, sauce maison, frites.",
-                "tag": "Classique"
-            },
-            {
-                "category_id": "classics",
-                "name": "Sandwich Poulet Épicé",
-                "price": "$16",
-                "desc": "Poulet croustillant, sauce épicée, pickles, frites en option.",
-                "tag": "Favori"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Churros Médaille d’Or",
-                "price": "$10",
-                "desc": "Cannelle-sucre, sauce chocolat.",
-                "tag": "Sucré"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Mocktail de Match",
-                "price": "$9",
-                "desc": "Agrumes, menthe, touche pétillante.",
-                "tag": "Sans alcool"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Espresso Premium",
-                "price": "$5",
-                "desc": "Double, crème onctueuse.",
-                "tag": "Café"
-            }
-        ]
-    }
+# Shared item schema: (category_id, price) per built-in item, identical in every language.
+MENU_ITEMS = (
+    ("chef", "$24"),
+    ("chef", "$19"),
+    ("bites", "$16"),
+    ("bites", "$14/$24"),
+    ("classics", "$18"),
+    ("classics", "$16"),
+    ("sweets", "$10"),
+    ("drinks", "$9"),
+    ("drinks", "$5"),
+)
+
+# Localized side table: lang -> (title, ((name, desc, tag), ...)) aligned with MENU_ITEMS.
+# Only English lives here; other languages are read from I18N_DIR on first use (get_menu).
+MENU_I18N = {
+    "en": ("Menu", (
+        ("Chef’s Wagyu Sliders", "A5-style sear, truffle aioli, brioche. Limited matchday batch.", "Chef Special"),
+        ("Citrus Ceviche Bowl", "Fresh catch, lime, chili, avocado, crunchy tostadas.", "Chef Special"),
+        ("Stadium Nachos XL", "Three-cheese blend, jalapeño, pico, crema, choice of protein.", "Share"),
+        ("Peri-Peri Wings (8/16)", "Crispy wings, peri-peri glaze, citrus salt.", "Hot"),
+        ("Concierge Burger", "Angus, cheddar, lettuce, tomato, house sauce, fries.", "Classic"),
+        ("Spicy Chicken Sandwich", "Crispy chicken, spicy sauce, pickles, fries optional.", "Fan Favorite"),
+        ("Gold Medal Churros", "Cinnamon sugar, chocolate dip.", "Sweet"),
+        ("Matchday Mocktail", "Citrus, mint, sparkling finish.", "Zero Proof"),
+        ("Premium Espresso", "Double shot, smooth crema.", "Coffee"),
+    )),
 }
 
 # ============================================================
@@ -4676,118 +5193,161 @@ LANG = {
         "rule_party": "⚠️ That party size is above our limit. Please call the business to confirm a larger group.",
         "rule_closed": "⚠️ We’re closed on that date. Want the next available day?",
     },
-    "es": {
-        "welcome": "⚽ ¡Bienvenido, fan del Mundial! Soy tu concierge de días de partido en Dallas.\nEscribe reserva para reservar una mesa, o pregunta por los partidos (Dallas / todos) o el menú.",
-        "ask_date": "¿Qué fecha te gustaría? (Ejemplo: 23 de junio de 2026)\n\n(También puedes escribir: “Recordar reserva”)",
-        "ask_time": "¿A qué hora te gustaría?",
-        "ask_party": "¿Cuántas personas serán?",
-        "ask_name": "¿A nombre de quién será la reserva?",
-        "ask_phone": "¿Qué número de teléfono debemos usar?",
-        "recall_title": "📌 Reserva hasta ahora:",
-        "recall_empty": "Aún no hay detalles. Escribe “reserva” para comenzar.",
-        "saved": "✅ ¡Reserva guardada!",
-        "rule_party": "⚠️ Ese tamaño de grupo supera nuestro límite. Llama al negocio para confirmar un grupo grande.",
-        "rule_closed": "⚠️ Estamos cerrados ese día. ¿Quieres el siguiente día disponible?",
-    },
-    "pt": {
-        "welcome": "⚽ Bem-vindo, fã da Copa do Mundo! Sou seu concierge de dias de jogo em Dallas.\nDigite reserva para reservar uma mesa, ou pergunte sobre jogos em Dallas, todos os jogos ou o cardápio.",
-        "ask_date": "Qual data você gostaria? (Exemplo: 23 de junho de 2026)\n\n(Você também pode digitar: “Relembrar reserva”)",
-        "ask_time": "Que horas você gostaria?",
-        "ask_party": "Quantas pessoas?",
-        "ask_name": "Em qual nome devemos colocar a reserva?",
-        "ask_phone": "Qual número de telefone devemos usar?",
-        "recall_title": "📌 Reserva até agora:",
-        "recall_empty": "Ainda não há detalhes. Digite “reserva” para começar.",
-        "saved": "✅ Reserva salva!",
-        "rule_party": "⚠️ Esse tamanho de grupo excede o limite. Ligue para confirmar um grupo maior.",
-        "rule_closed": "⚠️ Estaremos fechados nessa data. Quer o próximo dia disponível?",
-    },
-    "fr": {
-        "welcome": "⚽ Bienvenue, fan de la Coupe du Monde ! Je suis votre concierge des jours de match à Dallas.\nTapez réservation pour réserver une table, ou demandez les matchs (Dallas / tous) ou le menu.",
-        "ask_date": "Quelle date souhaitez-vous ? (Exemple : 23 juin 2026)\n\n(Vous pouvez aussi écrire : « Rappeler la réservation »)",
-        "ask_time": "À quelle heure ?",
-        "ask_party": "Pour combien de personnes ?",
-        "ask_name": "Au nom de qui ?",
-        "ask_phone": "Quel numéro de téléphone devons-nous utiliser ?",
-        "recall_title": "📌 Réservation jusqu’ici :",
-        "recall_empty": "Aucun détail pour l’instant. Dites « réservation » pour commencer.",
-        "saved": "✅ Réservation enregistrée !",
-        "rule_party": "⚠️ Ce nombre dépasse notre limite. Veuillez appeler pour un grand groupe.",
-        "rule_closed": "⚠️ Nous sommes fermés ce jour-là. Voulez-vous le prochain jour disponible ?",
-    },
 }
 
+# Flat "<lang>.<key>" view of LANG: one hash probe per prompt instead of two.
+# Like LANG it starts English-only; get_strings() adds a language when it is first used.
+LANG_FLAT = {sys.intern(f"{l}.{k}"): sys.intern(v) for l, d in LANG.items() for k, v in d.items()}
+
+
+def get_strings(lang: str) -> Dict[str, str]:
+    """Prompt strings for `lang`, loading them on first use; English if the language has none."""
+    hit = LANG.get(lang)
+    if hit is None:
+        strings = _load_lang(lang).get("strings")
+        if not isinstance(strings, dict) or not strings:
+            return LANG["en"]
+        hit = {str(k): str(v) for k, v in strings.items()}
+        LANG_FLAT.update({sys.intern(f"{lang}.{k}"): sys.intern(v) for k, v in hit.items()})
+        LANG[lang] = hit
+    return hit
+
+
+def tr(lang: str, key: str) -> str:
+    """Prompt string `key` in `lang` (English fallback; KeyError for an unknown key)."""
+    try:
+        return LANG_FLAT[f"{lang}.{key}"]
+    except KeyError:
+        if lang in LANG:
+            raise
+    get_strings(lang)
+    return LANG_FLAT.get(f"{lang}.{key}") or LANG_FLAT[f"en.{key}"]
+
 SUPPORTED_LANGS = ["en", "es", "pt", "fr"]
 
 
+_LANG_PREFIX_ALIAS = {"sp": "es", "po": "pt", "fr": "fr"}
+
+
+@functools.lru_cache(maxsize=256)
 def norm_lang(lang: Optional[str]) -> str:
     if not lang:
         return "en"
     lang = lang.lower().strip()
     if lang in SUPPORTED_LANGS:
         return lang
-    # allow common aliases
-    if lang.startswith("sp"):
-        return "es"
-    if lang.startswith("po"):
-        return "pt"
-    if lang.startswith("fr"):
-        return "fr"
-    return "en"
+    # allow common aliases ("spanish", "portugues", "french", ...) by their 2-letter prefix
+    return _LANG_PREFIX_ALIAS.get(lang[:2], "en")
 
 
 # ============================================================
 # Rate limiting (in-memory per IP)
+# - Token bucket per IP: RATE_LIMIT_PER_MIN tokens of burst, refilled continuously at
+#   RATE_LIMIT_PER_MIN per minute (no 2x burst across a fixed-window boundary).
+# - Fixed-capacity slot table (power of two) indexed by hash(ip): bounded memory no matter
+#   how many distinct IPs (scanners) show up, and no per-request dict allocation.
+# - An IP probes _RATE_PROBE neighbouring slots and reuses one whose bucket has fully refilled;
+#   only when all of them are active is the fullest (least drained) one taken over.
+# - The table is split into _RATE_LOCKS stripes, each guarded by its own lock; probing wraps
+#   within the stripe, so unrelated IPs rarely contend on the same mutex.
 # ============================================================
-_rate_buckets: Dict[str, Dict[str, Any]] = {}
+_RATE_SLOTS = 16384
+_RATE_MASK = _RATE_SLOTS - 1
+# Buckets are timed on the monotonic clock (integer math, immune to NTP wall-clock steps).
+# Tokens are stored scaled by _RATE_WINDOW_NS, so refill is exactly elapsed_ns * RATE_LIMIT_PER_MIN
+# and one request costs _RATE_WINDOW_NS.
+_RATE_WINDOW_NS = 60 * 1_000_000_000
+_RATE_PROBE = 4
+_RATE_LOCKS = 64
+_RATE_STRIPE_BITS = (_RATE_SLOTS // _RATE_LOCKS).bit_length() - 1
+_RATE_STRIPE_MASK = (1 << _RATE_STRIPE_BITS) - 1
+_rate_locks = [threading.Lock() for _ in range(_RATE_LOCKS)]
+_rate_keys = array.array("q", [0]) * _RATE_SLOTS
+_rate_last_ns = array.array("q", [-(1 << 62)]) * _RATE_SLOTS
+_rate_tokens = array.array("q", [0]) * _RATE_SLOTS
 
 
 def client_ip() -> str:
     # Render often sets X-Forwarded-For
     xff = request.headers.get("X-Forwarded-For", "")
     if xff:
-        return xff.split(",")[0].strip()
+        # partition: only the first hop is used, so don't materialize the whole chain.
+        head, _, _ = xff.partition(",")
+        return head.strip() or request.remote_addr or "unknown"
     return request.remote_addr or "unknown"
 
 
 def check_rate_limit(ip: str) -> Tuple[bool, int]:
     """
-    Returns (allowed, remaining_in_window).
-    Fixed window: per-minute.
+    Returns (allowed, remaining_tokens).
+    Token bucket: bursts up to RATE_LIMIT_PER_MIN, refills at RATE_LIMIT_PER_MIN per minute.
     """
-    now = int(time.time())
-    window = now // 60
-    b = _rate_buckets.get(ip)
-    if not b or b["window"] != window:
-        _rate_buckets[ip] = {"window": window, "count": 1}
-        return True, max(RATE_LIMIT_PER_MIN - 1, 0)
+    now = time.monotonic_ns()
+    cap = RATE_LIMIT_PER_MIN * _RATE_WINDOW_NS
+    h = hash(ip)
+    base = h & _RATE_MASK
+    stripe = base & ~_RATE_STRIPE_MASK
+    with _rate_locks[base >> _RATE_STRIPE_BITS]:
+        victim = -1
+        for k in range(_RATE_PROBE):
+            i = stripe | ((base + k) & _RATE_STRIPE_MASK)
+            if _rate_keys[i] == h:
+                tokens = min(cap, _rate_tokens[i] + (now - _rate_last_ns[i]) * RATE_LIMIT_PER_MIN)
+                break
+            if victim < 0 and now - _rate_last_ns[i] >= _RATE_WINDOW_NS:
+                victim = i
+        else:
+            if victim < 0:
+                # Every probed bucket is still refilling: evict the fullest (least drained) one.
+                victim = max((stripe | ((base + k) & _RATE_STRIPE_MASK) for k in range(_RATE_PROBE)), key=_rate_tokens.__getitem__)
+            i = victim
+            _rate_keys[i] = h
+            tokens = cap
 
-    if b["count"] >= RATE_LIMIT_PER_MIN:
-        return False, 0
+        _rate_last_ns[i] = now
+        if tokens < _RATE_WINDOW_NS:
+            _rate_tokens[i] = tokens
+            return False, 0
 
-    b["count"] += 1
-    remaining = max(RATE_LIMIT_PER_MIN - b["count"], 0)
-    return True, remaining
+        tokens -= _RATE_WINDOW_NS
+        _rate_tokens[i] = tokens
+    return True, tokens // _RATE_WINDOW_NS
 
 
 # ============================================================
 # Google Sheets helpers
 # ============================================================
 def get_gspread_client():
-    if os.environ.get("GOOGLE_CREDS_JSON"):
-        creds_info = json.loads(os.environ["GOOGLE_CREDS_JSON"])
-        creds = Credentials.from_service_account_info(creds_info, scopes=SCOPES)
-        return gspread.authorize(creds)
+    """Authorized gspread client, built once and shared by every request.
 
-    creds_file = "google_creds.json"
-    if os.path.exists(creds_file):
-        creds = Credentials.from_service_account_file(creds_file, scopes=SCOPES)
-        return gspread.authorize(creds)
+    Reusing it keeps one HTTP session (pooled TLS connections) and one OAuth token; google-auth's
+    AuthorizedSession refreshes the token by itself when it expires.
+    """
+    global _GC_CLIENT
+    gc = _GC_CLIENT
+    if gc is not None:
+        return gc
+    with _GC_LOCK:
+        if _GC_CLIENT is not None:
+            return _GC_CLIENT
+        if _CREDS_INFO_ERROR is not None:
+            raise _CREDS_INFO_ERROR
+        if _CREDS_INFO is not None:
+            creds = Credentials.from_service_account_info(_CREDS_INFO, scopes=SCOPES)
+            _GC_CLIENT = gspread.authorize(creds)
+            return _GC_CLIENT
+
+        creds_file = "google_creds.json"
+        if os.path.exists(creds_file):
+            creds = Credentials.from_service_account_file(creds_file, scopes=SCOPES)
+            _GC_CLIENT = gspread.authorize(creds)
+            return _GC_CLIENT
 
     raise RuntimeError("Google credentials not found. Set GOOGLE_CREDS_JSON or provide google_creds.json locally.")
 
 
 
+@functools.lru_cache(maxsize=512)
 def _normalize_header(h: str) -> str:
     return (h or "").strip().lower().replace(" ", "_")
 
@@ -4845,11 +5405,44 @@ def _filter_leads_by_days(rows: List[List[str]], days: int) -> List[List[str]]:
 
 
 
+# Resolved row-1 headers per worksheet: {key: (time.time(), header)}.
+# Every append/read used to re-fetch row 1; schemas change rarely, and only via ensure_sheet_schema.
+SCHEMA_CACHE_SECONDS = int(os.environ.get("SCHEMA_CACHE_SECONDS", "60"))
+_SCHEMA_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+
+def _ws_schema_key(ws) -> str:
+    """Stable cache key for a worksheet ('' when it can't be identified)."""
+    try:
+        sid = getattr(ws, "spreadsheet_id", None) or getattr(getattr(ws, "spreadsheet", None), "id", None)
+        wid = getattr(ws, "id", None)
+        if sid is None or wid is None:
+            return ""
+        return f"{sid}:{wid}"
+    except Exception:
+        return ""
+
+
 def ensure_sheet_schema(ws) -> List[str]:
     """
     Make sure row 1 is the header and includes the CRM columns we need.
     Returns the final header list (as stored in the sheet).
+
+    The result is cached per worksheet for SCHEMA_CACHE_SECONDS.
     """
+    key = _ws_schema_key(ws)
+    if key:
+        hit = _SCHEMA_CACHE.get(key)
+        if hit and (time.time() - hit[0]) < SCHEMA_CACHE_SECONDS:
+            return list(hit[1])
+    header = _ensure_sheet_schema_uncached(ws)
+    if key:
+        _SCHEMA_CACHE[key] = (time.time(), list(header))
+    return header
+
+
+@with_backoff
+def _ensure_sheet_schema_uncached(ws) -> List[str]:
     desired = [
         "timestamp",
         "reservation_id",
@@ -4897,21 +5490,317 @@ def ensure_sheet_schema(ws) -> List[str]:
     return header
 
 
-def header_map(header: List[str]) -> Dict[str, int]:
-    """Return {normalized_header: 1-based column_index}"""
+def header_map(header: List[str]) -> Mapping[str, int]:
+    """Return {normalized_header: 1-based column_index} (read-only; shared across calls)."""
+    return _header_map_cached(tuple(header))
+
+
+@functools.lru_cache(maxsize=64)
+def _header_map_cached(header: Tuple[str, ...]) -> Mapping[str, int]:
     m = {}
     for i, h in enumerate(header):
         m[_normalize_header(h)] = i + 1
-    return m
+    return types.MappingProxyType(m)
+
+
+# ============================================================
+# Lead append coalescing
+# - append_lead_to_sheet() builds the row on the request thread, then enqueues (venue_id, ws, row)
+# - One background thread waits up to _LEAD_FLUSH_WAIT_S after the first queued row, then writes
+#   up to _LEAD_BATCH_MAX rows per worksheet with a single ws.append_rows() call
+# - Sheets 429s are retried (with_rate_limit_backoff; a 5xx is not, since the append may have landed);
+#   the leads cache is invalidated after each write
+# - PERSIST_ASYNC=0 (or sync=True) writes inline
+# - Queued rows are also spooled to LEAD_SPOOL_FILE.<pid>-<token> (JSONL) until written; every
+#   LEAD_RETRY_SECONDS the writer thread re-queues spools left behind by dead processes, so a
+#   crash/restart doesn't drop reservations
+# - The writer thread starts with the first queued lead, or at server startup via start_lead_writer()
+#   (wsgi.py / __main__) so a previous run's spools are replayed without waiting for one; never at import
+# - A failed batch stays in the spool and is retried every LEAD_RETRY_SECONDS; rows that fail
+#   LEAD_MAX_ATTEMPTS times are moved to LEAD_FAILED_FILE (JSONL) instead of being dropped
+# - Queued rows are flushed at interpreter exit
+# ============================================================
+# (venue_id, ws, row, failed_attempts)
+_LEAD_PENDING: "collections.deque[Tuple[str, Any, List[Any], int]]" = collections.deque()
+_LEAD_RETRY: List[Tuple[str, Any, List[Any], int]] = []  # failed rows waiting for the next retry tick
+_LEAD_COND = threading.Condition()
+_LEAD_FLUSH_LOCK = threading.Lock()
+_LEAD_BATCH_MAX = 50
+_LEAD_FLUSH_WAIT_S = 2.0
+_LEAD_THREAD: Optional[threading.Thread] = None
+LEAD_SPOOL_FILE = os.environ.get("LEAD_SPOOL_FILE", "/tmp/wc26_lead_spool.jsonl")  # "" disables the spool
+_LEAD_SPOOL_ID: List[Any] = [0, ""]  # (pid, token) this process spools under
+LEAD_FAILED_FILE = os.environ.get("LEAD_FAILED_FILE", "/tmp/wc26_lead_failed.jsonl")
+LEAD_RETRY_SECONDS = float(os.environ.get("LEAD_RETRY_SECONDS", "60") or 60)
+LEAD_MAX_ATTEMPTS = int(os.environ.get("LEAD_MAX_ATTEMPTS", "5") or 5)
+
+
+def _lead_spool_path() -> str:
+    # Per process (gunicorn workers each spool and truncate their own file). The random token tells
+    # this process's spool apart from one left by an earlier process that had the same pid.
+    sid = _LEAD_SPOOL_ID
+    pid = os.getpid()
+    if sid[0] != pid:
+        sid[1] = secrets.token_hex(4)
+        sid[0] = pid
+    return f"{LEAD_SPOOL_FILE}.{pid}-{sid[1]}"
+
+
+def _lead_spool_add(vid: str, row: List[Any], attempts: int = 0) -> None:
+    """Record a queued row (caller holds _LEAD_COND, so a concurrent truncate can't drop it)."""
+    if not LEAD_SPOOL_FILE:
+        return
+    try:
+        _append_bytes(_lead_spool_path(), _dumps_json_compact({"vid": vid, "row": row, "n": attempts}) + b"\n")
+    except Exception:
+        pass
+
+
+def _lead_spool_clear() -> None:
+    if not LEAD_SPOOL_FILE:
+        return
+    try:
+        os.truncate(_lead_spool_path(), 0)
+    except OSError:
+        pass
+
+
+def _lead_spool_keep(entries: List[Tuple[str, Any, List[Any], int]]) -> None:
+    """Replace this process's spool with just `entries` (caller holds _LEAD_COND)."""
+    if not LEAD_SPOOL_FILE:
+        return
+    if not entries:
+        _lead_spool_clear()
+        return
+    try:
+        _atomic_write_bytes(_lead_spool_path(), b"".join(
+            _dumps_json_compact({"vid": vid, "row": row, "n": n}) + b"\n" for vid, _ws, row, n in entries
+        ))
+    except Exception as e:
+        print(f"[LEADS] could not rewrite lead spool err={e!r}")
+
 
+def _lead_spool_replay() -> None:
+    """Re-queue rows spooled by processes that died before writing them.
 
-def append_lead_to_sheet(lead: Dict[str, Any], venue_id: Optional[str] = None) -> None:
+    Each stale spool is claimed with an atomic rename first, so only one worker replays it.
+    """
+    if not LEAD_SPOOL_FILE:
+        return
+    with _LEAD_COND:
+        mine = os.path.basename(_lead_spool_path())
+    folder, base = os.path.split(LEAD_SPOOL_FILE)
+    try:
+        names = os.listdir(folder or ".")
+    except OSError:
+        return
+    for name in names:
+        if not name.startswith(base + ".") or name == mine:
+            continue
+        pid_s, _, token = name[len(base) + 1:].partition("-")
+        if not pid_s.isdigit() or not token.isalnum():
+            continue
+        if int(pid_s) != os.getpid():
+            try:
+                os.kill(int(pid_s), 0)
+                continue  # owner still running
+            except ProcessLookupError:
+                pass
+            except OSError:
+                continue
+        path = os.path.join(folder, name)
+        claimed = f"{path}.replay"
+        try:
+            os.replace(path, claimed)
+        except OSError:
+            continue
+        try:
+            with open(claimed, "rb") as f:
+                entries = [_loads_json_bytes(line) for line in f if line.strip()]
+            sheets: Dict[str, Any] = {}
+            for ent in entries:
+                vid = str(ent.get("vid") or "")
+                if vid not in sheets:
+                    sheets[vid] = get_sheet(venue_id=vid)
+            for ent in entries:
+                vid = str(ent.get("vid") or "")
+                _lead_enqueue(vid, sheets[vid], list(ent.get("row") or []), attempts=int(ent.get("n") or 0))
+            if entries:
+                print(f"[LEADS] re-queued {len(entries)} spooled row(s) from {name}")
+            os.remove(claimed)
+        except Exception as e:
+            print(f"[LEADS] spool replay of {name} failed err={e!r}")
+            try:
+                os.replace(claimed, path)  # leave it for the next writer start
+            except OSError:
+                pass
+
+
+@with_rate_limit_backoff
+def _sheets_append_rows(ws, rows: List[List[Any]]) -> None:
+    ws.append_rows(rows, value_input_option="USER_ENTERED")
+
+
+def _lead_append_rows(vid: str, ws, rows: List[List[Any]]) -> None:
+    """Append rows to one worksheet in a single call, then drop the venue's cached leads."""
+    _sheets_append_rows(ws, rows)
+    try:
+        _invalidate_leads_cache(vid)
+    except Exception:
+        pass
+
+
+def _lead_record_failed(vid: str, rows: List[List[Any]], err: Exception) -> None:
+    """Keep rows the writer could not append (LEAD_FAILED_FILE) so they can be re-entered."""
+    print(f"[LEADS] append of {len(rows)} row(s) failed venue={vid} err={err!r}")
+    if not LEAD_FAILED_FILE:
+        return
+    ts = datetime.now().isoformat(timespec="seconds")
+    try:
+        _append_bytes(LEAD_FAILED_FILE, b"".join(
+            _dumps_json_compact({"ts": ts, "vid": vid, "row": row, "error": repr(err)}) + b"\n" for row in rows
+        ))
+    except Exception as e:
+        print(f"[LEADS] could not record failed rows venue={vid} err={e!r}")
+
+
+def _lead_not_yet_written(ws, ents: List[Tuple[str, Any, List[Any], int]]) -> List[Tuple[str, Any, List[Any], int]]:
+    """Drop retried entries whose reservation_id is already in the sheet.
+
+    An append that failed with a 5xx may still have landed, so a retry must not add it again.
+    """
+    if not any(ent[3] for ent in ents):
+        return ents
+    try:
+        col = header_map(ensure_sheet_schema(ws)).get("reservation_id")
+        if not col:
+            return ents
+        have = set(with_backoff(ws.col_values)(col))
+    except Exception:
+        return ents
+    out = []
+    for ent in ents:
+        rid = str(ent[2][col - 1]) if ent[3] and len(ent[2]) >= col else ""
+        if rid and rid in have:
+            continue
+        out.append(ent)
+    return out
+
+
+def _lead_write_batch(batch: List[Tuple[str, Any, List[Any], int]]) -> List[Tuple[str, Any, List[Any], int]]:
+    """Append a batch grouped per worksheet; returns the entries whose append failed."""
+    by_ws: Dict[int, Tuple[str, Any, List[Tuple[str, Any, List[Any], int]]]] = {}
+    for ent in batch:
+        by_ws.setdefault(id(ent[1]), (ent[0], ent[1], []))[2].append(ent)
+    failed: List[Tuple[str, Any, List[Any], int]] = []
+    for vid, ws, ents in by_ws.values():
+        ents = _lead_not_yet_written(ws, ents)
+        if not ents:
+            continue
+        try:
+            _lead_append_rows(vid, ws, [ent[2] for ent in ents])
+        except Exception as e:
+            print(f"[LEADS] append of {len(ents)} row(s) failed venue={vid} err={e!r}")
+            for ent_vid, ent_ws, row, n in ents:
+                if n + 1 >= LEAD_MAX_ATTEMPTS:
+                    _lead_record_failed(vid, [row], e)
+                else:
+                    failed.append((ent_vid, ent_ws, row, n + 1))
+    return failed
+
+
+def _lead_drain_pending() -> None:
+    with _LEAD_FLUSH_LOCK:
+        wrote = False
+        while True:
+            with _LEAD_COND:
+                n = min(len(_LEAD_PENDING), _LEAD_BATCH_MAX)
+                batch = [_LEAD_PENDING.popleft() for _ in range(n)]
+                if not batch:
+                    # Every spooled row is now written, given up on, or waiting in _LEAD_RETRY:
+                    # the spool only has to keep the latter.
+                    if wrote:
+                        _lead_spool_keep(_LEAD_RETRY)
+                    return
+            failed = _lead_write_batch(batch)
+            wrote = True
+            if failed:
+                with _LEAD_COND:
+                    _LEAD_RETRY.extend(failed)
+
+
+def _lead_flush_now() -> None:
+    """Synchronously write any queued leads (e.g. before shutdown)."""
+    try:
+        _lead_drain_pending()
+    except Exception:
+        pass
+
+
+atexit.register(_lead_flush_now)
+
+
+def _lead_writer_loop() -> None:
+    next_retry = 0.0  # replay stale spools as soon as the thread starts
+    while True:
+        try:
+            if time.monotonic() >= next_retry:
+                next_retry = time.monotonic() + LEAD_RETRY_SECONDS
+                with _LEAD_COND:
+                    _LEAD_PENDING.extend(_LEAD_RETRY)  # already in our spool
+                    _LEAD_RETRY.clear()
+                _lead_spool_replay()
+            with _LEAD_COND:
+                while not _LEAD_PENDING:
+                    left = next_retry - time.monotonic()
+                    if left <= 0:
+                        break
+                    _LEAD_COND.wait(left)
+                if not _LEAD_PENDING:
+                    continue
+                # Give concurrent reservations a moment to join this batch.
+                deadline = time.monotonic() + _LEAD_FLUSH_WAIT_S
+                while len(_LEAD_PENDING) < _LEAD_BATCH_MAX:
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    _LEAD_COND.wait(left)
+            _lead_drain_pending()
+        except Exception:
+            pass
+
+
+def _lead_writer_start() -> None:
+    """Start the writer thread if this process doesn't have one (caller holds _LEAD_COND)."""
+    global _LEAD_THREAD
+    if _LEAD_THREAD is None or not _LEAD_THREAD.is_alive():
+        _LEAD_THREAD = threading.Thread(target=_lead_writer_loop, name="wc26-leads-append", daemon=True)
+        _LEAD_THREAD.start()
+
+
+def _lead_enqueue(vid: str, ws, row: List[Any], attempts: int = 0) -> None:
+    with _LEAD_COND:
+        _lead_writer_start()
+        _lead_spool_add(vid, row, attempts)
+        _LEAD_PENDING.append((vid, ws, row, attempts))
+        _LEAD_COND.notify()
+
+
+def start_lead_writer() -> None:
+    """Server startup hook: start the lead writer now so spools left by a previous run are replayed."""
+    if PERSIST_ASYNC and LEAD_SPOOL_FILE:
+        with _LEAD_COND:
+            _lead_writer_start()
+
+
+def append_lead_to_sheet(lead: Dict[str, Any], venue_id: Optional[str] = None, sync: bool = False) -> None:
     """
     Append a lead into the correct venue worksheet, tagging it with venue_id.
 
     - venue_id (optional): when provided, it is treated as the source of truth
       for which venue owns this lead; otherwise we fall back to the current
       request context via _venue_id().
+    - sync: write before returning instead of queueing for the batched writer.
     """
     # Resolve effective venue (explicit > request context)
     vid = _slugify_venue_id(venue_id or _venue_id())
@@ -4951,15 +5840,151 @@ def append_lead_to_sheet(lead: Dict[str, Any], venue_id: Optional[str] = None) -
     setv("vibe", lead.get("vibe", ""))
 
     # Append at bottom (keeps headers at the top)
-    ws.append_row(row, value_input_option="USER_ENTERED")
-    try:
-        _LEADS_CACHE_BY_VENUE.pop(_slugify_venue_id(vid), None)
-    except Exception:
-        pass
+    if sync or not PERSIST_ASYNC:
+        _lead_append_rows(vid, ws, [row])
+        return
+    _lead_enqueue(vid, ws, row)
 
 
-# Small per-venue read cache to avoid Sheets 429s
+# Small per-venue read cache to avoid Sheets 429s (stale-while-revalidate):
+# - rows younger than LEADS_CACHE_SECONDS are served as-is
+# - up to LEADS_STALE_SECONDS they are still served while one background refresh per venue
+#   re-reads the sheet in _LEADS_REFRESH_POOL (backing off when Sheets answers 429)
+# - older (or invalidated) entries are re-read synchronously
+LEADS_CACHE_SECONDS = float(os.environ.get("LEADS_CACHE_SECONDS", "9") or 9)
+LEADS_STALE_SECONDS = float(os.environ.get("LEADS_STALE_SECONDS", "120") or 120)
 _LEADS_CACHE_BY_VENUE: Dict[str, Dict[str, Any]] = {}
+_LEADS_REFRESH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wc26-leads")
+_LEADS_REFRESHING: set = set()
+_LEADS_REFRESH_LOCK = threading.Lock()
+_LEADS_REFRESH_BACKOFF: Dict[str, Tuple[float, float]] = {}  # vid -> (retry_after_ts, delay_s)
+# Bumped by _invalidate_leads_cache so a read that started before a write never re-caches old rows.
+_LEADS_CACHE_EPOCH = 0
+
+# Cross-venue /admin/api/leads_all response cache: {key: {"ts", "payload"}}
+LEADS_ALL_CACHE_SECONDS = float(os.environ.get("LEADS_ALL_CACHE_SECONDS", "15") or 15)
+_LEADS_ALL_CACHE: Dict[Any, Dict[str, Any]] = {}
+_LEADS_ALL_CACHE_MAX = 256
+# One compute lock per cache key (different filters don't wait on each other), created under a small lock.
+_LEADS_ALL_COMPUTE_LOCKS: Dict[Any, threading.Lock] = {}
+_LEADS_ALL_COMPUTE_LOCKS_LOCK = threading.Lock()
+
+
+def _leads_all_cache_get(key: Any) -> Optional[Dict[str, Any]]:
+    ent = _LEADS_ALL_CACHE.get(key)
+    if ent and (time.time() - float(ent.get("ts") or 0.0) < LEADS_ALL_CACHE_SECONDS):
+        return ent.get("payload")
+    return None
+
+
+def _leads_all_compute_lock(key: Any) -> threading.Lock:
+    with _LEADS_ALL_COMPUTE_LOCKS_LOCK:
+        lock = _LEADS_ALL_COMPUTE_LOCKS.get(key)
+        if lock is None:
+            if len(_LEADS_ALL_COMPUTE_LOCKS) >= _LEADS_ALL_CACHE_MAX:
+                # Drop idle locks so arbitrary query strings can't grow this without bound.
+                for k in [k for k, lk in _LEADS_ALL_COMPUTE_LOCKS.items() if not lk.locked()]:
+                    _LEADS_ALL_COMPUTE_LOCKS.pop(k, None)
+            lock = _LEADS_ALL_COMPUTE_LOCKS[key] = threading.Lock()
+        return lock
+
+
+def _leads_all_cache_put(key: Any, payload: Dict[str, Any]) -> None:
+    if LEADS_ALL_CACHE_SECONDS <= 0:
+        return
+    now = time.time()
+    if len(_LEADS_ALL_CACHE) >= _LEADS_ALL_CACHE_MAX:
+        for k in [k for k, e in list(_LEADS_ALL_CACHE.items()) if now - float(e.get("ts") or 0.0) >= LEADS_ALL_CACHE_SECONDS]:
+            _LEADS_ALL_CACHE.pop(k, None)
+        if len(_LEADS_ALL_CACHE) >= _LEADS_ALL_CACHE_MAX:
+            _LEADS_ALL_CACHE.clear()
+    _LEADS_ALL_CACHE[key] = {"ts": now, "payload": payload}
+
+
+def _invalidate_leads_cache(venue_id: Optional[str] = None) -> None:
+    """Drop cached sheet rows for a venue (or all) plus any merged leads_all responses."""
+    global _LEADS_CACHE_EPOCH
+    _LEADS_CACHE_EPOCH += 1
+    if venue_id:
+        _LEADS_CACHE_BY_VENUE.pop(_slugify_venue_id(venue_id), None)
+    else:
+        _LEADS_CACHE_BY_VENUE.clear()
+    _LEADS_ALL_CACHE.clear()
+
+def _fetch_leads_rows(vid: str) -> List[List[str]]:
+    """Read the venue's rows from its sheet (header + this venue's rows) and refresh the cache.
+
+    Raises on Sheets errors; read_leads decides what to serve instead.
+    """
+    epoch = _LEADS_CACHE_EPOCH
+    now = time.time()
+
+    def _store(entry: Dict[str, Any]) -> None:
+        if epoch == _LEADS_CACHE_EPOCH:
+            _LEADS_CACHE_BY_VENUE[vid] = entry
+
+    ws = get_sheet(venue_id=vid)  # uses venue sheet_name when present
+    # Must persist venue_id column so writes tag rows; reads filter by it.
+    ensure_sheet_schema(ws)
+    rows = ws.get_all_values() or []
+
+    # Per-row venue isolation (required when multiple venues share one workbook/tab).
+    if not rows or len(rows) < 2:
+        _store({"ts": now, "rows": rows or [[]], "body_sheet_rows": []})
+        return rows
+
+    header = rows[0]
+    hmap = header_map(header)
+    vcol = hmap.get("venue_id")
+    if not vcol:
+        # Fail closed: do not show other venues' rows if schema is broken.
+        _store({"ts": now, "rows": [header], "body_sheet_rows": []})
+        return [header]
+
+    kept = []
+    body_sheet_rows: List[int] = []
+    for i, r in enumerate(rows[1:], start=2):
+        if not isinstance(r, list):
+            continue
+        pad = vcol - len(r)
+        if pad > 0:
+            r = r + [""] * pad
+        row_vid = _slugify_venue_id(str((r[vcol - 1] if len(r) >= vcol else "") or DEFAULT_VENUE_ID))
+        if row_vid == vid:
+            kept.append(r)
+            body_sheet_rows.append(i)
+    rows = [header] + kept
+
+    # cache regardless; even empty is useful to avoid hammering
+    _store({"ts": now, "rows": rows, "body_sheet_rows": body_sheet_rows})
+    return rows
+
+
+def _refresh_leads_bg(vid: str) -> None:
+    try:
+        _fetch_leads_rows(vid)
+        _LEADS_REFRESH_BACKOFF.pop(vid, None)
+    except Exception as e:
+        if _is_sheets_rate_limited(e):
+            delay = min(60.0, max(2.0, _LEADS_REFRESH_BACKOFF.get(vid, (0.0, 0.0))[1] * 2))
+            _LEADS_REFRESH_BACKOFF[vid] = (time.time() + delay, delay)
+    finally:
+        with _LEADS_REFRESH_LOCK:
+            _LEADS_REFRESHING.discard(vid)
+
+
+def _schedule_leads_refresh(vid: str) -> None:
+    """Start one background re-read for `vid` unless one is running or Sheets asked us to back off."""
+    with _LEADS_REFRESH_LOCK:
+        if vid in _LEADS_REFRESHING or time.time() < _LEADS_REFRESH_BACKOFF.get(vid, (0.0, 0.0))[0]:
+            return
+        _LEADS_REFRESHING.add(vid)
+    try:
+        _LEADS_REFRESH_POOL.submit(_refresh_leads_bg, vid)
+    except Exception:
+        with _LEADS_REFRESH_LOCK:
+            _LEADS_REFRESHING.discard(vid)
+
 
 def read_leads(limit: int = 200, venue_id: Optional[str] = None) -> List[List[str]]:
     """Read leads from the venue's Google Sheet tab (best-effort, cached).
@@ -4969,50 +5994,19 @@ def read_leads(limit: int = 200, venue_id: Optional[str] = None) -> List[List[st
     (shared spreadsheet + per-row venue_id is required for multi-tenant isolation).
     """
     vid = _slugify_venue_id(venue_id or _venue_id())
-    now = time.time()
 
     cache = _LEADS_CACHE_BY_VENUE.get(vid) or {}
     rows_cached = cache.get("rows")
-    if isinstance(rows_cached, list) and (now - float(cache.get("ts") or 0.0) < 9.0):
-        out = rows_cached[:limit] if limit else rows_cached
-        return out
+    if isinstance(rows_cached, list):
+        age = time.time() - float(cache.get("ts") or 0.0)
+        if age < LEADS_CACHE_SECONDS:
+            return rows_cached[:limit] if limit else rows_cached
+        if age < LEADS_STALE_SECONDS:
+            _schedule_leads_refresh(vid)
+            return rows_cached[:limit] if limit else rows_cached
 
     try:
-        ws = get_sheet(venue_id=vid)  # uses venue sheet_name when present
-        # Must persist venue_id column so writes tag rows; reads filter by it.
-        ensure_sheet_schema(ws)
-        rows = ws.get_all_values() or []
-
-        # Per-row venue isolation (required when multiple venues share one workbook/tab).
-        if not rows or len(rows) < 2:
-            _LEADS_CACHE_BY_VENUE[vid] = {"ts": now, "rows": rows or [[]], "body_sheet_rows": []}
-            return rows[:limit] if limit else rows
-
-        header = rows[0]
-        hmap = header_map(header)
-        vcol = hmap.get("venue_id")
-        if not vcol:
-            # Fail closed: do not show other venues' rows if schema is broken.
-            _LEADS_CACHE_BY_VENUE[vid] = {"ts": now, "rows": [header], "body_sheet_rows": []}
-            return [header]
-
-        body = rows[1:]
-        kept = []
-        body_sheet_rows: List[int] = []
-        for i, r in enumerate(rows[1:], start=2):
-            if not isinstance(r, list):
-                continue
-            pad = vcol - len(r)
-            if pad > 0:
-                r = r + [""] * pad
-            row_vid = _slugify_venue_id(str((r[vcol - 1] if len(r) >= vcol else "") or DEFAULT_VENUE_ID))
-            if row_vid == vid:
-                kept.append(r)
-                body_sheet_rows.append(i)
-        rows = [header] + kept
-
-        # cache regardless; even empty is useful to avoid hammering
-        _LEADS_CACHE_BY_VENUE[vid] = {"ts": now, "rows": rows, "body_sheet_rows": body_sheet_rows}
+        rows = _fetch_leads_rows(vid)
         return rows[:limit] if limit else rows
     except Exception:
         # fallback to cached rows on error (may be missing body_sheet_rows on stale cache)
@@ -5056,15 +6050,133 @@ def get_session(sid: str) -> Dict[str, Any]:
     return s
 
 
+# ============================================================
+# Chat text parsers (extract_* / want_*): patterns compiled once at import
+# ============================================================
+# Month words in every supported language (used to keep dates out of names/party sizes).
+# Deduplicated into one word-boundary alternation, so "abril"/"agosto" are only tried once.
+_MONTH_WORDS = tuple(dict.fromkeys((
+    "january","jan","february","feb","march","mar","april","apr","may","june","jun","july","jul",
+    "august","aug","september","sep","sept","october","oct","november","nov","december","dec",
+    "enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre",
+    "janeiro","fevereiro","março","marco","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro",
+    "janvier","février","fevrier","mars","avril","mai","juin","juillet","août","aout","septembre","octobre","novembre","décembre","decembre",
+)))
+_RE_MONTH_WORD = re.compile(r"\b(?:" + "|".join(re.escape(w) for w in _MONTH_WORDS) + r")\b", re.I)
+# want_recall / want_reservation: substring triggers, one alternation scan per message
+_RE_RECALL_TRIGGER = re.compile("|".join(re.escape(x) for x in (
+    "recall reservation", "recall", "reservation so far",
+    "recordar reserva", "recordar", "reserva hasta ahora",
+    "relembrar reserva", "relembrar", "reserva até agora",
+    "rappeler", "réservation", "reservation jusqu",
+)))
+_RE_RESERVATION_TRIGGER = re.compile("|".join(re.escape(x) for x in (
+    "reservation",
+    "reserve",
+    "book a table",
+    "book table",
+    "table for",
+    "need a table",
+    "need table",
+    "reserva",
+    "réservation",
+    "vip reservation",
+    "vip table",
+    "vip reserve",
+    "vip book",
+    "vip hold",
+)))
+# extract_name / extract_name_candidate: whole-message trigger words that are never a name
+_NAME_TRIGGER_WORDS = frozenset((
+    "reservation", "reserve", "reserving", "book", "booking", "book a table",
+    "reserva", "reservar", "réservation",
+))
+_NAME_CANDIDATE_TRIGGER_WORDS = frozenset(("reservation", "reserva", "réservation", "reserve", "book", "book a table"))
+# extract_party_size
+_RE_PARTY_SIZE_TO = re.compile(r"party\s*(?:size)?\s+to\s+(\d+)")
+_RE_PARTY_SIZE_IS = re.compile(r"party\s*(?:size)?\s*(?:is|=|:)?\s*(\d+)")
+_RE_PARTY_OF = re.compile(r"party\s*of\s*(\d+)")
+_RE_TABLE_FOR = re.compile(r"table\s*(?:for|of)?\s*(\d+)")
+_RE_N_PEOPLE = re.compile(r"\b(\d+)\s*(people|persons|guests|pax)\b")
+_RE_FOR_N_PEOPLE = re.compile(r"for\s*(\d+)\s*(people|persons|guests|pax)\b")
+_RE_DIGIT = re.compile(r"\d")
+_RE_YMD_LOOSE = re.compile(r"\b\d{4}-\d{1,2}-\d{1,2}\b")
+_RE_NUMERIC_DATE = re.compile(r"\b\d{1,2}[/-]\d{1,2}([/-]\d{2,4})?\b")
+_RE_CLOCK_AMPM = re.compile(r"\b\d{1,2}(:\d{2})?\s*(am|pm)\b")
+_RE_NUMBER = re.compile(r"\b(\d+)\b")
+# extract_phone
+_RE_NON_DIGITS = re.compile(r"\D+")
+_RE_TEN_DIGITS = re.compile(r"(\d{10})")
+_RE_US_PHONE = re.compile(r"(?:\b1\D*)?(\d{3})\D*(\d{3})\D*(\d{4})\b")
+# extract_name
+_RE_NAME_JUNK = re.compile(r"[^A-Za-z\s\-'\.]+")
+_RE_WS = re.compile(r"\s+")
+_RE_LEADING_NONDIGITS = re.compile(r"\D*")
+# extract_time
+_RE_TIME_AMPM = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b")
+_RE_TIME_24H = re.compile(r"\b(\d{1,2}):(\d{2})\b")
+# extract_date
+_MONTH_TO_NUM = {
+    # English
+    "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3,
+    "april": 4, "apr": 4, "may": 5, "june": 6, "jun": 6, "july": 7, "jul": 7,
+    "august": 8, "aug": 8, "september": 9, "sep": 9, "sept": 9, "october": 10, "oct": 10,
+    "november": 11, "nov": 11, "december": 12, "dec": 12,
+    # Spanish
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6, "julio": 7,
+    "agosto": 8, "septiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
+    # Portuguese
+    "janeiro": 1, "fevereiro": 2, "março": 3, "maio": 5, "junho": 6, "julho": 7,
+    "setembro": 9, "outubro": 10, "novembro": 11, "dezembro": 12,
+    # French
+    "janvier": 1, "février": 2, "fevrier": 2, "mars": 3, "avril": 4, "mai": 5,
+    "juin": 6, "juillet": 7, "août": 8, "aout": 8, "septembre": 9, "octobre": 10,
+    "novembre": 11, "décembre": 12, "decembre": 12,
+}
+# Longest words first so "sept"/"september" win over "sep" at the same position.
+_RE_MONTH_DAY = re.compile(
+    r"\b(" + "|".join(re.escape(w) for w in sorted(_MONTH_TO_NUM, key=len, reverse=True)) + r")\b\D*(\d{1,2})"
+)
+_RE_DATE_ISO = re.compile(r"\b(20\d{2})-(\d{2})-(\d{2})\b")
+_RE_DATE_US = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b")
+_RE_YEAR = re.compile(r"\b(20\d{2})\b")
+_RE_FEB_FUZZY = re.compile(r"^fe[b]?\D*(\d{1,2})")
+# extract_name_candidate
+_RE_NAME_IS = re.compile(r"\b(?:my\s+name\s+is|name\s+is|under\s+name|for\s+name)\s+([A-Za-z][A-Za-z\s']{0,40})", re.I)
+_RE_AMPM_WORD = re.compile(r"\b(?:am|pm)\b")
+_RE_PARTY_SIZE_N = re.compile(r"\bparty\s*(?:size)?\s*(?:is|=|:)?\s*\d+")
+_RE_TABLE_FOR_N = re.compile(r"\btable\s*(?:for|of)\s*\d+")
+_RE_PHONE_ANY = re.compile(r"\b(?:\+?1\s*)?\(?\d{3}\)?[-.\s]*\d{3}[-.\s]*\d{4}\b")
+_RE_PARTY_OF_N_I = re.compile(r"\bparty\s*of\s*\d+\b", re.I)
+_RE_TABLE_FOR_N_I = re.compile(r"\btable\s*(?:for|of)\s*\d+\b", re.I)
+_RE_CLOCK_AMPM_I = re.compile(r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b", re.I)
+_RE_CLOCK_24H = re.compile(r"\b\d{1,2}:\d{2}\b")
+_RE_ISO_DATE = re.compile(r"\b20\d{2}-\d{2}-\d{2}\b")
+_RE_SLASH_DATE = re.compile(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b")
+_RE_SMALL_NUMBER = re.compile(r"\b\d{1,3}\b")
+_RE_BOOKING_WORD = re.compile(r"\b(reservation|reserve|book|booking|table|party|for|of)\b", re.I)
+_RE_NON_NAME = re.compile(r"[^A-Za-z'\s]")
+# All of the above as one alternation, in the order they used to be applied: earlier entries win
+# where matches overlap, and each keeps its own case sensitivity.
+_RE_NAME_NOISE = re.compile("|".join(
+    (f"(?i:{p.pattern})" if p.flags & re.I else f"(?:{p.pattern})")
+    for p in (
+        _RE_PHONE_ANY,
+        _RE_PARTY_OF_N_I, _RE_TABLE_FOR_N_I,
+        _RE_CLOCK_AMPM_I, _RE_CLOCK_24H,
+        _RE_ISO_DATE, _RE_SLASH_DATE,
+        _RE_MONTH_WORD,
+        _RE_SMALL_NUMBER,
+        _RE_BOOKING_WORD,
+        _RE_NON_NAME,
+    )
+))
+# _local_country_list (fixture placeholders like "1A", "3ABCDF")
+_RE_SLOT_PLACEHOLDER = re.compile(r"\d+[A-Za-z]{1,10}")
+
+
 def want_recall(text: str, lang: str) -> bool:
-    t = text.lower().strip()
-    triggers = [
-        "recall reservation", "recall", "reservation so far",
-        "recordar reserva", "recordar", "reserva hasta ahora",
-        "relembrar reserva", "relembrar", "reserva até agora",
-        "rappeler", "réservation", "reservation jusqu",
-    ]
-    return any(x in t for x in triggers)
+    return _RE_RECALL_TRIGGER.search(text.lower()) is not None
 
 
 def want_reservation(text: str) -> bool:
@@ -5075,70 +6187,56 @@ def want_reservation(text: str) -> bool:
         return True
     # Heuristics: catch natural phrases like "reservation", "need a table",
     # "book a table", "table for 4", "vip reservation", etc.
-    triggers = [
-        "reservation",
-        "reserve",
-        "book a table",
-        "book table",
-        "table for",
-        "need a table",
-        "need table",
-        "reserva",
-        "réservation",
-        "vip reservation",
-        "vip table",
-        "vip reserve",
-        "vip book",
-        "vip hold",
-    ]
-    return any(k in t for k in triggers)
+    return _RE_RESERVATION_TRIGGER.search(t) is not None
 
 
-def extract_party_size(text: str) -> Optional[int]:
+def _prepare_text(text: Optional[str]) -> Tuple[str, str]:
+    """(stripped, stripped.lower()) for one chat message.
+
+    Callers that run several extract_* parsers on the same message compute this once and
+    pass both parts (extract_x(raw, lower)) instead of each parser re-stripping/lowercasing.
+    """
+    raw = (text or "").strip()
+    return raw, raw.lower()
+
+
+def extract_party_size(text: str, lower: Optional[str] = None) -> Optional[int]:
     """Extract party size from free text.
 
     IMPORTANT: avoid mis-reading dates like 'June 13' as a party size,
     but still support natural phrases like 'party size is 6' or 'party size to 3'
     even when message contains a long digit string (e.g. phone number).
     """
-    raw = (text or "").strip()
-    if not raw:
+    t = lower if lower is not None else (text or "").strip().lower()
+    if not t:
         return None
-    t = raw.lower()
 
     # Strong patterns first – "party size to N" wins when message also has phone digits.
-    m = re.search(r"party\s*(?:size)?\s+to\s+(\d+)", t)
+    m = _RE_PARTY_SIZE_TO.search(t)
     if m:
         n = int(m.group(1))
         if 1 <= n <= 200:
             return n
-    m = re.search(r"party\s*(?:size)?\s*(?:is|=|:)?\s*(\d+)", t)
+    m = _RE_PARTY_SIZE_IS.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"party\s*of\s*(\d+)", t)
+    m = _RE_PARTY_OF.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"table\s*(?:for|of)?\s*(\d+)", t)
+    m = _RE_TABLE_FOR.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"\b(\d+)\s*(people|persons|guests|pax)\b", t)
+    m = _RE_N_PEOPLE.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"for\s*(\d+)\s*(people|persons|guests|pax)\b", t)
+    m = _RE_FOR_N_PEOPLE.search(t)
     if m:
         return int(m.group(1))
 
     # If the text looks like a date or time and we didn't hit any of the
     # strong patterns above, be conservative and avoid treating numbers as
     # party size.
-    months = [
-        "january","jan","february","feb","march","mar","april","apr","may","june","jun","july","jul",
-        "august","aug","september","sep","sept","october","oct","november","nov","december","dec",
-        "enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre",
-        "janeiro","fevereiro","março","marco","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro",
-        "janvier","février","fevrier","mars","avril","mai","juin","juillet","août","aout","septembre","octobre","novembre","décembre","decembre",
-    ]
-    if any(mo in t for mo in months):
+    if _RE_MONTH_WORD.search(t):
         return None
     # Also check for partial month names that might indicate a date (e.g., "fe" for feb, "ju" for jun/jul)
     # This prevents "fe 18" from being read as party size 18
@@ -5151,18 +6249,18 @@ def extract_party_size(text: str) -> Optional[int]:
                 idx = t.find(pref)
                 if idx >= 0:
                     after = t[idx + len(pref):idx + len(pref) + 5]
-                    if re.search(r"\d", after):
+                    if _RE_DIGIT.search(after):
                         return None
-    if re.search(r"\b\d{4}-\d{1,2}-\d{1,2}\b", t):
+    if _RE_YMD_LOOSE.search(t):
         return None
-    if re.search(r"\b\d{1,2}[/-]\d{1,2}([/-]\d{2,4})?\b", t):
+    if _RE_NUMERIC_DATE.search(t):
         return None
     # Time patterns: "4 pm", "4:30 pm", "4am", etc. - don't treat as party size
-    if re.search(r"\b\d{1,2}(:\d{2})?\s*(am|pm)\b", t):
+    if _RE_CLOCK_AMPM.search(t):
         return None
 
     # Fallback: a plain number, but keep it reasonable
-    m = re.search(r"\b(\d+)\b", t)
+    m = _RE_NUMBER.search(t)
     if m:
         n = int(m.group(1))
         if 1 <= n <= 200:
@@ -5181,15 +6279,17 @@ def extract_phone(text: str) -> Optional[str]:
         return None
 
     # Prefer explicit 10-digit runs anywhere in the string
-    digits_only = re.sub(r"\D+", "", s)
+    digits_only = _RE_NON_DIGITS.sub("", s)
+    if len(digits_only) < 10:
+        return None  # both formats below need ten digits
 
     # Try to find a 10-digit chunk inside the full digit stream (e.g., '...2157779999')
-    m = re.search(r"(\d{10})", digits_only)
+    m = _RE_TEN_DIGITS.search(digits_only)
     if m:
         return m.group(1)
 
     # Try common separated formats: (215) 777-9999, 215-777-9999, 1 215 777 9999
-    m = re.search(r"(?:\b1\D*)?(\d{3})\D*(\d{3})\D*(\d{4})\b", s)
+    m = _RE_US_PHONE.search(s)
     if m:
         return f"{m.group(1)}{m.group(2)}{m.group(3)}"
 
@@ -5204,61 +6304,58 @@ def extract_name(text: str) -> Optional[str]:
     lower = raw.lower().strip()
 
     # Don't treat reservation trigger words as a person's name
-    trigger_words = {
-        "reservation", "reserve", "reserving", "book", "booking", "book a table",
-        "reserva", "reservar", "réservation", "réservation"
-    }
-    if lower in trigger_words:
+    if lower in _NAME_TRIGGER_WORDS:
         return None
 
     # If message contains 'party', take words before 'party'
     if "party" in lower:
         pre = raw[:lower.find("party")].strip()
-        pre = re.sub(r"[^A-Za-z\s\-'\.]", "", pre).strip()
-        pre = re.sub(r"\s+", " ", pre)
+        pre = _RE_NAME_JUNK.sub("", pre).strip()
+        pre = _RE_WS.sub(" ", pre)
         if 1 <= len(pre) <= 40:
             return pre
 
     # Otherwise, take leading letters until the first digit
-    name_part = ""
-    for ch in raw:
-        if ch.isdigit():
-            break
-        name_part += ch
-    name_part = name_part.strip()
-    name_part = re.sub(r"\s+", " ", name_part)
-    name_part = re.sub(r"[^A-Za-z\s\-'\.]", "", name_part).strip()
+    name_part = _RE_LEADING_NONDIGITS.match(raw).group(0).strip()
+    name_part = _RE_WS.sub(" ", name_part)
+    name_part = _RE_NAME_JUNK.sub("", name_part).strip()
     if 1 <= len(name_part) <= 40:
         return name_part
 
     return None
 
 
-def extract_time(text: str) -> Optional[str]:
-    t = text.lower().strip()
+def extract_time(text: str, lower: Optional[str] = None) -> Optional[str]:
+    # Every format below needs a digit; most chat turns have none.
+    if not _RE_DIGIT.search(text):
+        return None
+    t = lower if lower is not None else text.lower().strip()
     # 7pm / 7 pm / 19:30
-    m = re.search(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b", t)
+    m = _RE_TIME_AMPM.search(t)
     if m:
         hh = int(m.group(1))
         mm = m.group(2) or "00"
         ap = m.group(3)
         return f"{hh}:{mm} {ap}"
-    m = re.search(r"\b(\d{1,2}):(\d{2})\b", t)
+    m = _RE_TIME_24H.search(t)
     if m:
         return f"{m.group(1)}:{m.group(2)}"
     return None
 
 
-def extract_date(text: str) -> Optional[str]:
+def extract_date(text: str, lower: Optional[str] = None) -> Optional[str]:
+    # Every format below (ISO, US, month + day, fuzzy "feb") needs a day number.
+    if not _RE_DIGIT.search(text):
+        return None
     t = text.strip()
 
     # ISO: 2026-06-23
-    m = re.search(r"\b(20\d{2})-(\d{2})-(\d{2})\b", t)
+    m = _RE_DATE_ISO.search(t)
     if m:
         return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
 
     # US: 06/23/2026 or 6/23/26
-    m = re.search(r"\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b", t)
+    m = _RE_DATE_US.search(t)
     if m:
         mm = int(m.group(1))
         dd = int(m.group(2))
@@ -5267,47 +6364,28 @@ def extract_date(text: str) -> Optional[str]:
             yy += 2000
         return f"{yy:04d}-{mm:02d}-{dd:02d}"
 
-    # Month name + day (+ optional year)
-    lower = t.lower()
-    month_map = {
-        # English
-        "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3,
-        "april": 4, "apr": 4, "may": 5, "june": 6, "jun": 6, "july": 7, "jul": 7,
-        "august": 8, "aug": 8, "september": 9, "sep": 9, "sept": 9, "october": 10, "oct": 10,
-        "november": 11, "nov": 11, "december": 12, "dec": 12,
-        # Spanish
-        "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6, "julio": 7,
-        "agosto": 8, "septiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
-        # Portuguese
-        "janeiro": 1, "fevereiro": 2, "março": 3, "abril": 4, "maio": 5, "junho": 6, "julho": 7,
-        "agosto": 8, "setembro": 9, "outubro": 10, "novembro": 11, "dezembro": 12,
-        # French
-        "janvier": 1, "février": 2, "fevrier": 2, "mars": 3, "avril": 4, "mai": 5,
-        "juin": 6, "juillet": 7, "août": 8, "aout": 8, "septembre": 9, "octobre": 10,
-        "novembre": 11, "décembre": 12, "decembre": 12,
-    }
-
-    # Find month word, then day number
-    for word, mon in month_map.items():
-        if re.search(rf"\b{re.escape(word)}\b", lower):
-            m = re.search(rf"\b{re.escape(word)}\b\D*(\d{{1,2}})", lower)
-            if m:
-                dd = int(m.group(1))
-                y = 2026  # default year for World Cup focus
-                my = re.search(r"\b(20\d{2})\b", lower)
-                if my:
-                    y = int(my.group(1))
-                return f"{y:04d}-{mon:02d}-{dd:02d}"
+    # Month name + day (+ optional year): one scan for any month word followed by a day number
+    if lower is None:
+        lower = t.lower()
+    m = _RE_MONTH_DAY.search(lower)
+    if m:
+        mon = _MONTH_TO_NUM[m.group(1)]
+        dd = int(m.group(2))
+        y = 2026  # default year for World Cup focus
+        my = _RE_YEAR.search(lower)
+        if my:
+            y = int(my.group(1))
+        return f"{y:04d}-{mon:02d}-{dd:02d}"
     
     # Fuzzy match: handle partial month names like "fe" -> "feb"
     # Only try if we didn't find a full match above, and only for unambiguous prefixes
     # Check for common typos/abbreviations: "fe" -> february, "feb" -> february
     if lower.startswith("fe") and len(lower) >= 3:
-        m = re.search(r"^fe[b]?\D*(\d{1,2})", lower)
+        m = _RE_FEB_FUZZY.search(lower)
         if m:
             dd = int(m.group(1))
             y = 2026
-            my = re.search(r"\b(20\d{2})\b", lower)
+            my = _RE_YEAR.search(lower)
             if my:
                 y = int(my.group(1))
             return f"{y:04d}-02-{dd:02d}"
@@ -5315,7 +6393,7 @@ def extract_date(text: str) -> Optional[str]:
     return None
 
 
-def extract_name_candidate(text: str) -> Optional[str]:
+def extract_name_candidate(text: str, lower: Optional[str] = None) -> Optional[str]:
     """Best-effort name extraction from a mixed reservation message.
 
     Example:
@@ -5326,19 +6404,16 @@ def extract_name_candidate(text: str) -> Optional[str]:
         return None
 
     # Explicit patterns: "name is X", "my name is X", "under name X", "for name X"
-    m = re.search(
-        r"\b(?:my\s+name\s+is|name\s+is|under\s+name|for\s+name)\s+([A-Za-z][A-Za-z\s']{0,40})",
-        s,
-        flags=re.I,
-    )
+    m = _RE_NAME_IS.search(s)
     if m:
         name = m.group(1).strip()
         if name:
             return name
 
-    lower = s.lower().strip()
+    if lower is None:
+        lower = s.lower()
     # Don't treat trigger words as names
-    if lower in ["reservation", "reserva", "réservation", "reserve", "book", "book a table"]:
+    if lower in _NAME_CANDIDATE_TRIGGER_WORDS:
         return None
 
 
@@ -5348,50 +6423,20 @@ def extract_name_candidate(text: str) -> Optional[str]:
     # If the message clearly looks like a date/time/party-size description
     # (e.g. 'June 20, 2026 at 8 pm for 6 people'), skip heuristic name guessing
     # and let the bot explicitly ask for a name.
-    if re.search(r"\b(?:am|pm)\b", lower) or \
-       re.search(r"\bparty\s*(?:size)?\s*(?:is|=|:)?\s*\d+", lower) or \
-       re.search(r"\btable\s*(?:for|of)\s*\d+", lower):
+    if _RE_AMPM_WORD.search(lower) or \
+       _RE_PARTY_SIZE_N.search(lower) or \
+       _RE_TABLE_FOR_N.search(lower):
         return None
 
     # If the message clearly looks like a date/time/party-size description
     # (e.g. 'June 20, 2026 at 8 pm for 6 people'), skip heuristic name guessing
     # and let the bot explicitly ask for a name.
-    if re.search(r"\b(?:am|pm)\b", lower) or re.search(r"\bparty\s*(?:size)?\s*(?:is|=|:)?\s*\d+", lower) or re.search(r"\btable\s*(?:for|of)\s*\d+", lower):
+    if _RE_AMPM_WORD.search(lower) or _RE_PARTY_SIZE_N.search(lower) or _RE_TABLE_FOR_N.search(lower):
         return None
-    # Remove phone numbers (many formats)
-    s = re.sub(r"\b(?:\+?1\s*)?\(?\d{3}\)?[-.\s]*\d{3}[-.\s]*\d{4}\b", " ", s)
-
-    # Remove explicit party/table patterns
-    s = re.sub(r"\bparty\s*of\s*\d+\b", " ", s, flags=re.I)
-    s = re.sub(r"\btable\s*(?:for|of)\s*\d+\b", " ", s, flags=re.I)
-
-    # Remove time patterns (5pm, 5:30 pm, 17:00)
-    s = re.sub(r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b", " ", s, flags=re.I)
-    s = re.sub(r"\b\d{1,2}:\d{2}\b", " ", s)
-
-    # Remove ISO / slash dates
-    s = re.sub(r"\b20\d{2}-\d{2}-\d{2}\b", " ", s)
-    s = re.sub(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b", " ", s)
-
-    # Remove month-name dates (English/Spanish/Portuguese/French month words)
-    month_words = [
-        "january","jan","february","feb","march","mar","april","apr","may","june","jun","july","jul",
-        "august","aug","september","sep","sept","october","oct","november","nov","december","dec",
-        "enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre",
-        "janeiro","fevereiro","março","marco","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro",
-        "janvier","février","fevrier","mars","avril","mai","juin","juillet","août","aout","septembre","octobre","novembre","décembre","decembre",
-    ]
-    s = re.sub(r"\b(?:" + "|".join(re.escape(w) for w in month_words) + r")\b", " ", s, flags=re.I)
-
-    # Remove standalone small numbers (party size, day)
-    s = re.sub(r"\b\d{1,3}\b", " ", s)
-
-    # Remove reservation keywords
-    s = re.sub(r"\b(reservation|reserve|book|booking|table|party|for|of)\b", " ", s, flags=re.I)
-
-    # Keep letters/apostrophes/spaces only
-    s = re.sub(r"[^A-Za-z'\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    # Blank out phone numbers, party/table phrases, times, dates, month words, small numbers,
+    # reservation keywords and anything but letters/apostrophes in one pass (_RE_NAME_NOISE).
+    s = _RE_NAME_NOISE.sub(" ", s)
+    s = _RE_WS.sub(" ", s).strip()
 
     if not s:
         return None
@@ -5423,7 +6468,7 @@ def validate_date_iso(d_iso: str) -> bool:
 def apply_business_rules(lead: Dict[str, Any]) -> Optional[str]:
     # closed date check
     d_iso = lead.get("date", "")
-    if d_iso and d_iso in set(BUSINESS_RULES.get("closed_dates", [])):
+    if d_iso and d_iso in _closed_dates_set():
         return "closed"
 
     # party size check
@@ -5441,19 +6486,18 @@ def recall_text(sess: Dict[str, Any], session_id: Optional[str] = None) -> str:
 
 def next_question(sess: Dict[str, Any]) -> str:
     lang = sess.get("lang", "en")
-    L = LANG[lang]
     lead = sess["lead"]
 
     if not lead.get("date"):
-        return L["ask_date"]
+        return tr(lang, "ask_date")
     if not lead.get("time"):
-        return L["ask_time"]
+        return tr(lang, "ask_time")
     if not lead.get("party_size"):
-        return L["ask_party"]
+        return tr(lang, "ask_party")
     if not lead.get("name"):
-        return L["ask_name"]
+        return tr(lang, "ask_name")
     if not lead.get("phone"):
-        return L["ask_phone"]
+        return tr(lang, "ask_phone")
     return ""
 
 
@@ -5864,12 +6908,19 @@ def health():
 def menu_json():
     # No-store so mobile always sees the latest uploaded menu immediately.
     lang = norm_lang(request.args.get("lang", "en"))
-    payload = get_menu_for_lang(lang) or {}
-    resp = make_response(jsonify({
-        "lang": lang,
-        "title": payload.get("title", "Menu"),
-        "sections": payload.get("sections", []),
-    }))
+    category = (request.args.get("category") or "").strip().lower()
+    if category and category not in _menu_categories(lang):
+        return jsonify({"ok": False, "error": "Unknown category"}), 404
+    enc = _pick_static_encoding()
+    etag = _menu_etag(lang, enc, category)
+    if request.if_none_match.contains(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(_menu_json_bytes(lang, enc, category), mimetype=app.json.mimetype)
+        if enc:
+            resp.headers["Content-Encoding"] = enc
+    resp.set_etag(etag)
+    resp.vary.add("Accept-Encoding")
     resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
     resp.headers["Pragma"] = "no-cache"
     resp.headers["Expires"] = "0"
@@ -5880,29 +6931,48 @@ def menu_json():
 # ============================================================
 # Fan Zone (public demo JSON for the UI)
 # ============================================================
-FANZONE_DEMO = {
-    "en": [
+# Read-only: the encoded bodies below are cached per language, so the data must not change.
+FANZONE_DEMO = types.MappingProxyType({
+    "en": (
         {"date": "2026-06-11", "city": "Host City", "title": "Official Fan Festival", "location": "City Center", "description": "Live screenings, music, and food."},
         {"date": "2026-06-12", "city": "Host City", "title": "Watch Party Night", "location": "Partner Venue", "description": "Reservations recommended."},
-    ],
-    "es": [
+    ),
+    "es": (
         {"date": "2026-06-11", "city": "Ciudad Sede", "title": "Festival Oficial de Aficionados", "location": "Centro", "description": "Pantallas, música y comida."},
         {"date": "2026-06-12", "city": "Ciudad Sede", "title": "Noche de Partido", "location": "Lugar Asociado", "description": "Se recomienda reservar."},
-    ],
-    "pt": [
+    ),
+    "pt": (
         {"date": "2026-06-11", "city": "Cidade-Sede", "title": "Festival Oficial do Torcedor", "location": "Centro", "description": "Transmissão ao vivo, música e comida."},
         {"date": "2026-06-12", "city": "Cidade-Sede", "title": "Noite de Jogo", "location": "Local Parceiro", "description": "Reservas recomendadas."},
-    ],
-    "fr": [
+    ),
+    "fr": (
         {"date": "2026-06-11", "city": "Ville Hôte", "title": "Festival Officiel des Fans", "location": "Centre-ville", "description": "Diffusion live, musique et food."},
         {"date": "2026-06-12", "city": "Ville Hôte", "title": "Soirée Match", "location": "Lieu Partenaire", "description": "Réservation conseillée."},
-    ],
-}
+    ),
+})
 
+@functools.lru_cache(maxsize=256)
 def norm_lang(lang: str) -> str:
     lang = (lang or "en").lower().strip()
     return lang if lang in ("en","es","pt","fr") else "en"
 
+@functools.lru_cache(maxsize=256)
+def _fanzone_json_body(lang: str, sponsor_text: str) -> Tuple[bytes, str]:
+    """(encoded /fanzone.json body, strong ETag); same bytes as jsonify. FANZONE_DEMO never changes at runtime."""
+    payload = {
+        "lang": lang,
+        "events": FANZONE_DEMO.get(lang, FANZONE_DEMO["en"]),
+        "sponsor_text": sponsor_text,
+    }
+    body = (app.json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+# Built once per language at import; venue sponsor text adds a cache entry on first request.
+for _lang in FANZONE_DEMO:
+    _fanzone_json_body(_lang, "")
+del _lang
+
 @app.route("/fanzone.json")
 def fanzone_json():
     lang = norm_lang(request.args.get("lang"))
@@ -5922,17 +6992,52 @@ def fanzone_json():
         path = os.path.join(VENUES_DIR, f"{vid}.json")
         if os.path.exists(path):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    vcfg = json.load(f) or {}
+                vcfg = _read_json_bytes(path) or {}
                 fz = (vcfg.get("fan_zone") or {}) if isinstance(vcfg.get("fan_zone"), dict) else {}
                 sponsor_text = str(fz.get("poll_sponsor_text") or "").strip()
             except Exception:
                 pass
-    return jsonify({
-        "lang": lang,
-        "events": FANZONE_DEMO.get(lang, FANZONE_DEMO["en"]),
-        "sponsor_text": sponsor_text,
-    })
+    body, etag = _fanzone_json_body(lang, sponsor_text)
+    if _etag_matches(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(body, mimetype=app.json.mimetype)
+    resp.set_etag(etag)
+    return resp
+
+# (match list, frozenset of its "date" values) for the schedule match-day check.
+_MATCH_DATES: Tuple[Any, frozenset] = (None, frozenset())
+
+
+def _match_dates(matches: List[Dict[str, Any]]) -> frozenset:
+    """Dates present in `matches`, cached for the most recent list (the full fixtures list on unfiltered requests)."""
+    global _MATCH_DATES
+    src, dates = _MATCH_DATES
+    if src is not matches:
+        dates = frozenset(m.get("date") for m in matches if m.get("date"))
+        _MATCH_DATES = (matches, dates)
+    return dates
+
+
+# [epoch second, local date ISO, UTC "%Y-%m-%dT%H:%M:%SZ"] — both strings only change once a second.
+_SCHEDULE_CLOCK: List[Any] = [0, "", ""]
+
+
+def _schedule_clock() -> Tuple[str, str]:
+    """(today's local date, now in UTC) as schedule_json compares them, formatted at most once a second."""
+    now = int(time.time())
+    sc = _SCHEDULE_CLOCK
+    if sc[0] != now:
+        sc[1] = date.fromtimestamp(now).isoformat()
+        sc[2] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        sc[0] = now
+    return sc[1], sc[2]
+
+
+# Encoded body of the last unfiltered /schedule.json, valid while the fixture list object, the date,
+# the next match and the banner are unchanged (a _json_with_etag cache_entry).
+_SCHEDULE_WIRE: Dict[str, Any] = {}
+
 
 @app.route("/schedule.json")
 def schedule_json():
@@ -5941,36 +7046,44 @@ def schedule_json():
       scope= all   (Dallas-only removed)
       q= search text (team, venue, group, date)
     """
+    global _SCHEDULE_WIRE
     scope = "all"  # Global app: always show all matches
-    q = request.args.get("q") or ""
+    q = request.args.get("q", "")
 
     try:
         matches = filter_matches(scope=scope, q=q)
 
-        today = datetime.now().date()
-        if scope == "all":
-            # "match day" means: any match today (global)
-            is_match = any(m.get("date") == today.isoformat() for m in matches)
-        else:
-            is_match = any(m.get("date") == today.isoformat() for m in matches)
+        today, now_utc = _schedule_clock()
+        # "match day" means: any match today (global)
+        is_match = today in _match_dates(matches)
 
         # next match (by datetime_utc already sorted in load_all_matches/filter_matches)
         nxt = None
-        now_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         for m in matches:
             if (m.get("datetime_utc") or "") >= now_utc:
                 nxt = m
                 break
 
-        return jsonify({
+        banner = BUSINESS_RULES.get("match_day_banner", "")
+        entry = None
+        if not q:
+            # Unfiltered requests get the cached fixture list itself: reuse its encoded body + ETag.
+            entry = _SCHEDULE_WIRE
+            if not (entry.get("matches") is matches and entry.get("next") is nxt
+                    and entry.get("today") == today and entry.get("banner") == banner):
+                entry = _SCHEDULE_WIRE = {"matches": matches, "next": nxt, "today": today, "banner": banner}
+
+        # ETag over the encoded body: unchanged schedules revalidate with an empty 304.
+        resp = _json_with_etag({
             "scope": scope,
             "query": q,
-            "today": today.isoformat(),
+            "today": today,
             "is_match_day": bool(is_match),
-            "match_day_banner": BUSINESS_RULES.get("match_day_banner", ""),
+            "match_day_banner": banner,
             "next_match": nxt,
             "matches": matches,
-        })
+        }, entry)
+        return resp
     except Exception as e:
         return jsonify({
             "scope": scope,
@@ -6262,6 +7375,31 @@ QUALIFIED_SOURCE_URL = os.environ.get(
     "https://en.wikipedia.org/api/rest_v1/page/html/2026_FIFA_World_Cup",
 )
 
+_TEAM_PLACEHOLDER_WORDS = frozenset({"tbd", "to be decided", "to be determined", "winner", "loser", "n/a"})
+# (fixtures list, sorted team names) from the last _local_country_list() computation.
+_LOCAL_COUNTRIES_CACHE: Tuple[Any, Tuple[str, ...]] = (None, ())
+
+
+def _is_real_team(name: str) -> bool:
+    """False for fixture placeholders ("1A", "3ABCDF", "TBD", "Match 12", "BOL/SUR/IRQ")."""
+    n = (name or "").strip()
+    if not n:
+        return False
+    # Common placeholders / undecided tokens
+    if n.lower() in _TEAM_PLACEHOLDER_WORDS:
+        return False
+    # Group/slot placeholders like "1A", "2B", "3ABCDF" etc.
+    if _RE_SLOT_PLACEHOLDER.fullmatch(n):
+        return False
+    # Any remaining digits usually indicate placeholders ("Match 12", "3rd Place", etc.)
+    if _RE_DIGIT.search(n):
+        return False
+    # Slash-delimited options are not a single participant (e.g., "BOL/SUR/IRQ")
+    if "/" in n:
+        return False
+    return True
+
+
 def _local_country_list() -> List[str]:
     """Return World Cup 2026 participant list derived from fixtures (no network).
 
@@ -6271,28 +7409,19 @@ def _local_country_list() -> List[str]:
     Some fixture sources include *placeholders* during qualification or bracket setup
     (e.g., "1A", "2B", "DEN/MKD/CZE/IRL"). We intentionally filter those out so the
     Fan Zone selector only shows real teams.
-    """
-    def _is_real_team(name: str) -> bool:
-        n = (name or "").strip()
-        if not n:
-            return False
-        # Common placeholders / undecided tokens
-        if n.lower() in {"tbd", "to be decided", "to be determined", "winner", "loser", "n/a"}:
-            return False
-        # Group/slot placeholders like "1A", "2B", "3ABCDF" etc.
-        if re.fullmatch(r"\d+[A-Za-z]{1,10}", n):
-            return False
-        # Any remaining digits usually indicate placeholders ("Match 12", "3rd Place", etc.)
-        if any(ch.isdigit() for ch in n):
-            return False
-        # Slash-delimited options are not a single participant (e.g., "BOL/SUR/IRQ")
-        if "/" in n:
-            return False
-        return True
 
+    The result is cached per fixtures list: it is only recomputed after load_all_matches()
+    returns a new list (i.e. the fixtures were reloaded).
+    """
+    global _LOCAL_COUNTRIES_CACHE
     try:
+        matches = load_all_matches() or []
+        src, cached = _LOCAL_COUNTRIES_CACHE
+        if src is matches and cached:
+            return list(cached)
+
         teams = set()
-        for match in load_all_matches() or []:
+        for match in matches:
             h = (match.get("home") or "").strip()
             a = (match.get("away") or "").strip()
             if _is_real_team(h):
@@ -6306,45 +7435,17 @@ def _local_country_list() -> List[str]:
             # Ensure hosts present even if a fixture source omits them.
             for host in ["United States", "Canada", "Mexico"]:
                 teams.add(host)
-            return sorted(teams)
+            result = tuple(sorted(teams))
+            _LOCAL_COUNTRIES_CACHE = (matches, result)
+            return list(result)
     except Exception:
         pass
 
     # Hard fallback
     return ["United States", "Canada", "Mexico"]
 
-def _fetch_qualified_teams_remote() -> List[str]:
-    """
-    Fetch the *currently qualified* 2026 World Cup teams from Wikipedia (best-effort).
-
-    We use the MediaWiki API for the "2026 FIFA World Cup qualification" page and
-    extract the "Qualified teams" table specifically. This avoids accidentally
-    returning hundreds of FIFA members.
-    """
-    url = QUALIFIED_SOURCE_URL
-    import urllib.request
-
-    # 1) Fetch HTML (or MediaWiki parse JSON containing HTML)
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "worldcup-concierge/1.0"},
-        method="GET",
-    )
-    with urllib.request.urlopen(req, timeout=12) as resp:
-        raw = resp.read().decode("utf-8", errors="ignore")
-
-    html_blob = raw
-    # If user configured MediaWiki API JSON, extract the HTML blob.
-    if raw.lstrip().startswith("{"):
-        try:
-            data = json.loads(raw)
-            html_blob = (data.get("parse", {}).get("text", {}) or {}).get("*", "") or ""
-        except Exception:
-            html_blob = ""
-
-    if not html_blob:
-        return []
-
+def _qualified_names_regex(html_blob: str) -> Optional[List[str]]:
+    """First-column names of the "Qualified teams" wikitable (regex scan; None if not found)."""
     # 2) Find the "Qualified teams" section and then choose the most likely table.
     # We do NOT assume the first table is the right one (Wikipedia pages often have
     # navigation/other tables near section headers).
@@ -6362,7 +7463,7 @@ def _fetch_qualified_teams_remote() -> List[str]:
         # Some renderings use a <span id="Qualified_teams"> marker.
         anchor_pos = html_blob.find('<span id="Qualified_teams"')
     if anchor_pos == -1:
-        return []
+        return None
 
     sub = html_blob[anchor_pos:]
 
@@ -6374,31 +7475,153 @@ def _fetch_qualified_teams_remote() -> List[str]:
         flags=re.S | re.I,
     )
 
-    def _looks_like_qualified_table(tbl: str) -> bool:
-        """Heuristic: pick the actual "Qualified teams" table, not nearby nav/summary tables."""
-        t = tbl.lower()
-        # Must have a "Team" header.
-        if not re.search(r">\s*team\s*<", t):
-            return False
-        # Must have at least one of the usual columns.
-        if not any(k in t for k in ["qualification", "qualified", "method", "date"]):
-            return False
-        # Should not be a navbox.
-        if "navbox" in t or "nowrap" in t and "navbox" in t:
-            return False
-        return True
+    def _looks_like_qualified_table(tbl: str) -> bool:
+        """Heuristic: pick the actual "Qualified teams" table, not nearby nav/summary tables."""
+        t = tbl.lower()
+        # Must have a "Team" header.
+        if not re.search(r">\s*team\s*<", t):
+            return False
+        # Must have at least one of the usual columns.
+        if not any(k in t for k in ["qualification", "qualified", "method", "date"]):
+            return False
+        # Should not be a navbox.
+        if "navbox" in t or "nowrap" in t and "navbox" in t:
+            return False
+        return True
+
+    table = ""
+    for cand in candidates[:6]:
+        if _looks_like_qualified_table(cand):
+            table = cand
+            break
+    if not table and candidates:
+        table = candidates[0]
+    if not table:
+        return None
+
+    # Extract team names from the first column of each row.
+    names: List[str] = []
+    for row in re.findall(r"<tr[^>]*>(.*?)</tr>", table, flags=re.S | re.I):
+        # First cell in the row
+        cell_m = re.search(r"<t[hd][^>]*>(.*?)</t[hd]>", row, flags=re.S | re.I)
+        if not cell_m:
+            continue
+        cell = cell_m.group(1)
+
+        # Prefer the first wiki link text that isn't a File:/Category:/Help: etc.
+        link_m = None
+        for m in re.finditer(r"<a[^>]+href=\"([^\"]+)\"[^>]*>([^<]+)</a>", cell, flags=re.I):
+            href = (m.group(1) or "").strip()
+            txt = (m.group(2) or "").strip()
+            if not txt:
+                continue
+            if href.startswith("/wiki/") and ":" not in href:
+                link_m = m
+                break
+        name = (link_m.group(2) if link_m else re.sub(r"<[^>]+>", " ", cell))
+        name = re.sub(r"\s+", " ", name).strip()
+        name = re.sub(r"\s*\[\d+\]\s*", " ", name).strip()
+
+        names.append(name)
+    return names
+
+
+# Compiled once; used by _qualified_names_lxml.
+_XP_QUALIFIED_ANCHOR = None
+_XP_FOLLOWING_WIKITABLES = None
+if lxml is not None:
+    _XP_QUALIFIED_ANCHOR = lxml.etree.XPath('//*[@id="Qualified_teams" or @id="Qualified_teams_and_rankings"]')
+    _XP_FOLLOWING_WIKITABLES = lxml.etree.XPath(
+        'following::table[contains(concat(" ", normalize-space(@class), " "), " wikitable ")][position() <= 6]'
+    )
+
+
+def _qualified_names_lxml(html_blob: str) -> Optional[List[str]]:
+    """Same as _qualified_names_regex, but one lxml parse + XPath instead of regex passes."""
+    doc = lxml.html.fromstring(html_blob)
+    anchors = _XP_QUALIFIED_ANCHOR(doc)
+    if not anchors:
+        return None
+    candidates = _XP_FOLLOWING_WIKITABLES(anchors[0])
+
+    def _looks_like_qualified_table(tbl) -> bool:
+        if "navbox" in (tbl.get("class") or ""):
+            return False
+        if not any((c.text_content() or "").strip().lower() == "team" for c in tbl.iter("th", "td")):
+            return False
+        t = (tbl.text_content() or "").lower()
+        return any(k in t for k in ["qualification", "qualified", "method", "date"])
+
+    table = next((c for c in candidates if _looks_like_qualified_table(c)), None)
+    if table is None and candidates:
+        table = candidates[0]
+    if table is None:
+        return None
+
+    names: List[str] = []
+    for row in table.iter("tr"):
+        cell = next((c for c in row if c.tag in ("th", "td")), None)
+        if cell is None:
+            continue
+        # Prefer the first wiki link text that isn't a File:/Category:/Help: etc.
+        name = ""
+        for a in cell.iter("a"):
+            href = (a.get("href") or "").strip()
+            txt = (a.text_content() or "").strip()
+            if txt and href.startswith("/wiki/") and ":" not in href:
+                name = txt
+                break
+        if not name:
+            name = cell.text_content() or ""
+        name = re.sub(r"\s+", " ", name).strip()
+        name = re.sub(r"\s*\[\d+\]\s*", " ", name).strip()
+        names.append(name)
+    return names
+
+
+def _fetch_qualified_teams_remote() -> List[str]:
+    """
+    Fetch the *currently qualified* 2026 World Cup teams from Wikipedia (best-effort).
+
+    We use the MediaWiki API for the "2026 FIFA World Cup qualification" page and
+    extract the "Qualified teams" table specifically. This avoids accidentally
+    returning hundreds of FIFA members.
+    """
+    url = QUALIFIED_SOURCE_URL
+    import urllib.request
+
+    # 1) Fetch HTML (or MediaWiki parse JSON containing HTML)
+    req = urllib.request.Request(
+        url,
+        headers={"User-Agent": "worldcup-concierge/1.0"},
+        method="GET",
+    )
+    with urllib.request.urlopen(req, timeout=12) as resp:
+        raw = resp.read().decode("utf-8", errors="ignore")
+
+    html_blob = raw
+    # If user configured MediaWiki API JSON, extract the HTML blob.
+    if raw.lstrip().startswith("{"):
+        try:
+            data = json.loads(raw)
+            html_blob = (data.get("parse", {}).get("text", {}) or {}).get("*", "") or ""
+        except Exception:
+            html_blob = ""
 
-    table = ""
-    for cand in candidates[:6]:
-        if _looks_like_qualified_table(cand):
-            table = cand
-            break
-    if not table and candidates:
-        table = candidates[0]
-    if not table:
+    if not html_blob:
+        return []
+
+    if lxml is not None:
+        try:
+            names = _qualified_names_lxml(html_blob)
+        except Exception:
+            names = _qualified_names_regex(html_blob)
+    else:
+        names = _qualified_names_regex(html_blob)
+    if names is None:
         return []
 
-    # 3) Extract team names from the first column of each row.
+    # 3) Drop header/confederation rows and duplicates.
     teams: List[str] = []
     skip_exact = {
         "team",
@@ -6420,27 +7643,7 @@ def _fetch_qualified_teams_remote() -> List[str]:
         "to be determined",
     ]
 
-    for row in re.findall(r"<tr[^>]*>(.*?)</tr>", table, flags=re.S | re.I):
-        # First cell in the row
-        cell_m = re.search(r"<t[hd][^>]*>(.*?)</t[hd]>", row, flags=re.S | re.I)
-        if not cell_m:
-            continue
-        cell = cell_m.group(1)
-
-        # Prefer the first wiki link text that isn't a File:/Category:/Help: etc.
-        link_m = None
-        for m in re.finditer(r"<a[^>]+href=\"([^\"]+)\"[^>]*>([^<]+)</a>", cell, flags=re.I):
-            href = (m.group(1) or "").strip()
-            txt = (m.group(2) or "").strip()
-            if not txt:
-                continue
-            if href.startswith("/wiki/") and ":" not in href:
-                link_m = m
-                break
-        name = (link_m.group(2) if link_m else re.sub(r"<[^>]+>", " ", cell))
-        name = re.sub(r"\s+", " ", name).strip()
-        name = re.sub(r"\s*\[\d+\]\s*", " ", name).strip()
-
+    for name in names:
         low = name.lower()
         if not name or low in skip_exact:
             continue
@@ -6511,17 +7714,35 @@ _live_payload_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
 _stand_payload_cache: Dict[str, Dict[str, Any]] = {}
 _payload_cache_ttl_sec = 15
 
-def _json_with_etag(payload: Dict[str, Any]):
-    """Return JSON with a stable ETag header (always 200).
+def _json_with_etag(payload: Dict[str, Any], cache_entry: Optional[Dict[str, Any]] = None):
+    """Return JSON with a stable ETag header.
+
+    Why 200 by default: some fetch() code treats HTTP 304 as an error (res.ok === false),
+    which can look like the app is 'broken'. Responses are no-store, so browsers never
+    revalidate on their own; only a client that explicitly sends If-None-Match gets a 304.
 
-    Why: some fetch() code treats HTTP 304 as an error (res.ok === false),
-    which can look like the app is 'broken'. This keeps reliability benefits
-    (ETag + short server cache) without ever returning 304.
+    cache_entry: the server-cache dict holding this payload; the encoded body + ETag are
+    kept on it ("_wire") so cache hits skip serialization and hashing.
     """
-    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
-    etag = hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
-    resp = jsonify(payload)
-    resp.headers["ETag"] = f"\"{etag}\""
+    wire = cache_entry.get("_wire") if cache_entry is not None else None
+    if wire is None:
+        body = None
+        if orjson is not None:
+            try:
+                body = orjson.dumps(payload, default=app.json.default, option=_OrjsonProvider._OPTS)
+            except Exception:
+                body = None
+        if body is None:
+            body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        wire = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+        if cache_entry is not None:
+            cache_entry["_wire"] = wire
+    body, etag = wire
+    if _etag_matches(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(body, mimetype=app.json.mimetype)
+    resp.set_etag(etag)
     resp.headers["Cache-Control"] = "no-store"
     return resp
 
@@ -6547,7 +7768,7 @@ def worldcup_live_json():
     cache_key = (scope, str(window_h))
     c = _live_payload_cache.get(cache_key)
     if c and (_now_ts() - int(c.get("_cached_at", 0)) <= _payload_cache_ttl_sec):
-        return _json_with_etag(c["payload"])
+        return _json_with_etag(c["payload"], c)
     try:
         matches = filter_matches(scope=scope, q="")
     except Exception:
@@ -6582,9 +7803,31 @@ def worldcup_live_json():
         },
         "note": "Scores are shown only when present in the fixture feed. For true real-time live scores, wire in a licensed live data provider/API key.",
     }
-    _live_payload_cache[cache_key] = {"_cached_at": _now_ts(), "payload": payload}
-    _stand_payload_cache[scope] = {"_cached_at": _now_ts(), "payload": payload}
-    return _json_with_etag(payload)
+    entry = {"_cached_at": _now_ts(), "payload": payload}
+    _live_payload_cache[cache_key] = entry
+    return _json_with_etag(payload, entry)
+class _StandingRow:
+    """Mutable per-team counters for _compute_group_standings (slots: no per-row dict)."""
+    __slots__ = ("team", "p", "w", "d", "l", "gf", "ga", "pts")
+
+    def __init__(self, team: str):
+        self.team = team
+        self.p = self.w = self.d = self.l = 0
+        self.gf = self.ga = self.pts = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "team": self.team,
+            "p": self.p, "w": self.w, "d": self.d, "l": self.l,
+            "gf": self.gf, "ga": self.ga, "gd": self.gf - self.ga,
+            "pts": self.pts,
+        }
+
+
+def _standing_sort_key(r: _StandingRow) -> Tuple[int, int, int, str]:
+    return (r.pts, r.gf - r.ga, r.gf, r.team)
+
+
 def _compute_group_standings(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Compute group standings from group fixtures.
 
@@ -6593,38 +7836,34 @@ def _compute_group_standings(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
         so the Groups tab never renders empty.
       - If scores are present (home_score/away_score), it updates P/W/D/L/GF/GA/PTS.
     """
-    groups: Dict[str, Dict[str, Any]] = {}
-
-    def ensure_team(g: str, team: str):
-        if not team:
-            return
-        groups.setdefault(g, {})
-        groups[g].setdefault(team, {
-            "team": team,
-            "p": 0, "w": 0, "d": 0, "l": 0,
-            "gf": 0, "ga": 0, "gd": 0,
-            "pts": 0,
-        })
+    groups: Dict[str, Dict[str, _StandingRow]] = {}
 
-    # Pass 1: seed groups + team list from *all* group fixtures (scores or not)
+    # One pass: seed groups + team list from *all* group fixtures (scores or not),
+    # and apply results where scores exist.
     for m in matches:
-        stage = (m.get("stage") or "").strip()
-        if not stage.lower().startswith("group"):
+        g = (m.get("stage") or "").strip()
+        if not g.lower().startswith("group"):
             continue
-        g = stage
         home = (m.get("home") or "").strip() or "TBD"
         away = (m.get("away") or "").strip() or "TBD"
         # Avoid polluting tables with TBD vs TBD when teams aren't known yet
+        if home == "TBD" and away == "TBD":
+            continue
+        teams = groups.get(g)
+        if teams is None:
+            teams = groups[g] = {}
+        ht = at = None
         if home != "TBD":
-            ensure_team(g, home)
+            ht = teams.get(home)
+            if ht is None:
+                ht = teams[home] = _StandingRow(home)
         if away != "TBD":
-            ensure_team(g, away)
-
-    # Pass 2: apply results where scores exist
-    for m in matches:
-        stage = (m.get("stage") or "").strip()
-        if not stage.lower().startswith("group"):
+            at = teams.get(away)
+            if at is None:
+                at = teams[away] = _StandingRow(away)
+        if ht is None or at is None:
             continue
+
         hs = m.get("home_score")
         as_ = m.get("away_score")
         if hs is None or as_ is None:
@@ -6634,45 +7873,30 @@ def _compute_group_standings(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
         except Exception:
             continue
 
-        g = stage
-        home = (m.get("home") or "").strip() or "TBD"
-        away = (m.get("away") or "").strip() or "TBD"
-        if home == "TBD" or away == "TBD":
-            continue
-
-        ensure_team(g, home)
-        ensure_team(g, away)
-
-        ht = groups[g][home]
-        at = groups[g][away]
-
-        ht["p"] += 1; at["p"] += 1
-        ht["gf"] += hs; ht["ga"] += as_
-        at["gf"] += as_; at["ga"] += hs
+        ht.p += 1; at.p += 1
+        ht.gf += hs; ht.ga += as_
+        at.gf += as_; at.ga += hs
 
         if hs > as_:
-            ht["w"] += 1; at["l"] += 1
-            ht["pts"] += 3
+            ht.w += 1; at.l += 1
+            ht.pts += 3
         elif hs < as_:
-            at["w"] += 1; ht["l"] += 1
-            at["pts"] += 3
+            at.w += 1; ht.l += 1
+            at.pts += 3
         else:
-            ht["d"] += 1; at["d"] += 1
-            ht["pts"] += 1; at["pts"] += 1
+            ht.d += 1; at.d += 1
+            ht.pts += 1; at.pts += 1
 
-    # finalize GD + sorting
+    # finalize sorting + GD
     out: Dict[str, Any] = {}
     for g, teams in groups.items():
         rows = list(teams.values())
-        for r in rows:
-            r["gd"] = int(r["gf"]) - int(r["ga"])
         # If no points yet, keep a stable alphabetical order; otherwise standard sorting.
-        any_points = any(int(r.get("pts", 0) or 0) > 0 or int(r.get("p", 0) or 0) > 0 for r in rows)
-        if any_points:
-            rows.sort(key=lambda r: (r["pts"], r["gd"], r["gf"], r["team"]), reverse=True)
+        if any(r.pts > 0 or r.p > 0 for r in rows):
+            rows.sort(key=_standing_sort_key, reverse=True)
         else:
-            rows.sort(key=lambda r: (r["team"],))
-        out[g] = rows
+            rows.sort(key=operator.attrgetter("team"))
+        out[g] = [r.as_dict() for r in rows]
 
     return out
 
@@ -6682,7 +7906,7 @@ def worldcup_standings_json():
     scope = (request.args.get("scope") or "all").lower().strip()
     c = _stand_payload_cache.get(scope)
     if c and (_now_ts() - int(c.get("_cached_at", 0)) <= _payload_cache_ttl_sec):
-        return _json_with_etag(c["payload"])
+        return _json_with_etag(c["payload"], c)
     try:
         matches = filter_matches(scope=scope, q="")
     except Exception:
@@ -6696,7 +7920,9 @@ def worldcup_standings_json():
         "count_groups": len(standings),
         "note": "Groups are seeded from fixtures; points update automatically once scores are present in the feed.",
     }
-    return _json_with_etag(payload)
+    entry = {"_cached_at": _now_ts(), "payload": payload}
+    _stand_payload_cache[scope] = entry
+    return _json_with_etag(payload, entry)
 
 
 @app.route("/worldcup/feed_status.json")
@@ -6745,7 +7971,7 @@ def test_sheet():
             "time": "7:00 pm",
             "party_size": 4,
             "language": "en",
-        })
+        }, sync=True)
         return jsonify({"ok": True, "sheet": SHEET_NAME, "message": "✅ Test row appended."})
     except Exception as e:
         return jsonify({"ok": False, "sheet": SHEET_NAME, "error": repr(e)}), 500
@@ -6767,27 +7993,29 @@ def _handle_reservation_turn(sess: Dict[str, Any], msg: str, lang: str, remainin
       * finishes the reservation and returns a confirmation reply, OR
       * asks for the next missing field.
     """
+    raw, lower = _prepare_text(msg)
+
     # Allow VIP to be set at any time during reservation flow
-    if re.search(r"\bvip\b", msg.lower()):
+    if re.search(r"\bvip\b", lower):
         sess["lead"]["vip"] = "Yes"
 
     # Extract structured fields from free text
-    d_iso = extract_date(msg)
+    d_iso = extract_date(raw, lower)
     if d_iso:
         if validate_date_iso(d_iso):
             sess["lead"]["date"] = d_iso
         else:
-            return {"reply": LANG[lang]["ask_date"], "rate_limit_remaining": remaining}
+            return {"reply": tr(lang, "ask_date"), "rate_limit_remaining": remaining}
 
-    t = extract_time(msg)
+    t = extract_time(raw, lower)
     if t:
         sess["lead"]["time"] = t
 
-    ps = extract_party_size(msg)
+    ps = extract_party_size(raw, lower)
     if ps:
         sess["lead"]["party_size"] = ps
 
-    ph = extract_phone(msg)
+    ph = extract_phone(raw)
     if ph:
         sess["lead"]["phone"] = ph
 
@@ -6795,7 +8023,7 @@ def _handle_reservation_turn(sess: Dict[str, Any], msg: str, lang: str, remainin
 
     # Name extraction – only once we already have date, time, and party_size.
     if not lead.get("name") and lead.get("date") and lead.get("time") and lead.get("party_size"):
-        cand = extract_name_candidate(msg)
+        cand = extract_name_candidate(raw, lower)
         if cand:
             lead["name"] = cand
 
@@ -6803,10 +8031,10 @@ def _handle_reservation_turn(sess: Dict[str, Any], msg: str, lang: str, remainin
     rule = apply_business_rules(lead)
     if rule == "party":
         sess["mode"] = "idle"
-        return {"reply": LANG[lang]["rule_party"], "rate_limit_remaining": remaining}
+        return {"reply": tr(lang, "rule_party"), "rate_limit_remaining": remaining}
     if rule == "closed":
         sess["mode"] = "idle"
-        return {"reply": LANG[lang]["rule_closed"], "rate_limit_remaining": remaining}
+        return {"reply": tr(lang, "rule_closed"), "rate_limit_remaining": remaining}
 
     # If complete, save + confirm
     if lead.get("date") and lead.get("time") and lead.get("party_size") and lead.get("name") and lead.get("phone"):
@@ -6846,7 +8074,7 @@ def _handle_reservation_turn(sess: Dict[str, Any], msg: str, lang: str, remainin
             pass
 
         sess["mode"] = "idle"
-        saved_msg = ("✅ Added to waitlist!" if str(lead.get("status", "")).strip().lower() == "waitlist" else LANG[lang]["saved"])
+        saved_msg = ("✅ Added to waitlist!" if str(lead.get("status", "")).strip().lower() == "waitlist" else tr(lang, "saved"))
         confirm = (
             f"{saved_msg}\n\n"
             f"Your reservation ID is: **{rid}** — save it!\n"
@@ -7114,7 +8342,7 @@ def update_reservation_by_id(reservation_id: str, updates: Dict[str, Any]) -> Op
         if updated == 0:
             return _get_reservation_by_id(reservation_id)
         try:
-            _LEADS_CACHE_BY_VENUE.pop(_slugify_venue_id(vid), None)
+            _invalidate_leads_cache(vid)
         except Exception:
             pass
         return _get_reservation_by_id(reservation_id)
@@ -7253,45 +8481,69 @@ def _modify_awaiting_prompt(field: str) -> str:
 def _extract_modification(msg: str) -> Dict[str, Any]:
     """Extract requested reservation changes from message. Returns dict with date, time, party_size, name, phone, vip (only set if parsed)."""
     out = {}
-    t = extract_time(msg)
+    raw, lower = _prepare_text(msg)
+    t = extract_time(raw, lower)
     if t:
         out["time"] = t
-    d = extract_date(msg)
+    d = extract_date(raw, lower)
     if d and validate_date_iso(d):
         out["date"] = d
-    ps = extract_party_size(msg)
+    ps = extract_party_size(raw, lower)
     if ps is not None:
         out["party_size"] = ps
     name = _extract_modification_name(msg)
     if name:
         out["name"] = name
-    ph = extract_phone(msg)
+    ph = extract_phone(raw)
     if ph:
         out["phone"] = ph
     # NEW: Extract VIP status from modification request
-    if re.search(r"\bvip\b", msg.lower()):
+    if re.search(r"\bvip\b", lower):
         out["vip"] = "Yes"
     return out
 
 
+# Customer-safe fallback (no “chat unavailable”), still routes + continues booking
+_CHAT_FALLBACK_REPLY = (
+    "For accurate details, please check the **Menu** or **Schedule** tabs on this page.\n\n"
+    "I can still help with a reservation — **how many guests** and **what time**?"
+)
+_CHAT_FALLBACK_BODY: List[bytes] = []  # encoded {"reply": fallback, "rate_limit_remaining": 0}, built on first use
+
+
+def _chat_fallback_response():
+    """The constant error-path /chat reply, encoded once."""
+    if not _CHAT_FALLBACK_BODY:
+        resp = _json_response({"reply": _CHAT_FALLBACK_REPLY, "rate_limit_remaining": 0})
+        _CHAT_FALLBACK_BODY.append(resp.get_data())
+    return Response(_CHAT_FALLBACK_BODY[0], mimetype="application/json")
+
+
 @app.route("/chat", methods=["POST"])
 def chat():
     try:
         ip = client_ip()
         allowed, remaining = check_rate_limit(ip)
         if not allowed:
-            return jsonify({
+            return _json_response({
                 "reply": "⚠️ Too many requests. Please wait a minute and try again.",
                 "rate_limit_remaining": 0,
-            }), 429
+            }, 429)
 
         # ✅ NEW: block chat for inactive venues (prevents lingering fan access)
         vid = _venue_id()
         if not _venue_is_active(vid):
-            return jsonify({
+            return _json_response({
                 "reply": "This venue is currently inactive.",
                 "rate_limit_remaining": remaining,
-            }), 403
+            }, 403)
+
+        # An empty body can't carry a message (get_json would raise into the fallback below):
+        # answer with the pre-encoded fallback without touching the JSON parser. No Content-Length
+        # only means empty when the body isn't chunked.
+        clen = request.content_length
+        if clen == 0 or (clen is None and "chunked" not in (request.headers.get("Transfer-Encoding") or "").lower()):
+            return _chat_fallback_response()
 
         data = request.get_json(force=True) or {}
 
@@ -7313,7 +8565,7 @@ def chat():
         sess["lead"]["language"] = lang
 
         if not msg:
-            return jsonify({"reply": "Please type a message.", "rate_limit_remaining": remaining})
+            return _json_response({"reply": "Please type a message.", "rate_limit_remaining": remaining})
 
         # Apply name/phone/time/date/party when we previously asked for that field for the recalled reservation (supports multiple in sequence)
         if sess.get("recalled_reservation_id") and sess.get("modify_awaiting"):
@@ -7416,7 +8668,7 @@ def chat():
             else:
                 sess["modify_awaiting"] = awaiting
             if reply is not None:
-                return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+                return _json_response({"reply": reply, "rate_limit_remaining": remaining})
 
         # Recall: (1) bare "WC-XXXX" or (2) "recall WC-XXXX" or (3) "recall with this id" using last-entered ID
         rid = None
@@ -7445,7 +8697,7 @@ def chat():
                         reply = "✅ Reservation upgraded to VIP!\n\n" + format_reservation_row(updated_row)
                     else:
                         reply = "I couldn't upgrade that reservation to VIP. Please try again or contact the venue."
-                    return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+                    return _json_response({"reply": reply, "rate_limit_remaining": remaining})
                 
                 mod = _extract_modification(msg)
                 if mod:
@@ -7461,10 +8713,10 @@ def chat():
                 sess.pop("recalled_reservation_id", None)
                 sess.pop("recalled_reservation", None)
                 reply = format_reservation_row(None)
-            return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+            return _json_response({"reply": reply, "rate_limit_remaining": remaining})
         if want_recall(msg, lang) and not rid:
             reply = "To recall a reservation, type **recall** followed by your reservation ID (e.g. **recall WC-XXXX**), or paste your ID (e.g. WC-BAC819C0) and I'll look it up."
-            return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+            return _json_response({"reply": reply, "rate_limit_remaining": remaining})
 
         # NEW: Handle "make it vip" specifically when a reservation is recalled
         if sess.get("recalled_reservation_id") and re.search(r"\b(?:make|mark|set|upgrade)\s+(?:it|this)\s+(?:to\s+)?vip\b", msg.lower()):
@@ -7475,7 +8727,7 @@ def chat():
                 reply = "✅ Reservation upgraded to VIP!\n\n" + format_reservation_row(updated_row)
             else:
                 reply = "I couldn't upgrade that reservation to VIP. Please try **recall " + rid + "** again, or contact the venue."
-            return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+            return _json_response({"reply": reply, "rate_limit_remaining": remaining})
 
         # Modify existing (recalled) reservation: keep context, don't reset to new flow (BUG-CHAT-001)
         if _want_modify_reservation(msg) and sess.get("recalled_reservation_id"):
@@ -7501,7 +8753,7 @@ def chat():
                 else:
                     sess.pop("modify_awaiting", None)
                     reply = "What would you like to change — **time**, **date**, **party size**, **name**, or **phone**? Tell me the new value (e.g. 11 pm or Ahmad)."
-            return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+            return _json_response({"reply": reply, "rate_limit_remaining": remaining})
 
         # If user wants to modify but no recalled context, direct them to recall first (skip when already making a new reservation)
         if _want_modify_reservation(msg) and sess.get("mode") != "reserving":
@@ -7509,7 +8761,7 @@ def chat():
                 "Please recall your reservation first: type **recall WC-XXXX** with your reservation ID, "
                 "then tell me what you'd like to change (e.g. time, date, or party size)."
             )
-            return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+            return _json_response({"reply": reply, "rate_limit_remaining": remaining})
 
         # Start reservation flow if user indicates intent (first turn for this reservation)
         if sess["mode"] == "idle" and want_reservation(msg):
@@ -7517,10 +8769,10 @@ def chat():
 
             # Match-day ops toggles
             if ops.get("vip_only") and not re.search(r"\bvip\b", msg.lower()):
-                return jsonify({"reply": "🔒 Reservations are VIP-only right now. If you have VIP access, type **VIP** to continue. Otherwise, I can add you to the waitlist.", "rate_limit_remaining": remaining})
+                return _json_response({"reply": "🔒 Reservations are VIP-only right now. If you have VIP access, type **VIP** to continue. Otherwise, I can add you to the waitlist.", "rate_limit_remaining": remaining})
 
             if ops.get("pause_reservations") and not ops.get("waitlist_mode"):
-                return jsonify({"reply": "⏸️ Reservations are temporarily paused. Please check back soon, or ask a staff member for help.", "rate_limit_remaining": remaining})
+                return _json_response({"reply": "⏸️ Reservations are temporarily paused. Please check back soon, or ask a staff member for help.", "rate_limit_remaining": remaining})
 
             sess["mode"] = "reserving"
             sess.pop("recalled_reservation_id", None)
@@ -7539,13 +8791,13 @@ def chat():
                 sess["lead"]["name"] = ""
 
             payload = _handle_reservation_turn(sess, msg, lang, remaining)
-            return jsonify(payload)
+            return _json_response(payload)
 
         # If reserving, keep collecting fields deterministically
         if sess["mode"] == "reserving":
             payload = _handle_reservation_turn(sess, msg, lang, remaining)
             # _handle_reservation_turn may have set mode back to idle on completion/rule hit.
-            return jsonify(payload)
+            return _json_response(payload)
 
         # If user asks to "make it VIP" after a reservation, provide clear guidance
         low = msg.lower()
@@ -7563,13 +8815,13 @@ def chat():
                     "share it with your host or manager and they can mark it as VIP in the Admin Leads view.\n\n"
                     "If you’d like, I can also help you make a new reservation now — just tell me the date, time, and party size."
                 )
-            return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+            return _json_response({"reply": reply, "rate_limit_remaining": remaining})
 
         # Deterministic replies: thank you (polished welcome) + menu/specials (direct to Menu tab only)
         if _is_thanks(msg):
-            return jsonify({"reply": _thanks_reply(lang), "rate_limit_remaining": remaining})
+            return _json_response({"reply": _thanks_reply(lang), "rate_limit_remaining": remaining})
         if _is_menu_or_specials_question(msg):
-            return jsonify({
+            return _json_response({
                 "reply": _menu_redirect_reply(lang),
                 "rate_limit_remaining": remaining,
                 "navigate_to": "menu",
@@ -7616,24 +8868,16 @@ Rules:
             # Safety: if the model quoted menu/specials/prices (e.g. from business profile), redirect to Menu tab
             if re.search(r"\$\s*\d+|\d+\s*dollars?|(today'?s?|game\s+day)\s+special|(\d+\s*beers?|bucket\s+for)", reply.lower()):
                 reply = _menu_redirect_reply(lang)
-                return jsonify({"reply": reply, "rate_limit_remaining": remaining, "navigate_to": "menu"})
+                return _json_response({"reply": reply, "rate_limit_remaining": remaining, "navigate_to": "menu"})
 
-            return jsonify({"reply": reply, "rate_limit_remaining": remaining})
+            return _json_response({"reply": reply, "rate_limit_remaining": remaining})
         except Exception as e:
             # Customer-safe fallback (no “chat unavailable”), still routes + continues booking
-            fallback = (
-                "For accurate details, please check the **Menu** or **Schedule** tabs on this page.\n\n"
-                "I can still help with a reservation — **how many guests** and **what time**?"
-            )
-            return jsonify({"reply": fallback, "rate_limit_remaining": remaining}), 200
+            return _json_response({"reply": _CHAT_FALLBACK_REPLY, "rate_limit_remaining": remaining})
 
     except Exception as e:
         # Never break the UI: always return JSON.
-        fallback = (
-            "For accurate details, please check the **Menu** or **Schedule** tabs on this page.\n\n"
-            "I can still help with a reservation — **how many guests** and **what time**?"
-        )
-        return jsonify({"reply": fallback, "rate_limit_remaining": 0}), 200
+        return _chat_fallback_response()
 
 
 @app.route("/chat/clear", methods=["POST"])
@@ -7674,13 +8918,11 @@ def chat_clear():
 #   - quick filters + metrics
 #   - export CSV
 # ============================================================
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"})
+
+
 def _hesc(s: Any) -> str:
-    s = "" if s is None else str(s)
-    return (s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-             .replace("'", "&#39;"))
+    return ("" if s is None else str(s)).translate(_HTML_ESCAPE_TABLE)
 
 
 # ============================================================
@@ -7695,9 +8937,220 @@ DATA_DIR = os.environ.get("DATA_DIR", os.path.join("/tmp", "worldcup_app_data"))
 os.makedirs(DATA_DIR, exist_ok=True)
 CONFIG_FILE = os.path.join(DATA_DIR, "app_config_{venue}.json")
 AUDIT_LOG_FILE = os.path.join(DATA_DIR, "audit_log.jsonl")
+# Byte offset of the newest file entry per event name (8-byte little-endian, one file per event).
+AUDIT_INDEX_DIR = AUDIT_LOG_FILE + ".idx"
 
 NOTIFICATIONS_FILE = os.path.join(DATA_DIR, "notifications.jsonl")
 NOTIFY_WEBHOOK_URL = os.environ.get("NOTIFY_WEBHOOK_URL", "").strip()
+# notifications.jsonl is cut back to the newest 3/4 of this many bytes once it grows past it.
+NOTIFICATIONS_MAX_BYTES = int(os.environ.get("NOTIFICATIONS_MAX_BYTES", str(8 * 1024 * 1024)))
+
+
+class _AppendFile:
+    """Keep-open O_APPEND writer for a JSONL log (no open/close per event).
+
+    Like logging's WatchedFileHandler: if the path is removed or replaced (rotation, a
+    restore), the next write reopens it; any OSError drops the handle and retries once.
+    Writes are unbuffered, so each call lands in the file before it returns.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._ident: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+        self._ident = None
+
+    def _ensure_open(self) -> int:
+        if self._fd is not None:
+            try:
+                st = os.stat(self.path)
+                if (st.st_dev, st.st_ino) != self._ident:
+                    self._close()
+            except FileNotFoundError:
+                self._close()
+        if self._fd is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            st = os.fstat(fd)
+            self._fd, self._ident = fd, (st.st_dev, st.st_ino)
+        return self._fd
+
+    def write(self, data: bytes) -> int:
+        """Append `data`; returns the file offset it was written at."""
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    fd = self._ensure_open()
+                    pos = os.lseek(fd, 0, os.SEEK_END)
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    return pos
+                except OSError:
+                    self._close()
+                    if attempt:
+                        raise
+        return 0
+
+    def keep_tail(self, keep_bytes: int) -> None:
+        """Drop the oldest whole lines so at most `keep_bytes` remain (one mmap pass + atomic replace)."""
+        with self._lock:
+            with open(self.path, "rb") as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    return  # empty file
+                with mm:
+                    size = len(mm)
+                    if size <= keep_bytes:
+                        return
+                    cut = mm.find(b"\n", size - max(0, keep_bytes) - 1)
+                    tail = mm[cut + 1:] if cut >= 0 else b""
+            _atomic_write_bytes(self.path, tail)
+            self._close()
+
+
+_APPEND_FILES: Dict[str, _AppendFile] = {}
+_APPEND_FILES_LOCK = threading.Lock()
+
+
+def _append_bytes(path: str, data: bytes) -> int:
+    """Append to a JSONL file through its shared keep-open handle; returns the start offset."""
+    af = _APPEND_FILES.get(path)
+    if af is None:
+        with _APPEND_FILES_LOCK:
+            af = _APPEND_FILES.setdefault(path, _AppendFile(path))
+    return af.write(data)
+
+
+# Webhook POSTs run off the request thread; the session keeps the connection alive between events.
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wc26-notify")
+_NOTIFY_SESSION = None
+_NOTIFY_SESSION_LOCK = threading.Lock()
+
+
+def _post_notify_webhook(payload: bytes) -> None:
+    """POST one notification to NOTIFY_WEBHOOK_URL (best-effort; runs on _NOTIFY_POOL)."""
+    global _NOTIFY_SESSION
+    try:
+        if requests is not None:
+            if _NOTIFY_SESSION is None:
+                with _NOTIFY_SESSION_LOCK:
+                    if _NOTIFY_SESSION is None:
+                        _NOTIFY_SESSION = requests.Session()
+            _NOTIFY_SESSION.post(NOTIFY_WEBHOOK_URL, data=payload,
+                                 headers={"Content-Type": "application/json"}, timeout=3)
+            return
+        req = urllib.request.Request(
+            NOTIFY_WEBHOOK_URL,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        urllib.request.urlopen(req, timeout=3).close()  # nosec - best effort
+    except Exception:
+        pass
+
+
+def _cap_jsonl(path: str, end: int, max_bytes: int) -> None:
+    """After an append ending at byte `end`, trim `path` to the newest 3/4 of max_bytes if it is over."""
+    if max_bytes > 0 and end > max_bytes:
+        af = _APPEND_FILES.get(path)
+        if af is not None:
+            af.keep_tail(max_bytes * 3 // 4)
+
+
+# ============================================================
+# JSONL append coalescing (notifications, local leads)
+# - Callers enqueue encoded lines; one background thread drains bursts and writes each
+#   file's share with a single write() (up to _JSONL_BATCH_BYTES) on its O_APPEND handle
+# - Entries are only dequeued under _JSONL_FLUSH_LOCK, so file order matches call order
+# - Readers call _jsonl_flush_now() so freshly queued lines are visible
+# - Queued lines are flushed at interpreter exit (registered before the audit writer's hook,
+#   so it runs after it)
+# - PERSIST_ASYNC=0 writes inline (tests / debugging)
+# - Audit lines coalesce separately (_audit_enqueue) because they also go to Redis
+# ============================================================
+_JSONL_PENDING: "collections.deque[Tuple[str, bytes, int]]" = collections.deque()
+_JSONL_COND = threading.Condition()
+_JSONL_FLUSH_LOCK = threading.Lock()
+_JSONL_BATCH_BYTES = 64 * 1024
+_JSONL_THREAD: Optional[threading.Thread] = None
+
+
+def _jsonl_write_batch(batch: List[Tuple[str, bytes, int]]) -> None:
+    """Persist queued (path, line, max_bytes) items: one append per file, then the size cap."""
+    by_path: Dict[str, List[bytes]] = {}
+    caps: Dict[str, int] = {}
+    for path, raw, max_bytes in batch:
+        by_path.setdefault(path, []).append(raw)
+        caps[path] = max_bytes
+    for path, chunks in by_path.items():
+        try:
+            blob = b"".join(chunks)
+            _cap_jsonl(path, _append_bytes(path, blob) + len(blob), caps[path])
+        except Exception:
+            pass
+
+
+def _jsonl_drain_pending() -> None:
+    with _JSONL_FLUSH_LOCK:
+        while True:
+            batch: List[Tuple[str, bytes, int]] = []
+            size = 0
+            with _JSONL_COND:
+                while _JSONL_PENDING and size < _JSONL_BATCH_BYTES:
+                    item = _JSONL_PENDING.popleft()
+                    batch.append(item)
+                    size += len(item[1])
+            if not batch:
+                return
+            _jsonl_write_batch(batch)
+
+
+def _jsonl_flush_now() -> None:
+    """Synchronously persist any queued JSONL lines (call before reading/rewriting those files)."""
+    try:
+        _jsonl_drain_pending()
+    except Exception:
+        pass
+
+
+atexit.register(_jsonl_flush_now)
+
+
+def _jsonl_writer_loop() -> None:
+    while True:
+        try:
+            with _JSONL_COND:
+                while not _JSONL_PENDING:
+                    _JSONL_COND.wait()
+            _jsonl_drain_pending()
+        except Exception:
+            pass
+
+
+def _jsonl_append(path: str, raw: bytes, max_bytes: int = 0) -> None:
+    """Queue one encoded line (newline included) for `path`; max_bytes > 0 caps the file (_cap_jsonl)."""
+    global _JSONL_THREAD
+    if not PERSIST_ASYNC:
+        _jsonl_write_batch([(path, raw, max_bytes)])
+        return
+    with _JSONL_COND:
+        if _JSONL_THREAD is None or not _JSONL_THREAD.is_alive():
+            _JSONL_THREAD = threading.Thread(target=_jsonl_writer_loop, name="wc26-jsonl", daemon=True)
+            _JSONL_THREAD.start()
+        _JSONL_PENDING.append((path, raw, max_bytes))
+        _JSONL_COND.notify()
 
 def _notify(event: str, details: Optional[Dict[str, Any]] = None, targets: Optional[List[str]] = None, level: str = "info") -> None:
     """
@@ -7729,24 +9182,41 @@ def _notify(event: str, details: Optional[Dict[str, Any]] = None, targets: Optio
         if venue_id:
             entry["venue_id"] = venue_id
 
-        os.makedirs(os.path.dirname(NOTIFICATIONS_FILE), exist_ok=True)
-        with open(NOTIFICATIONS_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        raw = _dumps_json_compact(entry) + b"\n"
+        _jsonl_append(NOTIFICATIONS_FILE, raw, NOTIFICATIONS_MAX_BYTES)
         if NOTIFY_WEBHOOK_URL:
             try:
-                payload = json.dumps(entry).encode("utf-8")
-                req = urllib.request.Request(
-                    NOTIFY_WEBHOOK_URL,
-                    data=payload,
-                    headers={"Content-Type": "application/json"},
-                    method="POST",
-                )
-                urllib.request.urlopen(req, timeout=3)  # nosec - best effort
+                _NOTIFY_POOL.submit(_post_notify_webhook, raw[:-1])
             except Exception:
                 pass
     except Exception:
         pass
 
+def _iter_lines_reverse(path: str):
+    """Yield the lines of `path` newest-first (bytes, no trailing newline) without reading it all.
+
+    The file is mmapped and walked backwards newline by newline; only the pages holding the
+    lines actually consumed are touched. Appends made after the call starts are not seen.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # empty file
+        with mm:
+            end = len(mm)
+            if end and mm[end - 1:end] == b"\n":
+                end -= 1
+            while end > 0:
+                start = mm.rfind(b"\n", 0, end)
+                yield mm[start + 1:end]
+                end = start
+
+
+# Cheap role prefilter for raw notification lines (stdlib json and orjson spacing both match).
+_RE_NOTIF_TARGETS = re.compile(rb'"targets"\s*:\s*\[([^\]]*)\]')
+
+
 def _read_notifications(
     limit: int = 50,
     role: str = "manager",
@@ -7759,6 +9229,7 @@ def _read_notifications(
     `ts >= cutoff` are included.
     Managers see entries targeted to manager/all; Owners see everything.
     """
+    _jsonl_flush_now()
     try:
         if not os.path.exists(NOTIFICATIONS_FILE):
             return []
@@ -7766,45 +9237,32 @@ def _read_notifications(
         # When time filtering is active, we may need to read more candidates
         # because we might skip a bunch outside the cutoff.
         read_multiplier = 10 if cutoff else 3
-        with open(NOTIFICATIONS_FILE, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            size = f.tell()
-            buf = b""
-            step = 4096
-            cutoff_reached = False
-            while size > 0 and (not cutoff_reached) and len(items) < limit * read_multiplier:
-                read_size = step if size >= step else size
-                size -= read_size
-                f.seek(size)
-                buf = f.read(read_size) + buf
-                lines = buf.splitlines()
-                if size > 0 and buf and not buf.startswith(b"\n"):
-                    buf = lines[0]
-                    lines = lines[1:]
-                else:
-                    buf = b""
-                for ln in reversed(lines):
-                    if not ln.strip():
-                        continue
-                    try:
-                        it = json.loads(ln.decode("utf-8"))
-                        if cutoff:
-                            # Early-stop optimization: we scan newest -> oldest.
-                            # Once we hit timestamps older than cutoff, no future
-                            # (older) entries can match time-filter.
-                            ts_str = str(it.get("ts") or "").strip()
-                            dt = _timestamp_to_datetime(ts_str)
-                            if dt is not None:
-                                if dt.tzinfo is None:
-                                    dt = dt.replace(tzinfo=timezone.utc)
-                                if dt < cutoff:
-                                    cutoff_reached = True
-                                    break
-                        items.append(it)
-                    except Exception:
-                        continue
-                    if len(items) >= limit * read_multiplier:
-                        break
+        for ln in _iter_lines_reverse(NOTIFICATIONS_FILE):
+            if not ln.strip():
+                continue
+            if role != "owner":
+                # Skip lines a manager can't see without decoding them.
+                m = _RE_NOTIF_TARGETS.search(ln)
+                if m is None or (b'"manager"' not in m.group(1) and b'"all"' not in m.group(1)):
+                    continue
+            try:
+                it = _loads_json_bytes(ln)
+                if cutoff:
+                    # Early-stop optimization: we scan newest -> oldest.
+                    # Once we hit timestamps older than cutoff, no future
+                    # (older) entries can match time-filter.
+                    ts_str = str(it.get("ts") or "").strip()
+                    dt = _timestamp_to_datetime(ts_str)
+                    if dt is not None:
+                        if dt.tzinfo is None:
+                            dt = dt.replace(tzinfo=timezone.utc)
+                        if dt < cutoff:
+                            break
+                items.append(it)
+            except Exception:
+                continue
+            if len(items) >= limit * read_multiplier:
+                break
         out: List[Dict[str, Any]] = []
         for it in items:
             t = it.get("targets") or []
@@ -7840,6 +9298,138 @@ def _read_notifications(
     except Exception:
         return []
     
+# ============================================================
+# Audit write coalescing
+# - _audit() builds the entry on the request thread, then enqueues (venue_id, json_line bytes, event)
+# - One background thread drains bursts (up to _AUDIT_BATCH_MAX per write) into a single
+#   Redis pipeline round-trip and a single file append
+# - Entries are only dequeued under _AUDIT_FLUSH_LOCK, so log order matches call order
+# - Readers call _audit_flush_now() so freshly queued entries are visible
+# - Queued entries are flushed at interpreter exit
+# - PERSIST_ASYNC=0 writes inline (tests / debugging)
+# - The file append records each event's newest offset under AUDIT_INDEX_DIR (_last_audit_event)
+# ============================================================
+_AUDIT_PENDING: "collections.deque[Tuple[str, bytes, str]]" = collections.deque()
+_AUDIT_COND = threading.Condition()
+_AUDIT_FLUSH_LOCK = threading.Lock()
+_AUDIT_BATCH_MAX = 50
+_AUDIT_THREAD: Optional[threading.Thread] = None
+
+
+_RE_AUDIT_INDEX_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _audit_index_path(event: str) -> str:
+    return os.path.join(AUDIT_INDEX_DIR, _RE_AUDIT_INDEX_UNSAFE.sub("_", event)[:120] or "_")
+
+
+def _audit_index_store(offsets: Dict[str, int]) -> None:
+    try:
+        os.makedirs(AUDIT_INDEX_DIR, exist_ok=True)
+        for event, pos in offsets.items():
+            with open(_audit_index_path(event), "wb") as f:
+                f.write(struct.pack("<Q", pos))
+    except Exception:
+        pass
+
+
+def _audit_index_offset(event: str) -> Optional[int]:
+    try:
+        with open(_audit_index_path(event), "rb") as f:
+            raw = f.read(8)
+        return struct.unpack("<Q", raw)[0] if len(raw) == 8 else None
+    except Exception:
+        return None
+
+
+def _audit_index_reset() -> None:
+    """Forget all recorded offsets (call after rewriting AUDIT_LOG_FILE in place)."""
+    shutil.rmtree(AUDIT_INDEX_DIR, ignore_errors=True)
+
+
+def _audit_write_batch(batch: List[Tuple[str, bytes, str]]) -> None:
+    """Persist queued (venue_id, json_line, event) entries: Redis (per-venue, one pipeline) + local file (one append)."""
+    if not batch:
+        return
+    try:
+        _redis_init_if_needed()
+        if _REDIS_ENABLED and _REDIS:
+            pipe = _REDIS.pipeline(transaction=False)
+            touched = set()
+            for vid, line, _ in batch:
+                rkey = f"{_REDIS_NS}:{vid}:audit_log"
+                pipe.lpush(rkey, line)
+                touched.add(rkey)
+            for rkey in touched:
+                pipe.ltrim(rkey, 0, 2000)  # keep last ~2000 entries
+            pipe.execute()
+    except Exception:
+        pass
+
+    # File fallback (legacy / dev)
+    try:
+        chunks: List[bytes] = []
+        rel: Dict[str, int] = {}
+        size = 0
+        for _, line, event in batch:
+            raw = line + b"\n"
+            rel[event] = size
+            size += len(raw)
+            chunks.append(raw)
+        base = _append_bytes(AUDIT_LOG_FILE, b"".join(chunks))
+        _audit_index_store({event: base + off for event, off in rel.items()})
+    except Exception:
+        pass
+
+
+def _audit_drain_pending() -> None:
+    with _AUDIT_FLUSH_LOCK:
+        while True:
+            with _AUDIT_COND:
+                n = min(len(_AUDIT_PENDING), _AUDIT_BATCH_MAX)
+                batch = [_AUDIT_PENDING.popleft() for _ in range(n)]
+            if not batch:
+                return
+            _audit_write_batch(batch)
+
+
+def _audit_flush_now() -> None:
+    """Synchronously persist any queued audit entries (call before reading the log)."""
+    try:
+        _audit_drain_pending()
+    except Exception:
+        pass
+
+
+atexit.register(_audit_flush_now)
+
+
+def _audit_writer_loop() -> None:
+    while True:
+        try:
+            with _AUDIT_COND:
+                while not _AUDIT_PENDING:
+                    _AUDIT_COND.wait()
+            _audit_drain_pending()
+        except Exception:
+            pass
+
+
+def _audit_enqueue(vid: str, entry: Dict[str, Any]) -> None:
+    global _AUDIT_THREAD
+    line = _dumps_json_compact(entry)
+    event = str(entry.get("event") or "")
+    if not PERSIST_ASYNC:
+        _audit_write_batch([(vid, line, event)])
+        return
+    with _AUDIT_COND:
+        if _AUDIT_THREAD is None or not _AUDIT_THREAD.is_alive():
+            _AUDIT_THREAD = threading.Thread(target=_audit_writer_loop, name="wc26-audit", daemon=True)
+            _AUDIT_THREAD.start()
+        _AUDIT_PENDING.append((vid, line, event))
+        _AUDIT_COND.notify()
+
+
 def _audit(event: str, details: Optional[Dict[str, Any]] = None) -> None:
     """Append a single-line JSON audit entry (best-effort, non-blocking).
     Writes to Redis (per-venue) and falls back to local file.
@@ -7861,50 +9451,89 @@ def _audit(event: str, details: Optional[Dict[str, Any]] = None) -> None:
             "venue_id": vid,
         }
 
-        # --- 1) Redis write (per-venue) ---
-        try:
-            if "_redis_init_if_needed" in globals():
-                _redis_init_if_needed()
-            if globals().get("_REDIS_ENABLED") and globals().get("_REDIS"):
-                rkey = f"{_REDIS_NS}:{vid}:audit_log"
-                _REDIS.lpush(rkey, json.dumps(entry, ensure_ascii=False))
-                _REDIS.ltrim(rkey, 0, 2000)  # keep last ~2000 entries
-        except Exception:
-            pass
+        # Redis (per-venue) + file fallback, batched off the request thread
+        _audit_enqueue(vid, entry)
+
+    except Exception:
+        pass
+
+
+# -----------------------------
+# Lightweight in-process caches
+# (per-venue only)
+# -----------------------------
+_CONFIG_CACHE: Dict[str, Any] = {}   # keyed by venue_id -> {"ts":..., "cfg":...}
+_LEADS_CACHE: Dict[str, Any] = {}    # keyed by venue_id -> {"ts":..., "rows":...}
+SESSION_MAX = int(os.environ.get("SESSION_MAX", "10000"))
+SESSION_TTL_SECONDS = int(os.environ.get("SESSION_TTL_SECONDS", "3600"))
+
+
+class SessionStore:
+    """Bounded in-memory chat sessions: LRU order, idle entries expire after ttl seconds.
+
+    Each session's "updated_at" is refreshed on access and is what the TTL is measured from.
+    """
+
+    def __init__(self, max_size: int = SESSION_MAX, ttl: float = SESSION_TTL_SECONDS):
+        self.max_size = max(1, int(max_size))
+        self.ttl = float(ttl)
+        self._data: "collections.OrderedDict[str, Dict[str, Any]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sid: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            s = self._data.get(sid)
+            if s is None:
+                return None
+            if now - float(s.get("updated_at") or 0) > self.ttl:
+                del self._data[sid]
+                return None
+            s["updated_at"] = now
+            self._data.move_to_end(sid)
+            return s
 
-        # --- 2) File fallback (legacy / dev) ---
-        try:
-            os.makedirs(os.path.dirname(AUDIT_LOG_FILE), exist_ok=True)
-            with open(AUDIT_LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-        except Exception:
-            pass
+    def __setitem__(self, sid: str, s: Dict[str, Any]) -> None:
+        s.setdefault("updated_at", time.time())
+        with self._lock:
+            self._data[sid] = s
+            self._data.move_to_end(sid)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
 
-    except Exception:
-        pass
+    def __len__(self) -> int:
+        return len(self._data)
 
 
-# -----------------------------
-# Lightweight in-process caches
-# (per-venue only)
-# -----------------------------
-_CONFIG_CACHE: Dict[str, Any] = {}   # keyed by venue_id -> {"ts":..., "cfg":...}
-_LEADS_CACHE: Dict[str, Any] = {}    # keyed by venue_id -> {"ts":..., "rows":...}
-_sessions: Dict[str, Dict[str, Any]] = {}  # in-memory chat/reservation sessions
+_sessions = SessionStore()  # in-memory chat/reservation sessions
 
 def _last_audit_event(event_name: str, scan_limit: int = 800) -> Optional[Dict[str, Any]]:
-    """Return the most recent audit entry for a given event (best-effort)."""
+    """Return the most recent audit entry for a given event (best-effort).
+
+    One seek via the offset index (AUDIT_INDEX_DIR); if that is missing or no longer points
+    at this event, scan back through the last `scan_limit` lines.
+    """
+    _audit_flush_now()
     try:
         if not os.path.exists(AUDIT_LOG_FILE):
             return None
-        with open(AUDIT_LOG_FILE, "r", encoding="utf-8") as f:
-            lines = f.readlines()[-max(50, min(int(scan_limit), 5000)):]
-        for ln in reversed(lines):
-            ln = (ln or "").strip()
+        pos = _audit_index_offset(event_name)
+        if pos is not None:
+            try:
+                with open(AUDIT_LOG_FILE, "rb") as f:
+                    f.seek(pos)
+                    e = _loads_json_bytes(f.readline())
+                if isinstance(e, dict) and e.get("event") == event_name:
+                    return e
+            except Exception:
+                pass
+        n = max(50, min(int(scan_limit), 5000))
+        for ln in itertools.islice(_iter_lines_reverse(AUDIT_LOG_FILE), n):
+            ln = ln.strip()
             if not ln:
                 continue
             try:
-                e = json.loads(ln)
+                e = _loads_json_bytes(ln)
             except Exception:
                 continue
             if e.get("event") == event_name:
@@ -7917,21 +9546,80 @@ def _last_audit_event(event_name: str, scan_limit: int = 800) -> Optional[Dict[s
 def _safe_read_json(path: str) -> dict:
     try:
         if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f) or {}
+            return _read_json_bytes(path) or {}
     except Exception:
         pass
     return {}
 
-def _safe_write_json(path: str, data: dict) -> None:
+def _atomic_write_bytes(path: str, raw: bytes) -> None:
+    """Durably replace `path` with `raw`: temp file in the same directory, fsync, rename, fsync dir."""
+    d = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(dir=d, prefix=os.path.basename(path) + ".", suffix=".tmp")
     try:
-        tmp = path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        try:
+            # mkstemp creates 0600; keep the existing file's mode (or a plain 0644).
+            os.chmod(tmp, (os.stat(path).st_mode & 0o777) if os.path.exists(path) else 0o644)
+        except OSError:
+            pass
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    try:
+        dfd = os.open(d, os.O_RDONLY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+    except OSError:
+        pass  # directory fsync is not supported everywhere (e.g. Windows)
+
+
+def _safe_write_json(path: str, data: dict) -> None:
+    try:
+        _atomic_write_bytes(path, _dumps_json_pretty(data))
     except Exception:
         pass
 
+
+# path -> ((st_mtime_ns, st_size), parsed dict) for the legacy CONFIG_FILE; a stat replaces the read + parse.
+_LOCAL_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _local_config_stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _read_local_config(path: str) -> Dict[str, Any]:
+    """CONFIG_FILE contents as a fresh dict; reparsed only when the file's mtime/size change."""
+    key = _local_config_stat(path)
+    if key is None:
+        return {}
+    hit = _LOCAL_CONFIG_CACHE.get(path)
+    if hit is None or hit[0] != key:
+        data = _safe_read_json(path)
+        hit = (key, data if isinstance(data, dict) else {})
+        _LOCAL_CONFIG_CACHE[path] = hit
+    return dict(hit[1])
+
+
+def _write_local_config(path: str, data: Dict[str, Any]) -> None:
+    _safe_write_json(path, data)
+    key = _local_config_stat(path)
+    if key is not None:
+        _LOCAL_CONFIG_CACHE[path] = (key, dict(data))
+
 def _ensure_ws(gc, title: str, venue_id: Optional[str] = None):
     sh = _open_default_spreadsheet(gc, venue_id=venue_id)
     try:
@@ -7939,33 +9627,39 @@ def _ensure_ws(gc, title: str, venue_id: Optional[str] = None):
     except Exception:
         return sh.add_worksheet(title=title, rows=2000, cols=20)
 
-def get_config() -> Dict[str, str]:
-    vid = _venue_id()
-    cache = _CONFIG_CACHE.setdefault(vid, {"ts": 0.0, "cfg": None})
-
-    now = time.time()
-    cached = cache.get("cfg")
-    if isinstance(cached, dict) and (now - float(cache.get("ts", 0.0)) < 5.0):
-        return dict(cached)
-
-    cfg: Dict[str, str] = {
-        "poll_sponsor_text": "",
-        "match_of_day_id": "",
-        "motd_home": "",
-        "motd_away": "",
-        "motd_datetime_utc": "",
-        "poll_lock_mode": "auto",
-        "ops_pause_reservations": "false",
-        "ops_vip_only": "false",
-        "ops_waitlist_mode": "false",
-    }
+# get_config stale-while-revalidate (see get_config)
+CONFIG_CACHE_SECONDS = 5.0
+CONFIG_STALE_SECONDS = float(os.environ.get("CONFIG_STALE_SECONDS", "300") or 300)
+# CONFIG_SHEETS_READ=0: build config from local sources only (never read the Config sheet).
+CONFIG_SHEETS_READ = _env_bool("CONFIG_SHEETS_READ", default=True)
+_CONFIG_REFRESH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wc26-config")
+_CONFIG_REFRESHING: set = set()
+_CONFIG_REFRESH_LOCK = threading.Lock()
+
+
+# Config keys every venue has, with their defaults (read-only; copied per build).
+_CFG_DEFAULTS = types.MappingProxyType({
+    "poll_sponsor_text": "",
+    "match_of_day_id": "",
+    "motd_home": "",
+    "motd_away": "",
+    "motd_datetime_utc": "",
+    "poll_lock_mode": "auto",
+    "ops_pause_reservations": "false",
+    "ops_vip_only": "false",
+    "ops_waitlist_mode": "false",
+})
+
+
+def _build_config(vid: str) -> Dict[str, str]:
+    """Read every config source for `vid` (no caching; safe outside a request)."""
+    cfg: Dict[str, str] = dict(_CFG_DEFAULTS)
 
     # Sponsor and fan_zone: always from venue config (what admin sets); no hardcoded fallback.
     try:
         venue_cfg_path = os.path.join(VENUES_DIR, f"{vid}.json")
         if os.path.exists(venue_cfg_path):
-            with open(venue_cfg_path, "r", encoding="utf-8") as f:
-                vcfg = json.load(f) or {}
+            vcfg = _read_json_bytes(venue_cfg_path) or {}
             fan_zone = vcfg.get("fan_zone") or {}
             if isinstance(fan_zone, dict):
                 for k, v in fan_zone.items():
@@ -7977,7 +9671,7 @@ def get_config() -> Dict[str, str]:
 
     # Legacy: also check the old CONFIG_FILE location (for back-compat)
     path = str(CONFIG_FILE).replace("{venue}", vid)
-    local = _safe_read_json(path)
+    local = _read_local_config(path)
     if isinstance(local, dict):
         for k, v in local.items():
             if str(k).startswith("_"):
@@ -7986,36 +9680,89 @@ def get_config() -> Dict[str, str]:
             if str(k) not in cfg or cfg.get(str(k), "") == "":
                 cfg[str(k)] = "" if v is None else str(v)
 
+    # The sheet only fills blanks, so skip the round-trip once local sources set every default key.
+    if not CONFIG_SHEETS_READ or all(cfg[k] != "" for k in _CFG_DEFAULTS):
+        return cfg
+
     try:
         gc = get_gspread_client()
         ws = _ensure_ws(gc, "Config", venue_id=vid)
-        rows = ws.get_all_values()
-        for r in rows[1:]:
-            if len(r) >= 2 and r[0]:
-                k = r[0]
-                v = r[1]
-                if (k not in cfg) or (cfg.get(k, "") == ""):
-                    cfg[k] = v
+        # Just the key/value columns below the header (open-ended range: no trailing blank rows).
+        rows = with_backoff(ws.get)("A2:B")
+        for r in rows:
+            if len(r) >= 2 and r[0] and cfg.get(r[0], "") == "":
+                cfg[r[0]] = r[1]
     except Exception:
         pass
 
-    cache["ts"] = now
-    cache["cfg"] = dict(cfg)
     return cfg
 
 
-def _cfg_bool(cfg: Dict[str, Any], key: str, default: bool = False) -> bool:
+def _refresh_config_bg(vid: str, cache: Dict[str, Any], stale: Dict[str, str]) -> None:
     try:
-        v = cfg.get(key)
-        if isinstance(v, bool):
-            return v
-        s = str(v or "").strip().lower()
-        if s in ("1","true","yes","y","on"):
-            return True
-        if s in ("0","false","no","n","off",""):
-            return False
+        started = time.time()
+        cfg = _build_config(vid)
+        with _CONFIG_REFRESH_LOCK:
+            # Drop the result if set_config / a venue edit invalidated the entry meanwhile.
+            if _CONFIG_CACHE.get(vid) is cache and cache.get("cfg") is stale:
+                cache["ts"] = started
+                cache["cfg"] = cfg
     except Exception:
         pass
+    finally:
+        with _CONFIG_REFRESH_LOCK:
+            _CONFIG_REFRESHING.discard(vid)
+
+
+def _schedule_config_refresh(vid: str, cache: Dict[str, Any], stale: Dict[str, str]) -> None:
+    """Start one background config rebuild for `vid` unless one is already running."""
+    with _CONFIG_REFRESH_LOCK:
+        if vid in _CONFIG_REFRESHING:
+            return
+        _CONFIG_REFRESHING.add(vid)
+    try:
+        _CONFIG_REFRESH_POOL.submit(_refresh_config_bg, vid, cache, stale)
+    except Exception:
+        with _CONFIG_REFRESH_LOCK:
+            _CONFIG_REFRESHING.discard(vid)
+
+
+def get_config() -> Dict[str, str]:
+    """Venue config: defaults < venue fan_zone < legacy CONFIG_FILE < Config sheet (cached per venue).
+
+    Fresh for CONFIG_CACHE_SECONDS; up to CONFIG_STALE_SECONDS the cached dict is still served
+    while one background refresh per venue rebuilds it. Only a cold/invalidated cache blocks.
+    """
+    vid = _venue_id()
+    cache = _CONFIG_CACHE.setdefault(vid, {"ts": 0.0, "cfg": None})
+
+    now = time.time()
+    cached = cache.get("cfg")
+    if isinstance(cached, dict):
+        age = now - float(cache.get("ts", 0.0))
+        if age < CONFIG_CACHE_SECONDS:
+            return dict(cached)
+        if age < CONFIG_STALE_SECONDS:
+            _schedule_config_refresh(vid, cache, cached)
+            return dict(cached)
+
+    cfg = _build_config(vid)
+    cache["ts"] = now
+    cache["cfg"] = dict(cfg)
+    return cfg
+
+_CFG_TRUE = frozenset(("1", "true", "yes", "y", "on"))
+_CFG_FALSE = frozenset(("0", "false", "no", "n", "off", ""))
+
+def _cfg_bool(cfg: Dict[str, Any], key: str, default: bool = False) -> bool:
+    v = cfg.get(key)
+    if v is True or v is False:
+        return v
+    s = str(v or "").strip().lower()
+    if s in _CFG_TRUE:
+        return True
+    if s in _CFG_FALSE:
+        return False
     return bool(default)
 
 def get_ops(cfg: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
@@ -8037,28 +9784,30 @@ def set_config(pairs: Dict[str, str]) -> Dict[str, str]:
         clean[str(k)] = "" if v is None else str(v)
 
     path = str(CONFIG_FILE).replace("{venue}", vid)
-    local = _safe_read_json(path)
-    if not isinstance(local, dict):
-        local = {}
+    local = _read_local_config(path)
     local.update(clean)
     local["_updated_at"] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    _safe_write_json(path, local)
+    _write_local_config(path, local)
 
     try:
         gc = get_gspread_client()
         ws = _ensure_ws(gc, "Config", venue_id=vid)
 
-        rows = ws.get_all_values()
-        if not rows:
+        # Only column A (the keys) is needed to locate rows; values are never read here.
+        keys = with_backoff(ws.col_values)(1)
+        if not keys:
             ws.append_row(["key", "value"])
-            rows = ws.get_all_values()
-
-        existing = {r[0]: (i + 1) for i, r in enumerate(rows) if len(r) >= 1 and r[0]}
-        for k, v in clean.items():
-            if k in existing:
-                ws.update_cell(existing[k], 2, v)
-            else:
-                ws.append_row([k, v])
+            keys = ["key"]
+
+        # One batch_update for existing keys + one append_rows for new ones (was a call per key).
+        # Value input options match the old update_cell (USER_ENTERED) / append_row (RAW) calls.
+        existing = {k: (i + 1) for i, k in enumerate(keys) if k}
+        updates = [{"range": f"B{existing[k]}", "values": [[v]]} for k, v in clean.items() if k in existing]
+        new_rows = [[k, v] for k, v in clean.items() if k not in existing]
+        if updates:
+            with_backoff(ws.batch_update)(updates, value_input_option="USER_ENTERED")
+        if new_rows:
+            with_rate_limit_backoff(ws.append_rows)(new_rows, value_input_option="RAW")
     except Exception:
         pass
 
@@ -8066,15 +9815,36 @@ def set_config(pairs: Dict[str, str]) -> Dict[str, str]:
     cache["cfg"] = None
     return get_config()
   
+_RE_MATCH_ID_UNSAFE = re.compile(r"[^A-Za-z0-9|:_-]+")
+
 def _match_id(m: Dict[str, Any]) -> str:
     # Stable-ish id: datetime_utc + home + away (safe for URL/storage)
     dt = (m.get("datetime_utc") or "").strip()
     home = (m.get("home") or "").strip()
     away = (m.get("away") or "").strip()
     base = f"{dt}|{home}|{away}"
-    base = re.sub(r"[^A-Za-z0-9|:_-]+", "_", base)
+    base = _RE_MATCH_ID_UNSAFE.sub("_", base)
     return base[:180]
 
+# (fixtures list, sorted datetime_utc keys or None if unsorted, {_match_id: match}) for _get_match_of_day().
+_MOTD_INDEX: Tuple[Any, Optional[List[str]], Dict[str, Dict[str, Any]]] = (None, None, {})
+
+
+def _motd_index(matches: List[Dict[str, Any]]) -> Tuple[Optional[List[str]], Dict[str, Dict[str, Any]]]:
+    """Kickoff keys + id lookup for a fixtures list, rebuilt only when load_all_matches() returns a new list."""
+    global _MOTD_INDEX
+    src, keys, by_id = _MOTD_INDEX
+    if src is not matches:
+        keys = [(m.get("datetime_utc") or "") for m in matches]
+        if any(a > b for a, b in zip(keys, keys[1:])):
+            keys = None  # not in kickoff order; callers scan instead
+        by_id = {}
+        for m in matches:
+            by_id.setdefault(_match_id(m), m)
+        _MOTD_INDEX = (matches, keys, by_id)
+    return keys, by_id
+
+
 def _get_match_of_day() -> Optional[Dict[str, Any]]:
     cfg = get_config()
 
@@ -8104,17 +9874,22 @@ def _get_match_of_day() -> Optional[Dict[str, Any]]:
     except Exception:
         matches = []
 
-    if override_id:
-        for m in matches:
-            if _match_id(m) == override_id:
-                return m
+    if not matches:
+        return None
+    keys, by_id = _motd_index(matches)
+
+    if override_id and override_id in by_id:
+        return by_id[override_id]
 
     # Default: next upcoming match globally (all matches is already sorted by datetime_utc)
     now_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if keys is not None:
+        i = bisect.bisect_left(keys, now_utc)
+        return matches[i] if i < len(matches) else matches[0]
     for m in matches:
         if (m.get("datetime_utc") or "") >= now_utc:
             return m
-    return matches[0] if matches else None
+    return matches[0]
 
 
 def _poll_is_locked(match: Optional[Dict[str, Any]]) -> bool:
@@ -8162,6 +9937,70 @@ def _poll_store_write(data: Dict[str, Any]) -> None:
     _safe_write_json_file(POLL_STORE_FILE, data)
 
 
+# ============================================================
+# Poll votes without Redis: append-only JSONL + in-memory tallies
+# - A vote is one {"match_id","client_id","team"} line appended with O_APPEND (O(line), not O(store))
+# - Per-venue tallies are built once by streaming the log (seeded from legacy POLL_STORE_FILE
+#   votes), then only the bytes appended since the last look are applied
+# - First vote per (match_id, client_id) wins, so duplicate lines from racing workers are harmless
+# - Redis installs keep the single-key store in POLL_STORE_FILE's Redis mapping
+# ============================================================
+_POLL_INDEX: Dict[str, Dict[str, Any]] = {}  # venue_id -> {"ident", "offset", "matches"}
+_POLL_LOCK = threading.Lock()
+
+
+def _poll_apply_vote(matches: Dict[str, Dict[str, Any]], match_id: str, client_id: str, team: str) -> None:
+    if not (match_id and client_id and team):
+        return
+    bucket = matches.get(match_id)
+    if bucket is None:
+        bucket = matches[match_id] = {"clients": {}, "counts": {}}
+    if client_id in bucket["clients"]:
+        return
+    bucket["clients"][client_id] = team
+    bucket["counts"][team] = bucket["counts"].get(team, 0) + 1
+
+
+def _poll_rebuild(ident: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+    """Fresh tallies seeded from legacy store votes; the caller streams the log from offset 0."""
+    matches: Dict[str, Dict[str, Any]] = {}
+    for mid, bucket in _poll_store_read()["matches"].items():
+        clients = bucket.get("clients") if isinstance(bucket, dict) else None
+        if isinstance(clients, dict):
+            for cid, team in clients.items():
+                _poll_apply_vote(matches, str(mid), str(cid), str(team))
+    return {"ident": ident, "offset": 0, "matches": matches}
+
+
+def _poll_tallies(vid: str) -> Dict[str, Dict[str, Any]]:
+    """Current per-match tallies for a venue (call with _POLL_LOCK held)."""
+    path = POLL_VOTES_JSONL.replace("{venue}", vid)
+    try:
+        st = os.stat(path)
+        ident: Optional[Tuple[int, int]] = (st.st_dev, st.st_ino)
+        size = st.st_size
+    except FileNotFoundError:
+        ident, size = None, 0
+    idx = _POLL_INDEX.get(vid)
+    if idx is None or idx["ident"] != ident or size < idx["offset"]:
+        idx = _POLL_INDEX[vid] = _poll_rebuild(ident)
+    if size > idx["offset"]:
+        with open(path, "rb") as f:
+            f.seek(idx["offset"])
+            for ln in f:
+                if not ln.endswith(b"\n"):
+                    break  # partial line from an in-flight append; picked up next time
+                idx["offset"] += len(ln)
+                try:
+                    v = _loads_json_bytes(ln)
+                except Exception:
+                    continue
+                if isinstance(v, dict):
+                    _poll_apply_vote(idx["matches"], str(v.get("match_id") or ""),
+                                     str(v.get("client_id") or ""), str(v.get("team") or ""))
+    return idx["matches"]
+
+
 def _ensure_venue_ctx_from_poll(body: Optional[Dict[str, Any]] = None) -> str:
     """Resolve venue for poll APIs from query/header/body and apply to g.venue_id."""
     raw_candidates = [
@@ -8202,10 +10041,18 @@ def _poll_match_bucket(match_id: str) -> Dict[str, Any]:
     return bucket
 
 def _poll_has_voted(match_id: str, client_id: str) -> Optional[str]:
+    if not _REDIS_ENABLED:
+        with _POLL_LOCK:
+            bucket = _poll_tallies(_venue_id()).get(match_id)
+            return bucket["clients"].get(client_id) if bucket else None
     bucket = _poll_match_bucket(match_id)
     return (bucket.get("clients") or {}).get(client_id)
 
 def _poll_counts(match_id: str) -> Dict[str, int]:
+    if not _REDIS_ENABLED:
+        with _POLL_LOCK:
+            bucket = _poll_tallies(_venue_id()).get(match_id)
+            return dict(bucket["counts"]) if bucket else {}
     bucket = _poll_match_bucket(match_id)
     counts = bucket.get("counts") or {}
     out: Dict[str, int] = {}
@@ -8221,6 +10068,16 @@ def _poll_record_vote(match_id: str, client_id: str, team: str) -> bool:
     if not (match_id and client_id and team):
         return False
 
+    if not _REDIS_ENABLED:
+        vid = _venue_id()
+        with _POLL_LOCK:
+            bucket = _poll_tallies(vid).get(match_id)
+            if bucket and client_id in bucket["clients"]:
+                return False  # already voted
+            line = _dumps_json_compact({"match_id": match_id, "client_id": client_id, "team": team})
+            _append_bytes(POLL_VOTES_JSONL.replace("{venue}", vid), line + b"\n")
+            return _poll_tallies(vid)[match_id]["clients"].get(client_id) == team
+
     data = _poll_store_read()
     matches = data.get("matches", {})
     bucket = matches.get(match_id) or {}
@@ -8274,11 +10131,17 @@ def _poll_client_id(provided: str) -> str:
     if p:
         return p[:120]
     try:
+        # The derived id only depends on request headers: hash once per request.
+        cached = getattr(g, "_poll_cid", None)
+        if cached:
+            return cached
         ua = (request.headers.get("User-Agent") or "").strip()
         al = (request.headers.get("Accept-Language") or "").strip()
-        ip = (request.headers.get("X-Forwarded-For") or request.remote_addr or "").split(",")[0].strip()
+        ip = (request.headers.get("X-Forwarded-For") or request.remote_addr or "").partition(",")[0].strip()
         raw = f"{ip}|{ua}|{al}"
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+        # Non-cryptographic id: blake2b/16 is cheaper than sha256 and still 32 hex chars.
+        g._poll_cid = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+        return g._poll_cid
     except Exception:
         return "anon"
 
@@ -8296,8 +10159,7 @@ def api_poll_state():
                 path = os.path.join(VENUES_DIR, f"{vid}.json")
                 if not os.path.exists(path):
                     return {}
-                with open(path, "r", encoding="utf-8") as f:
-                    vcfg = json.load(f) or {}
+                vcfg = _read_json_bytes(path) or {}
                 return vcfg.get("fan_zone") or {}
             except Exception:
                 return {}
@@ -8461,15 +10323,13 @@ def _update_venue_fan_zone(venue_id: str, pairs: Dict[str, str]) -> None:
         path = os.path.join(VENUES_DIR, f"{venue_id}.json")
         if not os.path.exists(path):
             return
-        with open(path, "r", encoding="utf-8") as f:
-            vcfg = json.load(f) or {}
+        vcfg = _read_json_bytes(path) or {}
         vcfg.setdefault("fan_zone", {})
         for k, v in pairs.items():
             if str(k).startswith("_"):
                 continue
             vcfg["fan_zone"][str(k)] = "" if v is None else str(v)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(vcfg, f, indent=2, ensure_ascii=False)
+        _write_bytes_file(path, _dumps_json_pretty(vcfg))
         _invalidate_venues_cache()
         _CONFIG_CACHE.pop(venue_id, None)
     except Exception:
@@ -8534,14 +10394,12 @@ def admin_update_config():
         if not os.path.exists(path):
             return jsonify({"ok": False, "error": f"Unknown venue: {venue}"}), 404
 
-        with open(path, "r", encoding="utf-8") as f:
-            vcfg = json.load(f) or {}
+        vcfg = _read_json_bytes(path) or {}
 
         vcfg.setdefault("fan_zone", {})
         vcfg["fan_zone"].update(pairs)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(vcfg, f, indent=2, ensure_ascii=False)
+        _write_bytes_file(path, _dumps_json_pretty(vcfg))
 
         # ✅ invalidate caches (if present)
         try:
@@ -8682,7 +10540,7 @@ def admin_api_menu():
 
     global _MENU_OVERRIDE
     if request.method == "GET":
-        return jsonify({"ok": True, "menu": _MENU_OVERRIDE or MENU})
+        return _json_response({"ok": True, "menu": _MENU_OVERRIDE or _thaw_json(_builtin_menu())})
 
     payload = request.get_json(silent=True)
     if payload is None:
@@ -8694,6 +10552,7 @@ def admin_api_menu():
         return jsonify({"ok": False, "error": str(e)}), 400
 
     _MENU_OVERRIDE = _bump_menu_meta(normed)
+    _menu_cache_clear()
     _safe_write_json_file(MENU_FILE, _MENU_OVERRIDE)
     _audit("menu.update", {"langs": [k for k in _MENU_OVERRIDE.keys() if not str(k).startswith('_')], "version": _MENU_OVERRIDE.get('_meta',{}).get('version')})
     return jsonify({"ok": True, "menu": _MENU_OVERRIDE})
@@ -8717,6 +10576,7 @@ def admin_api_menu_upload():
         return jsonify({"ok": False, "error": f"Invalid menu file: {e}"}), 400
 
     _MENU_OVERRIDE = _bump_menu_meta(normed)
+    _menu_cache_clear()
     _safe_write_json_file(MENU_FILE, _MENU_OVERRIDE)
     _audit("menu.upload", {"size_bytes": len(raw), "version": _MENU_OVERRIDE.get('_meta',{}).get('version')})
     return jsonify({"ok": True, "menu": _MENU_OVERRIDE})
@@ -9829,6 +11689,9 @@ def admin_api_notifications_clear():
     except Exception:
         vid = ""
 
+    # Queued notifications must be persisted before we read/rewrite the file
+    _jsonl_flush_now()
+
     try:
         if not os.path.exists(NOTIFICATIONS_FILE):
             _audit("notifications.clear", {"venue_id": vid, "cleared": 0})
@@ -9885,6 +11748,8 @@ def admin_api_notifications_clear_one():
         except Exception:
             vid = ""
 
+        # Queued notifications must be persisted before we read/rewrite the file
+        _jsonl_flush_now()
         if not os.path.exists(NOTIFICATIONS_FILE):
             return jsonify({"ok": True, "cleared": 0})
 
@@ -9994,6 +11859,9 @@ def admin_api_audit():
     if not ok:
         return resp
 
+    # Queued audit entries must be persisted before we read/rewrite the log
+    _audit_flush_now()
+
     try:
         limit = int(request.args.get("limit", "200") or 200)
         limit = max(1, min(limit, 1000))
@@ -10115,6 +11983,9 @@ def admin_api_audit_clear():
     if not ok:
         return resp
 
+    # Queued audit entries must be persisted before we read/rewrite the log
+    _audit_flush_now()
+
     cleared = 0
     vid = _venue_id()
 
@@ -10159,6 +12030,7 @@ def admin_api_audit_clear():
             with open(AUDIT_LOG_FILE, "w", encoding="utf-8") as f:
                 for line in kept_lines:
                     f.write(line if line.endswith("\n") else (line + "\n"))
+            _audit_index_reset()
     except Exception:
         pass
 
@@ -10181,6 +12053,9 @@ def admin_api_audit_clear_one():
     if not ok:
         return resp
 
+    # Queued audit entries must be persisted before we read/rewrite the log
+    _audit_flush_now()
+
     payload = request.get_json(silent=True) or {}
     ts = str(payload.get("ts") or "").strip()
     event = str(payload.get("event") or "").strip()
@@ -10260,6 +12135,7 @@ def admin_api_audit_clear_one():
             with open(AUDIT_LOG_FILE, "w", encoding="utf-8") as f:
                 for line in new_lines:
                     f.write(line if line.endswith("\n") else (line + "\n"))
+            _audit_index_reset()
     except Exception:
         pass
 
@@ -10409,7 +12285,7 @@ def admin_update_lead():
             updates += 1
     # Keep leads view in sync: invalidate venue leads cache after write.
     try:
-        _LEADS_CACHE_BY_VENUE.pop(_slugify_venue_id(vid), None)
+        _invalidate_leads_cache(vid)
     except Exception:
         pass
     _audit("lead.handled", {"row": row_num}) if (status == "Handled") else _audit("lead.update", {"row": row_num})
@@ -14654,7 +16530,8 @@ def api_intake():
     }
 
     try:
-        append_lead_to_sheet(lead, venue_id=effective_vid)
+        # Written before we answer, so "ok" means the lead is in the sheet.
+        append_lead_to_sheet(lead, venue_id=effective_vid, sync=True)
         _audit("intake.new", {"entry_point": entry_point, "tier": tier})
         return jsonify({"ok": True, "tier": tier})
     except Exception as e:
@@ -14800,12 +16677,12 @@ def api_venue_identity():
 
 def _append_lead_local(row: dict) -> None:
     try:
-        os.makedirs(os.path.dirname(LEADS_STORE_PATH), exist_ok=True)
-        with open(LEADS_STORE_PATH, "a", encoding="utf-8") as f:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        _jsonl_append(LEADS_STORE_PATH, _dumps_json_compact(row) + b"\n")
     except Exception:
         pass
 
+_RE_TRAILING_NUM = re.compile(r"(\d+)$")
+
 def _extract_row_num_from_updated_range(updated_range: str) -> int:
     """
     Parse ranges like 'Leads!A123:K123' and return 123.
@@ -14817,7 +16694,7 @@ def _extract_row_num_from_updated_range(updated_range: str) -> int:
         if "!" in updated_range:
             updated_range = updated_range.split("!", 1)[1]
         first = updated_range.split(":", 1)[0]
-        m = re.search(r"(\d+)$", first)
+        m = _RE_TRAILING_NUM.search(first)
         return int(m.group(1)) if m else 0
     except Exception:
         return 0
@@ -16804,7 +18681,6 @@ def super_admin_console():
 # Super Admin: error trap (ensures /super/* never returns a generic 500)
 # ============================================================
 from werkzeug.exceptions import HTTPException
-from flask import Response
 
 @app.errorhandler(Exception)
 def _handle_any_exception(e):
@@ -16902,7 +18778,7 @@ def super_api_venues_set_sheet():
 
     cfg["data"] = cfg.get("data") if isinstance(cfg.get("data"), dict) else {}
     cfg["data"]["google_sheet_id"] = sheet_id
-    cfg["updated_at"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    cfg["updated_at"] = _utc_z_now()
 
     # Best-effort: validate immediately so operators see stable status.
     chk = _check_sheet_id(sheet_id)
@@ -16913,7 +18789,13 @@ def super_api_venues_set_sheet():
     except Exception:
         pass
 
-    wrote, write_path, err = _write_venue_config(venue_id, cfg)
+    wrote = False
+    err = ""
+    try:
+        _write_json_now(os.path.join(VENUES_DIR, f"{venue_id}.json"), cfg)
+        wrote = True
+    except Exception as e:
+        err = str(e)
     _invalidate_venues_cache()
 
     return jsonify({
@@ -16953,10 +18835,17 @@ def super_api_venues_check_sheet():
     cfg["ready"] = bool(cfg["sheet_ok"] and cfg.get("active", True))
     cfg["last_checked"] = chk.get("checked_at")
 
-    _safe_write_json_file(path, cfg)
+    wrote = False
+    err = ""
+    try:
+        _write_json_now(path, cfg)
+        wrote = True
+    except Exception as e:
+        err = str(e)
     _invalidate_venues_cache()
 
-    return jsonify({"ok": True, "venue_id": venue_id, "sheet_id": sheet_id, "check": chk})
+    return jsonify({"ok": True, "venue_id": venue_id, "sheet_id": sheet_id, "check": chk,
+                    "persisted": wrote, "error": err})
 
 @app.route("/super/api/venues/create", methods=["POST", "OPTIONS"])
 def super_api_venues_create():
@@ -17105,65 +18994,96 @@ def _get_super_admin_key():
 # - UI-safe demos: mask PII + disable writes/exports/AI apply
 # - Activated by Super Admin via cookie + header X-Demo-Mode: 1
 # =========================
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
 def _demo_mode_enabled() -> bool:
     try:
-        # Explicit header wins (used by Super Admin UI fetches)
-        if str(request.headers.get("X-Demo-Mode","")).strip() in ("1","true","yes","on"):
-            return True
-    except Exception:
-        pass
-    try:
-        # Cookie set by /super/api/demo_mode
-        if str(request.cookies.get("demo_mode","")).strip() in ("1","true","yes","on"):
-            return True
+        # Explicit header wins (used by Super Admin UI fetches); cookie is set by /super/api/demo_mode
+        sources = (
+            request.headers.get("X-Demo-Mode", ""),
+            request.cookies.get("demo_mode", ""),
+            request.args.get("demo", ""),
+        )
     except Exception:
-        pass
-    try:
-        if str(request.args.get("demo","")).strip() in ("1","true","yes","on"):
+        # No request bound
+        return False
+    for v in sources:
+        if v and v.strip().lower() in _TRUTHY:
             return True
-    except Exception:
-        pass
     return False
 
 def _mask_phone(v: str) -> str:
     s = str(v or "").strip()
     if not s:
         return ""
-    digits = re.sub(r"\D+", "", s)
+    digits = _RE_NON_DIGITS.sub("", s)
     if len(digits) >= 4:
         return "•••-•••-" + digits[-4:]
     return "•••"
 
+# user @ first-domain-label . [middle labels .] tld
+_EMAIL_MASK_RE = re.compile(r"^([^@]*)@([^.]*)\.(?:.*\.)?([^.]*)$", re.S)
+
 def _mask_email(v: str) -> str:
     s = str(v or "").strip()
     if "@" not in s:
         return "•••"
-    user, dom = s.split("@", 1)
-    u = (user[:1] + "•••") if user else "•••"
-    # keep TLD hint
-    parts = dom.split(".")
-    if len(parts) >= 2:
-        d = (parts[0][:1] + "•••") + "." + parts[-1]
-    else:
-        d = dom[:1] + "•••"
-    return u + "@" + d
+    m = _EMAIL_MASK_RE.match(s)
+    if m:
+        # keep TLD hint
+        user, first, tld = m.groups()
+        return user[:1] + "•••@" + first[:1] + "•••." + tld
+    user, _, dom = s.partition("@")
+    return user[:1] + "•••@" + dom[:1] + "•••"
+
+# Common PII fields across your lead schemas -> masker
+_MASK_FNS = (("phone", _mask_phone), ("email", _mask_email))
 
 def _apply_demo_mask_to_lead(item: Dict[str, Any]) -> Dict[str, Any]:
-    x = dict(item or {})
-    # Common fields across your lead schemas
-    if "phone" in x:
-        x["phone"] = _mask_phone(x.get("phone"))
-    if "email" in x:
-        x["email"] = _mask_email(x.get("email"))
-    if "contact" in x and isinstance(x.get("contact"), str):
+    if not item:
+        return {}
+    c = item.get("contact")
+    if not (isinstance(c, str) or "phone" in item or "email" in item):
+        # Nothing to mask: hand back the original (callers never mutate the result)
+        return item
+    x = item.copy()
+    for k, fn in _MASK_FNS:
+        if k in x:
+            x[k] = fn(x[k])
+    if isinstance(c, str):
         # if contact stores phone/email
-        c = x.get("contact") or ""
-        if "@" in c:
-            x["contact"] = _mask_email(c)
-        else:
-            x["contact"] = _mask_phone(c)
+        x["contact"] = _mask_email(c) if "@" in c else _mask_phone(c)
     return x
 
+# Demo toggles are rare but leads dashboards poll often: keep the server-side flag for a few seconds.
+# The writing process refreshes this immediately; other workers converge within the TTL.
+_DEMO_CACHE_TTL_SECONDS = 3.0
+_DEMO_CACHE: Dict[str, Any] = {"ts": float("-inf"), "val": False}
+
+def _demo_mode_server() -> bool:
+    """Server-authoritative demo mode flag (Redis preferred, disk fallback)."""
+    now = time.monotonic()
+    if now - _DEMO_CACHE["ts"] < _DEMO_CACHE_TTL_SECONDS:
+        return _DEMO_CACHE["val"]
+
+    demo_enabled = False
+    try:
+        _redis_init_if_needed()
+        if _REDIS_ENABLED and _REDIS:
+            rec = _redis_get_json(f"{_REDIS_NS}:demo_mode", default={}) or {}
+            demo_enabled = bool(rec.get("enabled"))
+    except Exception:
+        pass
+    if not demo_enabled:
+        try:
+            rec = _safe_read_json_file("/tmp/wc26_demo_mode.json", default={}) or {}
+            demo_enabled = bool(rec.get("enabled"))
+        except Exception:
+            demo_enabled = False
+
+    _DEMO_CACHE.update(ts=now, val=demo_enabled)
+    return demo_enabled
+
 @app.route("/super/api/demo_mode", methods=["POST","OPTIONS"])
 def super_api_demo_mode():
     """Toggle demo mode globally for Super Admin session per spec."""
@@ -17183,8 +19103,8 @@ def super_api_demo_mode():
 
         # Server-authoritative persistence (Redis if enabled, else /tmp)
         demo_record = {
-            "enabled": bool(enabled),
-            "updated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "enabled": enabled,
+            "updated_at": _utc_z_now(),
         }
 
         persisted = False
@@ -17195,7 +19115,7 @@ def super_api_demo_mode():
             _redis_init_if_needed()
             if _REDIS_ENABLED and _REDIS:
                 rkey = f"{_REDIS_NS}:demo_mode"
-                persisted = bool(_redis_set_json(rkey, demo_record))
+                persisted = _redis_set_json(rkey, demo_record)
                 persist_where = "redis" if persisted else ""
         except Exception:
             pass
@@ -17216,11 +19136,13 @@ def super_api_demo_mode():
             _invalidate_venues_cache()
         except Exception:
             pass
+        if persisted:
+            _DEMO_CACHE.update(ts=time.monotonic(), val=enabled)
 
         resp = jsonify({
             "ok": True,
-            "enabled": bool(enabled),
-            "persisted": bool(persisted),
+            "enabled": enabled,
+            "persisted": persisted,
             "persist_where": persist_where,
         })
 
@@ -17271,43 +19193,129 @@ def _ops_redis_key() -> str:
 def _fanzone_redis_key() -> str:
     return f"{_REDIS_NS}:{_venue_id()}:fanzone_state"
 
+# Ops state is one level deep: toggles default False, audit fields default None
+_OPS_STATE_DEFAULT = {
+    **dict.fromkeys(("pause", "viponly", "waitlist", "notify"), False),
+    **dict.fromkeys(("updated_at", "updated_by", "updated_role"), None),
+}
+
 def _ops_state_default():
-    return {"pause": False, "viponly": False, "waitlist": False, "notify": False,
-            "updated_at": None, "updated_by": None, "updated_role": None}
+    return dict(_OPS_STATE_DEFAULT)
+
+# Atomic ops-state patch: GET + top-level merge + stamp + SET in one server-side call.
+# KEYS[1] = stored key, KEYS[2] = legacy JSON key (read when a packed KEYS[1] is missing)
+# ARGV = codec ("mp" | "json"), encoded patch, updated_at, updated_by, updated_role
+_OPS_MERGE_LUA = """
+local pack, unpack = cjson.encode, cjson.decode
+if ARGV[1] == 'mp' then pack, unpack = cmsgpack.pack, cmsgpack.unpack end
+local cur = redis.call('GET', KEYS[1])
+local st = nil
+if cur then
+  local ok, v = pcall(unpack, cur)
+  if ok then st = v end
+elseif ARGV[1] == 'mp' then
+  local legacy = redis.call('GET', KEYS[2])
+  if legacy then
+    local ok, v = pcall(cjson.decode, legacy)
+    if ok then st = v end
+  end
+end
+if type(st) ~= 'table' then st = {} end
+for k, v in pairs(unpack(ARGV[2])) do st[k] = v end
+st['updated_at'] = ARGV[3]
+st['updated_by'] = ARGV[4]
+st['updated_role'] = ARGV[5]
+local out = pack(st)
+redis.call('SET', KEYS[1], out)
+return out
+"""
+_OPS_MERGE_SCRIPT = None
+
+
+def _redis_merge_ops(key: str, patch: Dict[str, Any], actor: str, role: str) -> Optional[Dict[str, Any]]:
+    """Apply `patch` to the stored ops state in one round-trip; None if Redis scripting is unavailable."""
+    global _OPS_MERGE_SCRIPT
+    try:
+        if _OPS_MERGE_SCRIPT is None:
+            _OPS_MERGE_SCRIPT = _REDIS.register_script(_OPS_MERGE_LUA)
+        ts = _utc_z_now()
+        rb = _redis_bin()
+        if rb is not None:
+            raw = _OPS_MERGE_SCRIPT(keys=[key + ":mp", key],
+                                    args=["mp", msgpack.packb(patch, use_bin_type=True), ts, actor, role], client=rb)
+            st = msgpack.unpackb(raw, raw=False, strict_map_key=False)
+        else:
+            raw = _OPS_MERGE_SCRIPT(keys=[key, key], args=["json", _dumps_json_compact(patch), ts, actor, role])
+            st = _loads_json_bytes(raw.encode("utf-8") if isinstance(raw, str) else raw)
+        return st if isinstance(st, dict) else None
+    except Exception:
+        return None
+
+# Per-process memo of Redis ops/fanzone state: bursts of admin reads cost one GET per TTL.
+# Writes from this process refresh the entry; other processes' writes show up within the TTL.
+OPS_STATE_TTL_SECONDS = 1.5
+FANZONE_STATE_TTL_SECONDS = 5.0
+_REDIS_STATE_CACHE: Dict[str, Tuple[float, Any]] = {}  # redis key -> (monotonic ts, decoded value)
+
+
+def _redis_state_cached(key: str, ttl: float) -> Any:
+    hit = _REDIS_STATE_CACHE.get(key)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    st = _redis_get_pack(key, default=None)
+    _REDIS_STATE_CACHE[key] = (now, st)
+    return st
+
+
+def _redis_state_store(key: str, st: Any) -> None:
+    _REDIS_STATE_CACHE[key] = (time.monotonic(), st)
 
 def _load_ops_state() -> Dict[str, Any]:
     if _REDIS_ENABLED:
-        st = _redis_get_json(_ops_redis_key(), default=None)
+        st = _redis_state_cached(_ops_redis_key(), OPS_STATE_TTL_SECONDS)
         if isinstance(st, dict):
-            return _deep_merge(_ops_state_default(), st)
+            # Flat schema: a C-level dict merge is equivalent to _deep_merge here
+            return {**_OPS_STATE_DEFAULT, **st}
     return _ops_state_default()
 
 def _save_ops_state(patch: Dict[str, Any], actor: str, role: str) -> Dict[str, Any]:
-    st = _deep_merge(_load_ops_state(), patch or {})
-    st["updated_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if _REDIS_ENABLED:
+        key = _ops_redis_key()
+        merged = _redis_merge_ops(key, patch or {}, actor, role)
+        if merged is not None:
+            _redis_state_store(key, merged)
+            return {**_OPS_STATE_DEFAULT, **merged}
+        _REDIS_STATE_CACHE.pop(key, None)  # merge below must start from the stored state
+    # Flat schema (same top-level merge as _OPS_MERGE_LUA); _load_ops_state returns a fresh dict
+    st = _load_ops_state()
+    st.update(patch or {})
+    st["updated_at"] = _utc_z_now()
     st["updated_by"] = actor
     st["updated_role"] = role
     if _REDIS_ENABLED:
-        _redis_set_json(_ops_redis_key(), st)
+        _redis_set_pack(_ops_redis_key(), st)
+        _redis_state_store(_ops_redis_key(), dict(st))
     return st
 
 def _load_fanzone_state() -> Dict[str, Any]:
     if _REDIS_ENABLED:
-        st = _redis_get_json(_fanzone_redis_key(), default=None)
+        st = _redis_state_cached(_fanzone_redis_key(), FANZONE_STATE_TTL_SECONDS)
         if isinstance(st, dict):
-            return st
+            return dict(st)
     st = _safe_read_json_file(POLL_STORE_FILE, default={})
     return st if isinstance(st, dict) else {}
 
 def _save_fanzone_state(st: Dict[str, Any], actor: str, role: str) -> Dict[str, Any]:
     st2 = st if isinstance(st, dict) else {}
     st2["_meta"] = {
-        "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "updated_at": _utc_z_now(),
         "updated_by": actor,
         "updated_role": role,
     }
     if _REDIS_ENABLED:
-        _redis_set_json(_fanzone_redis_key(), st2)
+        _redis_set_pack(_fanzone_redis_key(), st2)
+        _redis_state_store(_fanzone_redis_key(), dict(st2))
     else:
         _safe_write_json_file(POLL_STORE_FILE, st2)
     return st2
@@ -17315,6 +19323,66 @@ def _save_fanzone_state(st: Dict[str, Any], actor: str, role: str) -> Dict[str,
 # ============================================================
 # Super Admin: Venue Onboarding (writes config when possible)
 # ============================================================
+def _super_venue_row(vid: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """One row of the Super Admin venue list (cfg.get bound once for the hot loop)."""
+    get = cfg.get
+    name = str(get("venue_name") or get("name") or vid)
+    sid = _venue_sheet_id(vid)
+    sheet_ok = get("sheet_ok", None)
+    ready = bool(get("ready", False))
+    last_checked = get("last_checked")
+
+    status = str(get("status") or "").strip()
+    if not sid:
+        status = "MISSING_SHEET"
+    elif sheet_ok is True and ready:
+        status = "READY"
+    elif sheet_ok is False:
+        status = "SHEET_FAIL"
+    else:
+        status = status or "SHEET_SET"
+
+    access = get("access")
+    a_keys = access.get("admin_keys") if isinstance(access, dict) else None
+    k = get("keys")
+    first_admin_key = ""
+    if isinstance(a_keys, list) and a_keys:
+        first_admin_key = str(a_keys[0]).strip()
+    elif isinstance(k, dict) and k.get("admin_key"):
+        first_admin_key = str(k["admin_key"]).strip()
+    if not first_admin_key:
+        first_admin_key = ADMIN_OWNER_KEY or ""
+
+    identity = get("identity")
+    if isinstance(identity, dict):
+        location_line = str(get("location_line") or identity.get("location_line", ""))
+    else:
+        location_line = str(get("location_line") or "")
+
+    return {
+        "venue_id": vid,
+        "venue_name": name,
+        "name": name,
+        "plan": str(get("plan") or ""),
+        "google_sheet_id": sid,
+        "status": status,
+        "active": _venue_is_active(vid),
+        "sheet_ok": sheet_ok,
+        "sheet": {
+            "ok": sheet_ok,
+            "last_checked": last_checked,
+            "sheet_id": sid,
+        },
+        "ready": ready,
+        "last_checked": last_checked,
+        "last_activity": get("updated_at") or get("created_at") or "",
+        "admin_url": str(get("admin_url") or "").strip(),
+        "manager_url": str(get("manager_url") or "").strip(),
+        "qr_url": str(get("qr_url") or "").strip(),
+        "admin_key": first_admin_key,
+        "location_line": location_line,
+    }
+
 @app.get("/super/api/venues")
 def super_api_venues_list():
     """Return full list of venues with platform metadata per spec."""
@@ -17328,65 +19396,7 @@ def super_api_venues_list():
         pass
 
     venues = _load_venues_from_disk() or {}
-    out = []
-    for vid, cfg in sorted((venues or {}).items(), key=lambda kv: kv[0]):
-        if not isinstance(cfg, dict):
-            continue
-
-        name = str(cfg.get("venue_name") or cfg.get("name") or vid)
-        sid = _venue_sheet_id(vid)
-        sheet_ok = cfg.get("sheet_ok", None)
-        ready = bool(cfg.get("ready", False))
-        is_active = bool(_venue_is_active(vid))
-
-        status = str(cfg.get("status") or "").strip()
-        if not sid:
-            status = "MISSING_SHEET"
-        elif sheet_ok is True and ready:
-            status = "READY"
-        elif sheet_ok is False:
-            status = "SHEET_FAIL"
-        else:
-            status = status or "SHEET_SET"
-
-        access = cfg.get("access") if isinstance(cfg.get("access"), dict) else {}
-        a_keys = access.get("admin_keys") if isinstance(access.get("admin_keys"), list) else []
-        k = cfg.get("keys") if isinstance(cfg.get("keys"), dict) else {}
-        first_admin_key = ""
-        if a_keys:
-            first_admin_key = str(a_keys[0]).strip()
-        elif k and k.get("admin_key"):
-            first_admin_key = str(k["admin_key"]).strip()
-        if not first_admin_key:
-            first_admin_key = ADMIN_OWNER_KEY or ""
-
-        admin_url = str(cfg.get("admin_url") or "").strip()
-        manager_url = str(cfg.get("manager_url") or "").strip()
-        qr_url = str(cfg.get("qr_url") or "").strip()
-
-        out.append({
-            "venue_id": vid,
-            "venue_name": name,
-            "name": name,
-            "plan": str(cfg.get("plan") or ""),
-            "google_sheet_id": sid,
-            "status": status,
-            "active": is_active,
-            "sheet_ok": sheet_ok,
-            "sheet": {
-                "ok": sheet_ok,
-                "last_checked": cfg.get("last_checked"),
-                "sheet_id": sid,
-            },
-            "ready": ready,
-            "last_checked": cfg.get("last_checked"),
-            "last_activity": cfg.get("updated_at") or cfg.get("created_at") or "",
-            "admin_url": admin_url,
-            "manager_url": manager_url,
-            "qr_url": qr_url,
-            "admin_key": first_admin_key,
-            "location_line": str(cfg.get("location_line") or cfg.get("identity", {}).get("location_line", "") if isinstance(cfg.get("identity"), dict) else cfg.get("location_line") or ""),
-        })
+    out = [_super_venue_row(vid, cfg) for vid, cfg in ((v, venues.get(v)) for v in _sorted_venue_ids()) if isinstance(cfg, dict)]
 
     return jsonify({"ok": True, "total": len(out), "venues": out})
 
@@ -17422,9 +19432,15 @@ def super_api_venues_rotate_keys():
     base = _public_base_url()
     cfg["admin_url"] = f"{base}/admin?key={new_admin}&venue={venue_id}"
     cfg["manager_url"] = f"{base}/admin?key={new_manager}&venue={venue_id}"
-    cfg["updated_at"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    cfg["updated_at"] = _utc_z_now()
 
-    wrote, write_path, err = _write_venue_config(venue_id, cfg)
+    wrote = False
+    err = ""
+    try:
+        _write_json_now(os.path.join(VENUES_DIR, f"{venue_id}.json"), cfg)
+        wrote = True
+    except Exception as e:
+        err = str(e)
     _invalidate_venues_cache()
 
     try:
@@ -17432,34 +19448,25 @@ def super_api_venues_rotate_keys():
     except Exception:
         pass
 
-    return jsonify({
-        "ok": True,
-        "admin_key": new_admin,
-        "manager_key": new_manager,
-    })
-
-@app.get("/super/api/leads")
-def super_api_leads():
-    """Cross-venue leads for Super Admin (read-only)."""
-    ok, resp = _require_super_admin()
-    if not ok:
-        return resp
+    if not wrote:
+        # The new keys were never saved (old keys stay valid): don't hand them out.
+        return jsonify({"ok": False, "error": f"could not save venue config: {err}"}), 500
 
-    # Server-authoritative demo mode (Redis preferred, disk fallback)
-    demo_enabled = False
-    try:
-        _redis_init_if_needed()
-        if _REDIS_ENABLED and _REDIS:
-            rec = _redis_get_json(f"{_REDIS_NS}:demo_mode", default={}) or {}
-            demo_enabled = bool(rec.get("enabled"))
-    except Exception:
-        pass
-    if not demo_enabled:
-        try:
-            rec = _safe_read_json_file("/tmp/wc26_demo_mode.json", default={}) or {}
-            demo_enabled = bool(rec.get("enabled"))
-        except Exception:
-            demo_enabled = False
+    return jsonify({
+        "ok": True,
+        "admin_key": new_admin,
+        "manager_key": new_manager,
+    })
+
+@app.get("/super/api/leads")
+def super_api_leads():
+    """Cross-venue leads for Super Admin (read-only)."""
+    ok, resp = _require_super_admin()
+    if not ok:
+        return resp
+
+    # Server-authoritative demo mode (Redis preferred, disk fallback; cached briefly in-process)
+    demo_enabled = _demo_mode_server()
 
     try:
         q = (request.args.get("q") or "").strip().lower()
@@ -17473,16 +19480,47 @@ def super_api_leads():
         if venue_id and (not demo_enabled) and (not _venue_is_active(venue_id)):
             return jsonify({"ok": True, "items": [], "total": 0, "page": page})
 
-        # newest-ish first by datetime string
-        try:
-            all_items.sort(key=lambda x: x.get("datetime",""), reverse=True)
-        except Exception:
-            pass
+        # Collect leads across venues (sheet rows -> dicts keyed by normalized header)
+        all_items: List[Dict[str, Any]] = []
+        for vid in ([venue_id] if venue_id else _sorted_venue_ids()):
+            if (not demo_enabled) and (not _venue_is_active(vid)):
+                continue
+            try:
+                rows = read_leads(limit=0, venue_id=vid) or []
+            except Exception:
+                continue
+            if len(rows) < 2:
+                continue
+            keys = [_normalize_header(h) for h in (rows[0] or [])]
+            for r in rows[1:]:
+                if not isinstance(r, list):
+                    continue
+                it = {k: (r[i] if i < len(r) else "") for i, k in enumerate(keys) if k}
+                it["venue_id"] = vid
+                it["datetime"] = it.get("timestamp", "")
+                # Demo Mode: search the masked lead, so result counts can't probe hidden PII.
+                if q and q not in " ".join(str(v) for v in (_apply_demo_mask_to_lead(it) if demo_enabled else it).values()).lower():
+                    continue
+                all_items.append(it)
 
         total = len(all_items)
         start_i = (page-1)*per_page
         end_i = start_i + per_page
-        page_items = all_items[start_i:end_i]
+
+        # newest-ish first by datetime string ("datetime" is always set on ingest above).
+        # Shallow pages (the common page=1 case) use a bounded heap: O(N log k) instead of O(N log N).
+        try:
+            key_fn = operator.itemgetter("datetime")
+            if end_i < total // 4:
+                page_items = heapq.nlargest(end_i, all_items, key=key_fn)[start_i:end_i]
+            else:
+                page_items = sorted(all_items, key=key_fn, reverse=True)[start_i:end_i]
+        except Exception:
+            page_items = all_items[start_i:end_i]
+
+        # Mask strictly after slicing (cost scales with per_page, not total)
+        if demo_enabled:
+            page_items = _apply_demo_mask_to_leads(page_items)
 
         return jsonify({"ok": True, "items": page_items, "total": total, "page": page, "per_page": per_page})
     except Exception as e:
@@ -17533,7 +19571,7 @@ def super_api_leads():
         "sheet_id": sid,
         "title": title,
         "error": err,
-        "checked_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "checked_at": _utc_z_now(),
     }
     if details:
         chk["details"] = details
@@ -17686,11 +19724,8 @@ def admin_api_prod_gate():
     redis_enabled = bool(rs.get("redis_enabled"))
     redis_namespace = rs.get("redis_namespace") or ""
 
-    # Run the same write/read smoke used by CI, and ensure no disk fallback
-    global _REDIS_FALLBACK_USED, _REDIS_FALLBACK_LAST_PATH
-    _REDIS_FALLBACK_USED = False
-    _REDIS_FALLBACK_LAST_PATH = ""
-
+    # Write/read smoke straight against Redis: SET EX + GET pipelined in one round-trip.
+    # (No file shim involved, so a disk fallback is impossible by construction.)
     smoke_ok = False
     smoke_detail = {}
     if redis_enabled:
@@ -17700,14 +19735,13 @@ def admin_api_prod_gate():
             "nonce": secrets.token_hex(6),
         }
         try:
-            _safe_write_json_file(CI_SMOKE_FILE, payload)
-            got = _safe_read_json_file(CI_SMOKE_FILE, default=None)
+            got = _redis_pipeline_smoke(f"{_REDIS_NS}:ci_smoke", payload)
             match = (got == payload)
-            smoke_ok = bool(match) and (not _REDIS_FALLBACK_USED)
+            smoke_ok = bool(match)
             smoke_detail = {
                 "match": bool(match),
-                "fallback_used": bool(_REDIS_FALLBACK_USED),
-                "fallback_last_path": _REDIS_FALLBACK_LAST_PATH,
+                "fallback_used": False,
+                "fallback_last_path": "",
             }
         except Exception as e:
             smoke_ok = False
@@ -17715,7 +19749,7 @@ def admin_api_prod_gate():
 
     ok_all = bool(looks_like_gunicorn and wsgi_loaded and redis_enabled and smoke_ok)
 
-    return jsonify({
+    return _json_response({
         "ok": ok_all,
         "checks": {
             "gunicorn": {"ok": bool(looks_like_gunicorn), "server_software": server_sw},
@@ -17730,7 +19764,75 @@ def admin_api_prod_gate():
             "redis_url_effective": rs.get("redis_url_effective") or "",
             "redis_error": rs.get("redis_error") or "",
         },
-    }), (200 if ok_all else 500)
+    }, 200 if ok_all else 500)
+# Lead object fields produced from sheet rows (already normalized header names), in output order
+_LEAD_ITEM_FIELDS = (
+    "timestamp", "name", "phone", "date", "time", "party_size", "language", "status", "vip",
+    "entry_point", "tier", "queue", "business_context", "budget", "notes", "vibe",
+)
+_LEAD_ITEM_KNOWN_KEYS = frozenset(("_venue_id", "sheet_row") + _LEAD_ITEM_FIELDS)
+_LEAD_TS_KEYS = ("timestamp", "created_at", "created", "ts", "Submitted At", "submitted_at")
+
+
+def _lead_ts(o: Dict[str, Any]) -> str:
+    for k in _LEAD_TS_KEYS:
+        v = o.get(k)
+        if v:
+            return str(v)
+    return ""
+
+
+@functools.lru_cache(maxsize=8192)
+def _lead_epoch(ts: str) -> float:
+    """Lead timestamp string -> Unix seconds (formats per _lead_ts_to_dt, or epoch s/ms); 0.0 when unparseable."""
+    s = (ts or "").strip()
+    if not s:
+        return 0.0
+    if s.isdigit() and len(s) >= 9:  # shorter digit runs (e.g. YYYYMMDD) are dates, not epochs
+        n = float(s)
+        return n / 1000.0 if n > 1e12 else n
+    dt = _lead_ts_to_dt(s)
+    return dt.timestamp() if dt else 0.0
+
+
+def _lead_haystack(o: Dict[str, Any]) -> str:
+    """Lowercased text the leads_all `q` search matches against."""
+    return " ".join([
+        str(o.get("venue_name") or o.get("_venue_name") or ""),
+        str(o.get("venue_id") or o.get("_venue_id") or ""),
+        str(o.get("name") or o.get("customer_name") or ""),
+        str(o.get("phone") or o.get("phone_number") or ""),
+        str(o.get("status") or ""),
+        str(o.get("tier") or ""),
+    ]).lower()
+
+
+def _lead_order_key(o: Dict[str, Any]) -> Tuple[float, str, int]:
+    """Total newest-first order for merged leads: (parsed timestamp, venue_id, sheet_row)."""
+    try:
+        row = int(o.get("sheet_row") or 0)
+    except Exception:
+        row = 0
+    return (_lead_epoch(_lead_ts(o)), str(o.get("_venue_id") or ""), row)
+
+
+def _encode_leads_cursor(key: Tuple[float, str, int]) -> str:
+    raw = json.dumps([key[0], key[1], int(key[2])], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_leads_cursor(cursor: str) -> Optional[Tuple[float, str, int]]:
+    """Opaque cursor -> order key; None when missing/invalid (caller falls back to `page`)."""
+    cursor = (cursor or "").strip()
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        ts, vid, row = json.loads(raw.decode("utf-8"))
+        return (float(ts), str(vid), int(row))
+    except Exception:
+        return None
+
 @app.get("/admin/api/leads_all")
 def admin_api_leads_all():
     """Owner-only: merge leads across all venues (SUPER_ADMIN_KEY or global owner key).
@@ -17746,7 +19848,38 @@ def admin_api_leads_all():
         if not ok:
             return resp
 
+    # Short-TTL response cache (dashboards poll this); ?refresh=1 bypasses it.
+    # Misses are computed under a per-key lock, so a burst of identical polls does the fan-out once.
+    refresh = (request.args.get("refresh") or "").strip().lower() in _TRUTHY
+    cache_key = (
+        bool(_demo_mode_enabled()),
+        tuple(sorted((k, tuple(v)) for k, v in request.args.lists() if k not in ("refresh", "format"))),
+    )
+    payload = None if refresh else _leads_all_cache_get(cache_key)
+    if payload is None:
+        with _leads_all_compute_lock(cache_key):
+            payload = None if refresh else _leads_all_cache_get(cache_key)
+            if payload is None:
+                payload = _admin_leads_all_payload()
+                _leads_all_cache_put(cache_key, payload)
+
+    # ?format=ndjson: one meta line, then one lead per line (no single large JSON document).
+    if (request.args.get("format") or "").strip().lower() == "ndjson":
+        meta = {k: v for k, v in payload.items() if k != "items"}
+        page_items = payload.get("items") or []
 
+        def _stream():
+            yield _dumps_json_compact({"meta": meta}) + b"\n"
+            for obj in page_items:
+                yield _dumps_json_compact(obj) + b"\n"
+
+        return Response(stream_with_context(_stream()), mimetype="application/x-ndjson")
+
+    return _json_response(payload)
+
+
+def _admin_leads_all_payload() -> Dict[str, Any]:
+    """Build the admin_api_leads_all response body from request.args (uncached)."""
     try:
         limit = int(request.args.get("limit") or 500)
     except Exception:
@@ -17767,6 +19900,8 @@ def admin_api_leads_all():
             page = 1
     except Exception:
         page = 1
+    # Keyset pagination: `cursor` (from a previous `next_cursor`) takes precedence over `page`.
+    cursor_key = _decode_leads_cursor(request.args.get("cursor") or "")
     try:
         per_page = int(request.args.get("per_page") or "")
     except Exception:
@@ -17787,136 +19922,136 @@ def admin_api_leads_all():
 
     errors: List[Dict[str, Any]] = []
     items: List[Dict[str, Any]] = []
+    # Demo Mode: `q` matches the masked values, so result counts can't probe hidden PII.
+    demo = bool(_demo_mode_enabled())
 
     # helper: map sheet rows to objects using header row 1
-    def rows_to_items(rows: List[List[str]], venue_id: str) -> None:
+    def rows_to_items(rows: List[List[str]], venue_id: str) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
         if not rows or len(rows) < 2:
-            return
+            return out
         header = rows[0] or []
         body = rows[1:] or []
 
-        # normalize header -> index
+        # Normalize the header once per venue: header -> index, fixed field -> column,
+        # and the extra (future-proof) columns not already covered by the fixed fields.
         hmap: Dict[str, int] = {}
+        extra_cols: List[Tuple[str, int]] = []
+        seen = set(_LEAD_ITEM_KNOWN_KEYS)
         for i, h in enumerate(header):
             try:
-                hmap[_normalize_header(h)] = i
+                k = _normalize_header(h)
             except Exception:
-                pass
-
-        def get_cell(r: List[str], key: str) -> str:
-            i = hmap.get(_normalize_header(key), -1)
-            if i < 0 or i >= len(r):
-                return ""
-            v = r[i]
-            return "" if v is None else str(v)
+                continue
+            hmap[k] = i
+            if k and k not in seen:
+                seen.add(k)
+                extra_cols.append((h, i))
+        field_cols = [(f, hmap.get(f, -1)) for f in _LEAD_ITEM_FIELDS]
 
         bsr = (_LEADS_CACHE_BY_VENUE.get(_slugify_venue_id(venue_id)) or {}).get("body_sheet_rows") or []
+        if not isinstance(bsr, list):
+            bsr = []
+        n_bsr = len(bsr)
         for off, r in enumerate(body):
             if not isinstance(r, list):
                 continue
-            sr = bsr[off] if isinstance(bsr, list) and off < len(bsr) else off + 2
+            n = len(r)
             obj = {
                 "_venue_id": venue_id,
-                "sheet_row": sr,
-                "timestamp": get_cell(r, "timestamp"),
-                "name": get_cell(r, "name"),
-                "phone": get_cell(r, "phone"),
-                "date": get_cell(r, "date"),
-                "time": get_cell(r, "time"),
-                "party_size": get_cell(r, "party_size"),
-                "language": get_cell(r, "language"),
-                "status": get_cell(r, "status"),
-                "vip": get_cell(r, "vip"),
-                "entry_point": get_cell(r, "entry_point"),
-                "tier": get_cell(r, "tier"),
-                "queue": get_cell(r, "queue"),
-                "business_context": get_cell(r, "business_context"),
-                "budget": get_cell(r, "budget"),
-                "notes": get_cell(r, "notes"),
-                "vibe": get_cell(r, "vibe"),
+                "sheet_row": bsr[off] if off < n_bsr else off + 2,
             }
+            for f, i in field_cols:
+                v = r[i] if 0 <= i < n else None
+                obj[f] = "" if v is None else str(v)
 
             # add any extra columns (future-proof)
-            try:
-                for i, h in enumerate(header):
-                    k = _normalize_header(h)
-                    if k and k not in set(_normalize_header(x) for x in obj.keys()):
-                        if i < len(r):
-                            obj[h] = r[i]
-            except Exception:
-                pass
+            for h, i in extra_cols:
+                if i < n:
+                    obj[h] = r[i]
 
-            items.append(obj)
+            if q:
+                # built once per lead (in the fan-out worker); stripped from the returned page
+                obj["_search"] = _lead_haystack(_apply_demo_mask_to_lead(obj) if demo else obj)
+            out.append(obj)
+        return out
 
     # iterate through venue configs
     venues = _iter_venue_json_configs() or []
     if not venues:
-        return jsonify({"ok": True, "count": 0, "items": [], "errors": [{"venue_id": "", "error": "No venue configs found in config/venues/"}]})
-
-    for v in venues:
-        vid = str((v or {}).get('venue_id') or '')
-        try:
-            rows = read_leads(limit=per_venue, venue_id=vid) or []
-            rows_to_items(rows, vid)
-        except Exception as e:
-            errors.append({"venue_id": vid, "error": str(e)})
-
-    # newest-first best-effort (timestamp string sort)
-    def _ts(o: Dict[str, Any]) -> str:
-        for k in ("timestamp", "created_at", "created", "ts", "Submitted At", "submitted_at"):
-            v = o.get(k)
-            if v:
-                return str(v)
-        return ""
-
-    items.sort(key=_ts, reverse=True)
-    if limit and len(items) > limit:
-        items = items[:limit]
+        return {"ok": True, "count": 0, "items": [], "errors": [{"venue_id": "", "error": "No venue configs found in config/venues/"}]}
 
-
-    # Demo Mode: mask PII for safe demos
-    if _demo_mode_enabled():
-        try:
-            items = [_apply_demo_mask_to_lead(x) for x in (items or [])]
-        except Exception:
-            pass
-
-    
-    # Apply filters (defensive; never hard-fail)
+    # Fan out the (I/O-bound) per-venue sheet reads; latency ~ slowest venue instead of the sum.
+    # Results are collected (and sorted) per venue, then k-way merged, so no shared-list locking.
+    vids = [str((v or {}).get('venue_id') or '') for v in venues]
+    # Push the venue filters down to the fan-out: skip reading sheets whose rows would all be
+    # filtered out below (the per-item filters still run as the exact check).
     try:
         if venue_id:
-            items = [o for o in items if str(o.get("venue_id") or o.get("_venue_id") or "") == venue_id]
-    except Exception:
-        pass
-    try:
+            want_vid = _slugify_venue_id(venue_id)
+            vids = [v for v in vids if _slugify_venue_id(v) == want_vid]
         if venue_state in ("active", "inactive"):
-            want = (venue_state == "active")
-            items = [o for o in items if bool(_venue_is_active(str(o.get("venue_id") or o.get("_venue_id") or ""))) == want]
+            want_active = (venue_state == "active")
+            vids = [v for v in vids if bool(_venue_is_active(v)) == want_active]
     except Exception:
         pass
+    per_vid: Dict[str, List[Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(16, len(vids)))) as ex:
+        futs = {ex.submit(read_leads, per_venue, vid): vid for vid in vids}
+        for fut in as_completed(futs):
+            vid = futs[fut]
+            try:
+                lst = rows_to_items(fut.result() or [], vid)
+                # sheet rows are appended chronologically, so this is a near-linear timsort
+                lst.sort(key=_lead_order_key, reverse=True)
+                per_vid[vid] = lst
+            except Exception as e:
+                errors.append({"venue_id": vid, "error": str(e)})
+
+    # newest-first by parsed timestamp (mixed formats sort correctly); venue/row break ties so cursors are stable.
+    # O(N log K) merge of the per-venue lists, stopped after `limit` items.
+    merged = heapq.merge(*(per_vid.get(vid) or [] for vid in vids), key=_lead_order_key, reverse=True)
+    items = list(itertools.islice(merged, limit or None))
+
+    # Apply filters in one pass (defensive; never hard-fail): every active predicate is checked
+    # per lead, stopping at the first miss, instead of one list rebuild per filter.
+    preds: List[Any] = []  # predicates over one lead dict
+    if venue_id:
+        preds.append(lambda o: str(o.get("venue_id") or o.get("_venue_id") or "") == venue_id)
+    if venue_state in ("active", "inactive"):
+        want = (venue_state == "active")
+        # One lookup per distinct venue, not per lead.
+        _active = functools.lru_cache(maxsize=None)(lambda vid: bool(_venue_is_active(vid)))
+        preds.append(lambda o: _active(str(o.get("venue_id") or o.get("_venue_id") or "")) == want)
+    if q:
+        qq = q.lower()
+        preds.append(lambda o: qq in o.get("_search", ""))
     try:
-        if q:
-            qq = q.lower()
-            def _matches(o):
-                hay = " ".join([
-                    str(o.get("venue_name") or o.get("_venue_name") or ""),
-                    str(o.get("venue_id") or o.get("_venue_id") or ""),
-                    str(o.get("name") or o.get("customer_name") or ""),
-                    str(o.get("phone") or o.get("phone_number") or ""),
-                    str(o.get("status") or ""),
-                    str(o.get("tier") or ""),
-                ]).lower()
-                return qq in hay
-            items = [o for o in items if _matches(o)]
+        if preds:
+            items = [o for o in items if all(p(o) for p in preds)]
     except Exception:
         pass
 
     total = len(items)
 
-    # Paginate
-    start_i = (page - 1) * per_page
-    end_i = start_i + per_page
-    page_items = items[start_i:end_i]
+    # Paginate: keyset when a cursor is given (strictly older than the cursor), else OFFSET by page.
+    if cursor_key is not None:
+        window = list(itertools.islice((o for o in items if _lead_order_key(o) < cursor_key), per_page + 1))
+    else:
+        start_i = (page - 1) * per_page
+        window = items[start_i:start_i + per_page + 1]
+    page_items = window[:per_page]
+    next_cursor = _encode_leads_cursor(_lead_order_key(page_items[-1])) if (len(window) > per_page and page_items) else ""
+    if q:
+        for o in page_items:
+            o.pop("_search", None)
+
+    # Demo Mode: mask PII for safe demos (page only; the `q` haystack was built from masked values)
+    if demo:
+        try:
+            page_items = _apply_demo_mask_to_leads(page_items)
+        except Exception:
+            pass
 
     pages = 1
     try:
@@ -17926,16 +20061,17 @@ def admin_api_leads_all():
     except Exception:
         pages = 1
 
-    return jsonify({
+    return {
         "ok": True,
         "total": total,
         "count": total,
         "page": page,
         "per_page": per_page,
         "pages": pages,
+        "next_cursor": next_cursor,
         "items": page_items,
         "errors": errors
-    })
+    }
 
 # ============================================================
 # LEADS FILTER API (with status + time filtering)
@@ -18271,39 +20407,24 @@ def admin_api_leads_filter():
                 hmap[_normalize_header(h)] = i
             except:
                 pass
-        
-        def get_cell(r: List[str], key: str) -> str:
-            i = hmap.get(_normalize_header(key), -1)
-            if i < 0 or i >= len(r):
-                return ""
-            v = r[i]
-            return "" if v is None else str(v)
+        # Resolve field -> column once per sheet, not once per cell
+        vid_col = hmap.get("venue_id", -1)
+        field_cols = [(f, hmap.get(f, -1)) for f in _LEAD_ITEM_FIELDS]
         
         for off, r in enumerate(body):
             if not isinstance(r, list):
                 continue
-            cell_vid = (get_cell(r, "venue_id") or "").strip()
+            n = len(r)
+            v = r[vid_col] if 0 <= vid_col < n else None
+            cell_vid = ("" if v is None else str(v)).strip()
             sr = (body_sheet_rows[off] if body_sheet_rows and off < len(body_sheet_rows) else off + 2)
             obj = {
                 "_venue_id": _slugify_venue_id(cell_vid) if cell_vid else vid,
                 "sheet_row": sr,
-                "timestamp": get_cell(r, "timestamp"),
-                "name": get_cell(r, "name"),
-                "phone": get_cell(r, "phone"),
-                "date": get_cell(r, "date"),
-                "time": get_cell(r, "time"),
-                "party_size": get_cell(r, "party_size"),
-                "language": get_cell(r, "language"),
-                "status": get_cell(r, "status"),
-                "vip": get_cell(r, "vip"),
-                "entry_point": get_cell(r, "entry_point"),
-                "tier": get_cell(r, "tier"),
-                "queue": get_cell(r, "queue"),
-                "business_context": get_cell(r, "business_context"),
-                "budget": get_cell(r, "budget"),
-                "notes": get_cell(r, "notes"),
-                "vibe": get_cell(r, "vibe"),
             }
+            for f, i in field_cols:
+                v = r[i] if 0 <= i < n else None
+                obj[f] = "" if v is None else str(v)
             items.append(obj)
     
     # Read leads ONLY from the target venue (NO cross-venue data leakage)
@@ -18566,11 +20687,12 @@ FIXTURE_FEED_URL = os.environ.get(
 # Location label used by the feed for Dallas/Arlington matches.
 # (Verified in the fixture feed as "Dallas Stadium".)
 DALLAS_LOCATION_KEYWORDS = ["dallas stadium", "arlington", "at&t"]
+_DALLAS_RE = re.compile("|".join(map(re.escape, DALLAS_LOCATION_KEYWORDS)), re.IGNORECASE)
 
 # If the remote feed is empty/unavailable (e.g., schedule not published yet),
 # we serve a small premium "demo" dataset so the Schedule UI never goes blank.
 # As soon as the feed returns real matches, the app automatically switches to it.
-DEMO_FIXTURES_RAW: List[Dict[str, Any]] = [
+DEMO_FIXTURES_RAW: Tuple[Dict[str, Any], ...] = (
     {
         "MatchNumber": 1,
         "RoundNumber": 1,
@@ -18619,60 +20741,53 @@ DEMO_FIXTURES_RAW: List[Dict[str, Any]] = [
         "AwayTeamScore": None,
         "Status": "Scheduled",
     },
-]
+)
 
 # In-memory cache (plus optional disk cache) so we don't hit the feed too often.
-_fixtures_cache: Dict[str, Any] = {"loaded_at": 0, "matches": [], "source": "empty", "last_error": None}
+_fixtures_cache: Dict[str, Any] = {"loaded_at": 0, "matches": [], "source": "empty", "last_error": None,
+                                   "etag": "", "last_modified": "", "raw": None}
 FIXTURE_CACHE_SECONDS = int(os.environ.get("FIXTURE_CACHE_SECONDS", str(6 * 60 * 60)))  # 6h
-FIXTURE_CACHE_FILE = os.environ.get("FIXTURE_CACHE_FILE", "/tmp/wc26_{venue}_fixtures.json")
+FIXTURE_CACHE_FILE = os.environ.get("FIXTURE_CACHE_FILE", "/tmp/wc26_{venue}_fixtures.json.gz")
 POLL_STORE_FILE = os.environ.get("POLL_STORE_FILE", "/tmp/wc26_{venue}_poll_votes.json")
+# Append-only vote log used instead of POLL_STORE_FILE when Redis is off (one JSON line per vote).
+POLL_VOTES_JSONL = os.environ.get("POLL_VOTES_JSONL", "/tmp/wc26_{venue}_poll_votes.jsonl")
 
 
 def _safe_read_json_file(path: str, default: Any = None) -> Any:
     """Read JSON from Redis (if enabled) or disk safely."""
     # BUG FIX: Lookup Redis key BEFORE expanding {venue} placeholder
     # The _REDIS_PATH_KEY_MAP uses template paths with {venue}
-    original_path = str(path)
+    original_path = path if isinstance(path, str) else str(path)
+    vid = _venue_id()
     try:
-        vid = _venue_id()
         # Check Redis using the TEMPLATE path (with {venue})
         if _REDIS_ENABLED:
-            suffix = _REDIS_PATH_KEY_MAP.get(original_path)
-            if suffix:
-                full_key = f"{_REDIS_NS}:{vid}:{suffix}"
+            full_key = _redis_file_key(original_path, vid)
+            if full_key:
                 return _redis_get_json(full_key, default=default)
     except Exception:
         pass
 
     # Expand {venue} for disk fallback
-    try:
-        vid = _venue_id()
-        if '{venue}' in str(path):
-            path = str(path).replace('{venue}', vid)
-    except Exception:
-        pass
+    path = original_path.replace('{venue}', vid) if '{venue}' in original_path else original_path
 
     try:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+        return _read_cache_file(path)
     except Exception:
         return default
-    return default
 
 def _safe_write_json_file(path: str, payload: Any) -> None:
     global _REDIS_FALLBACK_USED, _REDIS_FALLBACK_LAST_PATH
     """Write JSON to Redis (if enabled) or disk safely."""
     # BUG FIX: Lookup Redis key BEFORE expanding {venue} placeholder
     # The _REDIS_PATH_KEY_MAP uses template paths with {venue}
-    original_path = str(path)
+    original_path = path if isinstance(path, str) else str(path)
+    vid = _venue_id()
     try:
-        vid = _venue_id()
         # Check Redis using the TEMPLATE path (with {venue})
         if _REDIS_ENABLED:
-            suffix = _REDIS_PATH_KEY_MAP.get(original_path)
-            if suffix:
-                full_key = f"{_REDIS_NS}:{_venue_id()}:{suffix}"
+            full_key = _redis_file_key(original_path, vid)
+            if full_key:
                 ok = _redis_set_json(full_key, payload)
                 if ok:
                     return
@@ -18689,17 +20804,21 @@ def _safe_write_json_file(path: str, payload: Any) -> None:
 
 
     # Expand {venue} for disk fallback
-    try:
-        vid = _venue_id()
-        if '{venue}' in str(path):
-            path = str(path).replace('{venue}', vid)
-    except Exception:
-        pass
+    path = original_path.replace('{venue}', vid) if '{venue}' in original_path else original_path
 
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False)
+        if path.endswith(".msgpack") and msgpack is not None:
+            try:
+                _write_bytes_file(path, msgpack.packb(payload, use_bin_type=True))
+                return
+            except Exception:
+                pass  # not msgpack-encodable: fall through to JSON
+        if path.endswith(".gz"):
+            # Compressed cache files (e.g. fixtures): fast level, readers detect gzip by magic bytes
+            _write_bytes_file(path, gzip.compress(_dumps_json_compact(payload), compresslevel=1))
+            return
+        # orjson bytes (stdlib fallback) straight to disk: no str encode / text-mode writer
+        _write_bytes_file(path, _dumps_json_compact(payload))
     except Exception:
         pass
 
@@ -18718,29 +20837,39 @@ def _fetch_fixture_feed() -> List[Dict[str, Any]]:
         ...
       }
     """
-    import urllib.request
 
-    req = urllib.request.Request(
-        FIXTURE_FEED_URL,
-        headers={"User-Agent": "worldcup-concierge/1.0"},
-        method="GET",
-    )
-    # Network can be slow/unreliable on some hosts. Use a safer timeout + small retry.
+    headers = {"User-Agent": "worldcup-concierge/1.0"}
+    # Conditional GET: only when we still hold the last raw payload to fall back to on 304.
+    cached_raw = _fixtures_cache.get("raw")
+    if isinstance(cached_raw, list):
+        if _fixtures_cache.get("etag"):
+            headers["If-None-Match"] = _fixtures_cache["etag"]
+        if _fixtures_cache.get("last_modified"):
+            headers["If-Modified-Since"] = _fixtures_cache["last_modified"]
+    # Network can be slow/unreliable on some hosts. Use a safer timeout + small retry
+    # (retries reuse the pooled keep-alive connection when `requests` is available).
     last_err = None
     for _attempt in range(3):
         try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
+            status, body, etag, last_modified = _fixture_http_get(headers)
+            if status == 304 and not isinstance(cached_raw, list):
+                raise ValueError("Fixture feed returned 304 without a cached payload")
             last_err = None
             break
         except Exception as _e:
             last_err = _e
     if last_err is not None:
         raise last_err
+    if status == 304:
+        # Unchanged upstream: skip download + parse, re-normalize the payload we already have
+        return cached_raw
 
-    payload = json.loads(raw)
+    payload = json.loads(body.decode("utf-8", errors="replace"))
     if not isinstance(payload, list):
         raise ValueError("Fixture feed response was not a list")
+    _fixtures_cache["raw"] = payload
+    _fixtures_cache["etag"] = etag
+    _fixtures_cache["last_modified"] = last_modified
     return payload
 
 
@@ -18753,8 +20882,9 @@ def _fmt_time_12h(dt_utc: datetime) -> str:
     - Uses a cross-platform formatter (Windows doesn't support %-I).
     """
     local_dt = dt_utc.astimezone()  # local tz on host
-    # %I gives zero-padded hour; strip leading 0 for '7:00 PM'
-    return local_dt.strftime("%I:%M %p").lstrip("0")
+    # Same output as strftime("%I:%M %p").lstrip("0"), without format parsing or locale lookups
+    h = local_dt.hour
+    return f"{h % 12 or 12}:{local_dt.minute:02d} {_AMPM[h >= 12]}"
 
 
 def _parse_dateutc(date_utc_str: str) -> Optional[datetime]:
@@ -18765,15 +20895,10 @@ def _parse_dateutc(date_utc_str: str) -> Optional[datetime]:
         s = (date_utc_str or "").strip()
         if not s:
             return None
-        # Normalize to ISO-ish for fromisoformat by removing Z
-        if s.endswith("Z"):
-            s2 = s[:-1].replace(" ", "T")
-            dt = datetime.fromisoformat(s2)
-            return dt.replace(tzinfo=timezone.utc)
-        # fallback
-        s2 = s.replace(" ", "T")
-        dt = datetime.fromisoformat(s2)
-        return dt.replace(tzinfo=timezone.utc)
+        # fromisoformat accepts any date/time separator (' ' or 'T'); only the Z suffix needs dropping.
+        if s[-1] == "Z":
+            s = s[:-1]
+        return datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
     except Exception:
         return None
 
@@ -18796,16 +20921,23 @@ def load_all_matches(force: bool = False) -> List[Dict[str, Any]]:
       }
     """
     now = int(time.time())
-    if not force and _fixtures_cache["matches"] and (now - int(_fixtures_cache["loaded_at"] or 0) < FIXTURE_CACHE_SECONDS):
-        return _fixtures_cache["matches"]
+    if not force and _fixtures_cache["matches"]:
+        age = now - int(_fixtures_cache["loaded_at"] or 0)
+        if age < FIXTURE_CACHE_SECONDS:
+            return _fixtures_cache["matches"]
+        if age < FIXTURE_STALE_SECONDS:
+            _schedule_fixture_refresh()
+            return _fixtures_cache["matches"]
 
     # Try disk cache first (fast + survives restarts)
     disk = _safe_read_json_file(FIXTURE_CACHE_FILE)
     if disk and isinstance(disk, dict) and isinstance(disk.get("matches"), list):
         loaded_at = int(disk.get("loaded_at") or 0)
-        if not force and loaded_at and (now - loaded_at < FIXTURE_CACHE_SECONDS):
+        if not force and loaded_at and (now - loaded_at < FIXTURE_STALE_SECONDS):
             _fixtures_cache["loaded_at"] = loaded_at
             _fixtures_cache["matches"] = disk["matches"]
+            if now - loaded_at >= FIXTURE_CACHE_SECONDS:
+                _schedule_fixture_refresh()
             return _fixtures_cache["matches"]
 
     # Fetch fresh (but fall back to any cache if the network times out)
@@ -18838,44 +20970,61 @@ def load_all_matches(force: bool = False) -> List[Dict[str, Any]]:
         raw_matches = list(DEMO_FIXTURES_RAW)
         _fixtures_cache["source"] = "demo"
     norm: List[Dict[str, Any]] = []
+
+    # Scores (best-effort; feed includes finals once matches are completed)
+    def _to_int(x):
+        if type(x) is int:
+            return x  # JSON feeds send scores as numbers; skip the str/float round-trip
+        try:
+            if x is None or x == "":
+                return None
+            return int(float(str(x).strip()))
+        except Exception:
+            return None
+
+    # Loop invariants: one clock read per load; a match is "live" for 2h30 after kickoff.
+    nowu = datetime.now(timezone.utc)
+    live_window = timedelta(hours=2, minutes=30)
+    append = norm.append
     for m in raw_matches:
-        dt = _parse_dateutc(m.get("DateUtc") or "")
+        g = m.get
+        date_utc = g("DateUtc") or ""
+        dt = _parse_dateutc(date_utc)
         if not dt:
             continue
+        if len(date_utc) == 20 and date_utc[10] in "T " and date_utc[19] == "Z":
+            # Canonical feed value ("YYYY-MM-DD HH:MM:SSZ"): slice instead of re-formatting dt
+            day = date_utc[:10]
+            stamp = f"{day}T{date_utc[11:19]}Z"
+        else:
+            day = dt.date().isoformat()
+            stamp = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        match_num = int(m.get("MatchNumber") or 0) or None
+        match_num = int(g("MatchNumber") or 0) or None
         match_id = f"wc-{match_num:03d}" if match_num else f"wc-{len(norm)+1:03d}"
-        # Scores (best-effort; feed includes finals once matches are completed)
-        def _to_int(x):
-            try:
-                if x is None or x == "":
-                    return None
-                return int(float(str(x).strip()))
-            except Exception:
-                return None
 
-        hs = _to_int(m.get("HomeTeamScore") if "HomeTeamScore" in m else m.get("HomeScore"))
-        as_ = _to_int(m.get("AwayTeamScore") if "AwayTeamScore" in m else m.get("AwayScore"))
+        hs = _to_int(g("HomeTeamScore") if "HomeTeamScore" in m else g("HomeScore"))
+        as_ = _to_int(g("AwayTeamScore") if "AwayTeamScore" in m else g("AwayScore"))
 
         # Status (UI hints; true "live" requires a live data provider)
-        nowu = datetime.now(timezone.utc)
-        kickoff = dt.replace(tzinfo=timezone.utc)
+        # (_parse_dateutc already returns UTC-aware datetimes)
+        ends = dt + live_window
         status = "upcoming"
-        if nowu >= kickoff and nowu <= (kickoff + timedelta(hours=2, minutes=30)):
+        if dt <= nowu <= ends:
             status = "live"
-        if nowu > (kickoff + timedelta(hours=2, minutes=30)) and (hs is not None or as_ is not None):
+        if nowu > ends and (hs is not None or as_ is not None):
             status = "finished"
 
-        norm.append({
+        append({
             "id": match_id,
             "match_number": match_num,
-            "stage": (m.get("Group") or "").strip() or "Match",
-            "date": dt.date().isoformat(),
+            "stage": _feed_str(g("Group")).strip() or "Match",
+            "date": day,
             "time": _fmt_time_12h(dt),
-            "datetime_utc": dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "venue": (m.get("Location") or "").strip(),
-            "home": (m.get("HomeTeam") or "").strip(),
-            "away": (m.get("AwayTeam") or "").strip(),
+            "datetime_utc": stamp,
+            "venue": _feed_str(g("Location")).strip(),
+            "home": _feed_str(g("HomeTeam")).strip(),
+            "away": _feed_str(g("AwayTeam")).strip(),
             "home_score": hs,
             "away_score": as_,
             "status": status,
@@ -18888,312 +21037,60 @@ def load_all_matches(force: bool = False) -> List[Dict[str, Any]]:
         _fixtures_cache["source"] = "remote"
     if _fixtures_cache.get("source") == "remote":
         _fixtures_cache["last_error"] = None
-    _safe_write_json_file(FIXTURE_CACHE_FILE, {"loaded_at": now, "matches": norm})
-
-    return norm
-
-
-def is_dallas_match(m: Dict[str, Any]) -> bool:
-    v = (m.get("venue") or "").lower()
-    return any(k in v for k in DALLAS_LOCATION_KEYWORDS)
-
-
-def filter_matches(scope: str, q: str = "") -> List[Dict[str, Any]]:
-    scope = (scope or "all").lower().strip()
-    q = (q or "").strip().lower()
-
-    matches = load_all_matches()
-    if scope != "all":
-        matches = [m for m in matches if is_dallas_match(m)]
-
-    if q:
-        def hit(m):
-            return (q in (m.get("home","").lower())
-                    or q in (m.get("away","").lower())
-                    or q in (m.get("venue","").lower())
-                    or q in (m.get("stage","").lower())
-                    or q in (m.get("date","").lower()))
-        matches = [m for m in matches if hit(m)]
-
-    return matches
-
-
-# ============================================================
-# Menu (4 languages) — edit/add items here
-# ============================================================
-MENU = {
-    "en": {
-        "title": "Menu",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Chef’s Wagyu Sliders",
-                "price": "$24",
-                "desc": "A5-style sear, truffle aioli, brioche. Limited matchday batch.",
-                "tag": "Chef Special"
-            },
-            {
-                "category_id": "chef",
-                "name": "Citrus Ceviche Bowl",
-                "price": "$19",
-                "desc": "Fresh catch, lime, chili, avocado, crunchy tostadas.",
-                "tag": "Chef Special"
-            },
-            {
-                "category_id": "bites",
-                "name": "Stadium Nachos XL",
-                "price": "$16",
-                "desc": "Three-cheese blend, jalapeño, pico, crema, choice of protein.",
-                "tag": "Share"
-            },
-            {
-                "category_id": "bites",
-                "name": "Peri-Peri Wings (8/16)",
-                "price": "$14/$24",
-                "desc": "Crispy wings, peri-peri glaze, citrus salt.",
-                "tag": "Hot"
-            },
-            {
-                "category_id": "classics",
-                "name": "Concierge Burger",
-                "price": "$18",
-                "desc": "Angus, cheddar, lettuce, tomato, house sauce, fries.",
-                "tag": "Classic"
-            },
-            {
-                "category_id": "classics",
-                "name": "Spicy Chicken Sandwich",
-                "price": "$16",
-                "desc": "Crispy chicken, spicy sauce, pickles, fries optional.",
-                "tag": "Fan Favorite"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Gold Medal Churros",
-                "price": "$10",
-                "desc": "Cinnamon sugar, chocolate dip.",
-                "tag": "Sweet"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Matchday Mocktail",
-                "price": "$9",
-                "desc": "Citrus, mint, sparkling finish.",
-                "tag": "Zero Proof"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Premium Espresso",
-                "price": "$5",
-                "desc": "Double shot, smooth crema.",
-                "tag": "Coffee"
-            }
-        ]
-    },
-    "es": {
-        "title": "Menú",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Mini hamburguesas Wagyu del Chef",
-                "price": "$24",
-                "desc": "Sellado estilo A5, alioli de trufa, brioche. Lote limitado.",
-                "tag": "Especial del Chef"
-            },
-            {
-                "category_id": "chef",
-                "name": "Bowl de Ceviche Cítrico",
-                "price": "$19",
-                "desc": "Pesca fresca, lima, chile, aguacate, tostadas.",
-                "tag": "Especial del Chef"
-            },
-            {
-                "category_id": "bites",
-                "name": "Nachos XL del Estadio",
-                "price": "$16",
-                "desc": "Tres quesos, jalapeño, pico, crema, proteína a elección.",
-                "tag": "Para compartir"
-            },
-            {
-                "category_id": "bites",
-                "name": "Alitas Peri-Peri (8/16)",
-                "price": "$14/$24",
-                "desc": "Alitas crujientes, glaseado peri-peri, sal cítrica.",
-                "tag": "Picante"
-            },
-            {
-                "category_id": "classics",
-                "name": "Hamburguesa Concierge",
-                "price": "$18",
-                "desc": "Angus, cheddar, lechuga, tomate, salsa de la casa, papas.",
-                "tag": "Clásico"
-            },
-            {
-                "category_id": "classics",
-                "name": "Sándwich de Pollo Picante",
-                "price": "$16",
-                "desc": "Pollo crujiente, salsa picante, pepinillos, papas opcionales.",
-                "tag": "Favorito"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Churros Medalla de Oro",
-                "price": "$10",
-                "desc": "Azúcar y canela, dip de chocolate.",
-                "tag": "Dulce"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Mocktail de Partido",
-                "price": "$9",
-                "desc": "Cítricos, menta, final espumoso.",
-                "tag": "Sin alcohol"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Espresso Premium",
-                "price": "$5",
-                "desc": "Doble shot, crema suave.",
-                "tag": "Café"
-            }
-        ]
-    },
-    "pt": {
-        "title": "Cardápio",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Mini Burgers Wagyu do Chef",
-                "price": "$24",
-                "desc": "Selagem estilo A5, aioli de trufa, brioche. Lote limitado.",
-                "tag": "Especial do Chef"
-            },
-            {
-                "category_id": "chef",
-                "name": "Bowl de Ceviche Cítrico",
-                "price": "$19",
-                "desc": "Peixe fresco, limão, pimenta, abacate, tostadas.",
-                "tag": "Especial do Chef"
-            },
-            {
-                "category_id": "bites",
-                "name": "Nachos XL do Estádio",
-                "price": "$16",
-                "desc": "Três queijos, jalapeño, pico, creme, proteína à escolha.",
-                "tag": "Compartilhar"
-            },
-            {
-                "category_id": "bites",
-                "name": "Asinhas Peri-Peri (8/16)",
-                "price": "$14/$24",
-                "desc": "Asinhas crocantes, glaze peri-peri, sal cítrico.",
-                "tag": "Picante"
-            },
-            {
-                "category_id": "classics",
-                "name": "Burger Concierge",
-                "price": "$18",
-                "desc": "Angus, cheddar, alface, tomate, molho da casa, fritas.",
-                "tag": "Clássico"
-            },
-            {
-                "category_id": "classics",
-                "name": "Sanduíche de Frango Picante",
-                "price": "$16",
-                "desc": "Frango crocante, molho picante, picles, fritas opcionais.",
-                "tag": "Favorito"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Churros Medalha de Ouro",
-                "price": "$10",
-                "desc": "Canela e açúcar, molho de chocolate.",
-                "tag": "Doce"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Mocktail de Jogo",
-                "price": "$9",
-                "desc": "Cítricos, hortelã, final com gás.",
-                "tag": "Sem álcool"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Espresso Premium",
-                "price": "$5",
-                "desc": "Dose dupla, crema suave.",
-                "tag": "Café"
-            }
-        ]
-    },
-    "fr": {
-        "title": "Menu",
-        "items": [
-            {
-                "category_id": "chef",
-                "name": "Mini-burgers Wagyu du Chef",
-                "price": "$24",
-                "desc": "Saisie style A5, aïoli à la truffe, brioche. Série limitée.",
-                "tag": "Spécialité du Chef"
-            },
-            {
-                "category_id": "chef",
-                "name": "Bol de Ceviche aux Agrumes",
-                "price": "$19",
-                "desc": "Poisson frais, citron vert, piment, avocat, tostadas.",
-                "tag": "Spécialité du Chef"
-            },
-            {
-                "category_id": "bites",
-                "name": "Nachos XL du Stade",
-                "price": "$16",
-                "desc": "Trois fromages, jalapeño, pico, crème, protéine au choix.",
-                "tag": "À partager"
-            },
-            {
-                "category_id": "bites",
-                "name": "Ailes Peri-Peri (8/16)",
-                "price": "$14/$24",
-                "desc": "Ailes croustillantes, glaçage peri-peri, sel aux agrumes.",
-                "tag": "Épicé"
-            },
-            {
-                "category_id": "classics",
-                "name": "Burger Concierge",
-                "price": "$18",
-                "desc": "Angus, cheddar, salade, tomate, sauce maison, frites.",
-                "tag": "Classique"
-            },
-            {
-                "category_id": "classics",
-                "name": "Sandwich Poulet Épicé",
-                "price": "$16",
-                "desc": "Poulet croustillant, sauce épicée, pickles, frites en option.",
-                "tag": "Favori"
-            },
-            {
-                "category_id": "sweets",
-                "name": "Churros Médaille d’Or",
-                "price": "$10",
-                "desc": "Cannelle-sucre, sauce chocolat.",
-                "tag": "Sucré"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Mocktail de Match",
-                "price": "$9",
-                "desc": "Agrumes, menthe, touche pétillante.",
-                "tag": "Sans alcool"
-            },
-            {
-                "category_id": "drinks",
-                "name": "Espresso Premium",
-                "price": "$5",
-                "desc": "Double, crème onctueuse.",
-                "tag": "Café"
-            }
-        ]
-    }
+    _safe_write_json_file(FIXTURE_CACHE_FILE, {"loaded_at": now, "matches": norm})
+
+    return norm
+
+
+def is_dallas_match(m: Dict[str, Any]) -> bool:
+    return _DALLAS_RE.search(m.get("venue") or "") is not None
+
+
+def filter_matches(scope: str, q: str = "") -> List[Dict[str, Any]]:
+    scope = (scope or "all").lower().strip()
+    q = (q or "").replace("\0", "").strip().lower()
+
+    matches = load_all_matches()
+    if q:
+        # One substring test per match against the prebuilt text (fields are NUL-separated,
+        # so a hit is always inside a single field, as before).
+        matches = [m for m, h in zip(matches, _match_search_index(matches)) if q in h]
+    if scope != "all":
+        matches = [m for m in matches if is_dallas_match(m)]
+
+    return matches
+
+
+# ============================================================
+# Menu (4 languages) — edit/add items here
+# ============================================================
+# Shared item schema: (category_id, price) per built-in item, identical in every language.
+MENU_ITEMS = (
+    ("chef", "$24"),
+    ("chef", "$19"),
+    ("bites", "$16"),
+    ("bites", "$14/$24"),
+    ("classics", "$18"),
+    ("classics", "$16"),
+    ("sweets", "$10"),
+    ("drinks", "$9"),
+    ("drinks", "$5"),
+)
+
+# Localized side table: lang -> (title, ((name, desc, tag), ...)) aligned with MENU_ITEMS.
+# Only English lives here; other languages are read from I18N_DIR on first use (get_menu).
+MENU_I18N = {
+    "en": ("Menu", (
+        ("Chef’s Wagyu Sliders", "A5-style sear, truffle aioli, brioche. Limited matchday batch.", "Chef Special"),
+        ("Citrus Ceviche Bowl", "Fresh catch, lime, chili, avocado, crunchy tostadas.", "Chef Special"),
+        ("Stadium Nachos XL", "Three-cheese blend, jalapeño, pico, crema, choice of protein.", "Share"),
+        ("Peri-Peri Wings (8/16)", "Crispy wings, peri-peri glaze, citrus salt.", "Hot"),
+        ("Concierge Burger", "Angus, cheddar, lettuce, tomato, house sauce, fries.", "Classic"),
+        ("Spicy Chicken Sandwich", "Crispy chicken, spicy sauce, pickles, fries optional.", "Fan Favorite"),
+        ("Gold Medal Churros", "Cinnamon sugar, chocolate dip.", "Sweet"),
+        ("Matchday Mocktail", "Citrus, mint, sparkling finish.", "Zero Proof"),
+        ("Premium Espresso", "Double shot, smooth crema.", "Coffee"),
+    )),
 }
 
 # ============================================================
@@ -19213,113 +21110,131 @@ LANG = {
         "rule_party": "⚠️ That party size is above our limit. Please call the business to confirm a larger group.",
         "rule_closed": "⚠️ We’re closed on that date. Want the next available day?",
     },
-    "es": {
-        "welcome": "⚽ ¡Bienvenido, fan del Mundial! Soy tu concierge de días de partido en Dallas.\nEscribe reserva para reservar una mesa, o pregunta por los partidos (Dallas / todos) o el menú.",
-        "ask_date": "¿Qué fecha te gustaría? (Ejemplo: 23 de junio de 2026)\n\n(También puedes escribir: “Recordar reserva”)",
-        "ask_time": "¿A qué hora te gustaría?",
-        "ask_party": "¿Cuántas personas serán?",
-        "ask_name": "¿A nombre de quién será la reserva?",
-        "ask_phone": "¿Qué número de teléfono debemos usar?",
-        "recall_title": "📌 Reserva hasta ahora:",
-        "recall_empty": "Aún no hay detalles. Escribe “reserva” para comenzar.",
-        "saved": "✅ ¡Reserva guardada!",
-        "rule_party": "⚠️ Ese tamaño de grupo supera nuestro límite. Llama al negocio para confirmar un grupo grande.",
-        "rule_closed": "⚠️ Estamos cerrados ese día. ¿Quieres el siguiente día disponible?",
-    },
-    "pt": {
-        "welcome": "⚽ Bem-vindo, fã da Copa do Mundo! Sou seu concierge de dias de jogo em Dallas.\nDigite reserva para reservar uma mesa, ou pergunte sobre jogos em Dallas, todos os jogos ou o cardápio.",
-        "ask_date": "Qual data você gostaria? (Exemplo: 23 de junho de 2026)\n\n(Você também pode digitar: “Relembrar reserva”)",
-        "ask_time": "Que horas você gostaria?",
-        "ask_party": "Quantas pessoas?",
-        "ask_name": "Em qual nome devemos colocar a reserva?",
-        "ask_phone": "Qual número de telefone devemos usar?",
-        "recall_title": "📌 Reserva até agora:",
-        "recall_empty": "Ainda não há detalhes. Digite “reserva” para começar.",
-        "saved": "✅ Reserva salva!",
-        "rule_party": "⚠️ Esse tamanho de grupo excede o limite. Ligue para confirmar um grupo maior.",
-        "rule_closed": "⚠️ Estaremos fechados nessa data. Quer o próximo dia disponível?",
-    },
-    "fr": {
-        "welcome": "⚽ Bienvenue, fan de la Coupe du Monde ! Je suis votre concierge des jours de match à Dallas.\nTapez réservation pour réserver une table, ou demandez les matchs (Dallas / tous) ou le menu.",
-        "ask_date": "Quelle date souhaitez-vous ? (Exemple : 23 juin 2026)\n\n(Vous pouvez aussi écrire : « Rappeler la réservation »)",
-        "ask_time": "À quelle heure ?",
-        "ask_party": "Pour combien de personnes ?",
-        "ask_name": "Au nom de qui ?",
-        "ask_phone": "Quel numéro de téléphone devons-nous utiliser ?",
-        "recall_title": "📌 Réservation jusqu’ici :",
-        "recall_empty": "Aucun détail pour l’instant. Dites « réservation » pour commencer.",
-        "saved": "✅ Réservation enregistrée !",
-        "rule_party": "⚠️ Ce nombre dépasse notre limite. Veuillez appeler pour un grand groupe.",
-        "rule_closed": "⚠️ Nous sommes fermés ce jour-là. Voulez-vous le prochain jour disponible ?",
-    },
 }
 
+# Flat "<lang>.<key>" view of LANG: one hash probe per prompt instead of two.
+# Like LANG it starts English-only; get_strings() adds a language when it is first used.
+LANG_FLAT = {sys.intern(f"{l}.{k}"): sys.intern(v) for l, d in LANG.items() for k, v in d.items()}
+
 SUPPORTED_LANGS = ["en", "es", "pt", "fr"]
 
 
+_LANG_PREFIX_ALIAS = {"sp": "es", "po": "pt", "fr": "fr"}
+
+
+@functools.lru_cache(maxsize=256)
 def norm_lang(lang: Optional[str]) -> str:
     if not lang:
         return "en"
     lang = lang.lower().strip()
     if lang in SUPPORTED_LANGS:
         return lang
-    # allow common aliases
-    if lang.startswith("sp"):
-        return "es"
-    if lang.startswith("po"):
-        return "pt"
-    if lang.startswith("fr"):
-        return "fr"
-    return "en"
+    # allow common aliases ("spanish", "portugues", "french", ...) by their 2-letter prefix
+    return _LANG_PREFIX_ALIAS.get(lang[:2], "en")
 
 
 # ============================================================
 # Rate limiting (in-memory per IP)
+# - Token bucket per IP: RATE_LIMIT_PER_MIN tokens of burst, refilled continuously at
+#   RATE_LIMIT_PER_MIN per minute (no 2x burst across a fixed-window boundary).
+# - Fixed-capacity slot table (power of two) indexed by hash(ip): bounded memory no matter
+#   how many distinct IPs (scanners) show up, and no per-request dict allocation.
+# - An IP probes _RATE_PROBE neighbouring slots and reuses one whose bucket has fully refilled;
+#   only when all of them are active is the fullest (least drained) one taken over.
+# - The table is split into _RATE_LOCKS stripes, each guarded by its own lock; probing wraps
+#   within the stripe, so unrelated IPs rarely contend on the same mutex.
 # ============================================================
-_rate_buckets: Dict[str, Dict[str, Any]] = {}
+_RATE_SLOTS = 16384
+_RATE_MASK = _RATE_SLOTS - 1
+# Buckets are timed on the monotonic clock (integer math, immune to NTP wall-clock steps).
+# Tokens are stored scaled by _RATE_WINDOW_NS, so refill is exactly elapsed_ns * RATE_LIMIT_PER_MIN
+# and one request costs _RATE_WINDOW_NS.
+_RATE_WINDOW_NS = 60 * 1_000_000_000
+_RATE_PROBE = 4
+_RATE_LOCKS = 64
+_RATE_STRIPE_BITS = (_RATE_SLOTS // _RATE_LOCKS).bit_length() - 1
+_RATE_STRIPE_MASK = (1 << _RATE_STRIPE_BITS) - 1
+_rate_locks = [threading.Lock() for _ in range(_RATE_LOCKS)]
+_rate_keys = array.array("q", [0]) * _RATE_SLOTS
+_rate_last_ns = array.array("q", [-(1 << 62)]) * _RATE_SLOTS
+_rate_tokens = array.array("q", [0]) * _RATE_SLOTS
 
 
 def client_ip() -> str:
     # Render often sets X-Forwarded-For
     xff = request.headers.get("X-Forwarded-For", "")
     if xff:
-        return xff.split(",")[0].strip()
+        # partition: only the first hop is used, so don't materialize the whole chain.
+        head, _, _ = xff.partition(",")
+        return head.strip() or request.remote_addr or "unknown"
     return request.remote_addr or "unknown"
 
 
 def check_rate_limit(ip: str) -> Tuple[bool, int]:
     """
-    Returns (allowed, remaining_in_window).
-    Fixed window: per-minute.
+    Returns (allowed, remaining_tokens).
+    Token bucket: bursts up to RATE_LIMIT_PER_MIN, refills at RATE_LIMIT_PER_MIN per minute.
     """
-    now = int(time.time())
-    window = now // 60
-    b = _rate_buckets.get(ip)
-    if not b or b["window"] != window:
-        _rate_buckets[ip] = {"window": window, "count": 1}
-        return True, max(RATE_LIMIT_PER_MIN - 1, 0)
+    now = time.monotonic_ns()
+    cap = RATE_LIMIT_PER_MIN * _RATE_WINDOW_NS
+    h = hash(ip)
+    base = h & _RATE_MASK
+    stripe = base & ~_RATE_STRIPE_MASK
+    with _rate_locks[base >> _RATE_STRIPE_BITS]:
+        victim = -1
+        for k in range(_RATE_PROBE):
+            i = stripe | ((base + k) & _RATE_STRIPE_MASK)
+            if _rate_keys[i] == h:
+                tokens = min(cap, _rate_tokens[i] + (now - _rate_last_ns[i]) * RATE_LIMIT_PER_MIN)
+                break
+            if victim < 0 and now - _rate_last_ns[i] >= _RATE_WINDOW_NS:
+                victim = i
+        else:
+            if victim < 0:
+                # Every probed bucket is still refilling: evict the fullest (least drained) one.
+                victim = max((stripe | ((base + k) & _RATE_STRIPE_MASK) for k in range(_RATE_PROBE)), key=_rate_tokens.__getitem__)
+            i = victim
+            _rate_keys[i] = h
+            tokens = cap
 
-    if b["count"] >= RATE_LIMIT_PER_MIN:
-        return False, 0
+        _rate_last_ns[i] = now
+        if tokens < _RATE_WINDOW_NS:
+            _rate_tokens[i] = tokens
+            return False, 0
 
-    b["count"] += 1
-    remaining = max(RATE_LIMIT_PER_MIN - b["count"], 0)
-    return True, remaining
+        tokens -= _RATE_WINDOW_NS
+        _rate_tokens[i] = tokens
+    return True, tokens // _RATE_WINDOW_NS
 
 
 # ============================================================
 # Google Sheets helpers
 # ============================================================
 def get_gspread_client():
-    if os.environ.get("GOOGLE_CREDS_JSON"):
-        creds_info = json.loads(os.environ["GOOGLE_CREDS_JSON"])
-        creds = Credentials.from_service_account_info(creds_info, scopes=SCOPES)
-        return gspread.authorize(creds)
+    """Authorized gspread client, built once and shared by every request.
 
-    creds_file = "google_creds.json"
-    if os.path.exists(creds_file):
-        creds = Credentials.from_service_account_file(creds_file, scopes=SCOPES)
-        return gspread.authorize(creds)
+    Reusing it keeps one HTTP session (pooled TLS connections) and one OAuth token; google-auth's
+    AuthorizedSession refreshes the token by itself when it expires.
+    """
+    global _GC_CLIENT
+    gc = _GC_CLIENT
+    if gc is not None:
+        return gc
+    with _GC_LOCK:
+        if _GC_CLIENT is not None:
+            return _GC_CLIENT
+        if _CREDS_INFO_ERROR is not None:
+            raise _CREDS_INFO_ERROR
+        if _CREDS_INFO is not None:
+            creds = Credentials.from_service_account_info(_CREDS_INFO, scopes=SCOPES)
+            _GC_CLIENT = gspread.authorize(creds)
+            return _GC_CLIENT
+
+        creds_file = "google_creds.json"
+        if os.path.exists(creds_file):
+            creds = Credentials.from_service_account_file(creds_file, scopes=SCOPES)
+            _GC_CLIENT = gspread.authorize(creds)
+            return _GC_CLIENT
 
     raise RuntimeError("Google credentials not found. Set GOOGLE_CREDS_JSON or provide google_creds.json locally.")
 
@@ -19360,14 +21275,7 @@ def get_session(sid: str) -> Dict[str, Any]:
 
 
 def want_recall(text: str, lang: str) -> bool:
-    t = text.lower().strip()
-    triggers = [
-        "recall reservation", "recall", "reservation so far",
-        "recordar reserva", "recordar", "reserva hasta ahora",
-        "relembrar reserva", "relembrar", "reserva até agora",
-        "rappeler", "réservation", "reservation jusqu",
-    ]
-    return any(x in t for x in triggers)
+    return _RE_RECALL_TRIGGER.search(text.lower()) is not None
 
 
 def want_reservation(text: str) -> bool:
@@ -19375,69 +21283,45 @@ def want_reservation(text: str) -> bool:
     t_clean = t.rstrip(".!? \t")
     if t_clean == "vip":
         return True
-    triggers = [
-        "reservation",
-        "reserve",
-        "book a table",
-        "book table",
-        "table for",
-        "need a table",
-        "need table",
-        "reserva",
-        "réservation",
-        "vip reservation",
-        "vip table",
-        "vip reserve",
-        "vip book",
-        "vip hold",
-    ]
-    return any(k in t for k in triggers)
+    return _RE_RESERVATION_TRIGGER.search(t) is not None
 
 
-def extract_party_size(text: str) -> Optional[int]:
+def extract_party_size(text: str, lower: Optional[str] = None) -> Optional[int]:
     """Extract party size from free text.
 
     IMPORTANT: avoid mis-reading dates like 'June 13' as a party size.
     'party size to N' wins when message also contains a long digit string (e.g. phone).
     """
-    raw = (text or "").strip()
-    if not raw:
+    t = lower if lower is not None else (text or "").strip().lower()
+    if not t:
         return None
-    t = raw.lower()
 
     # Strong patterns first – "party size to N" when message also has phone digits.
-    m = re.search(r"party\s*(?:size)?\s+to\s+(\d+)", t)
+    m = _RE_PARTY_SIZE_TO.search(t)
     if m:
         n = int(m.group(1))
         if 1 <= n <= 200:
             return n
-    m = re.search(r"party\s*(?:size)?\s*(?:is|=|:)?\s*(\d+)", t)
+    m = _RE_PARTY_SIZE_IS.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"party\s*of\s*(\d+)", t)
+    m = _RE_PARTY_OF.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"table\s*(?:for|of)?\s*(\d+)", t)
+    m = _RE_TABLE_FOR.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"\b(\d+)\s*(people|persons|guests|pax)\b", t)
+    m = _RE_N_PEOPLE.search(t)
     if m:
         return int(m.group(1))
-    m = re.search(r"for\s*(\d+)\s*(people|persons|guests|pax)\b", t)
+    m = _RE_FOR_N_PEOPLE.search(t)
     if m:
         return int(m.group(1))
 
     # If the text looks like a date or time and we didn't hit any of the
     # strong patterns above, be conservative and avoid treating numbers as
     # party size.
-    months = [
-        "january","jan","february","feb","march","mar","april","apr","may","june","jun","july","jul",
-        "august","aug","september","sep","sept","october","oct","november","nov","december","dec",
-        "enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre",
-        "janeiro","fevereiro","março","marco","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro",
-        "janvier","février","fevrier","mars","avril","mai","juin","juillet","août","aout","septembre","octobre","novembre","décembre","decembre",
-    ]
-    if any(mo in t for mo in months):
+    if _RE_MONTH_WORD.search(t):
         return None
     # Also check for partial month names that might indicate a date (e.g., "fe" for feb, "ju" for jun/jul)
     # This prevents "fe 18" from being read as party size 18
@@ -19450,18 +21334,18 @@ def extract_party_size(text: str) -> Optional[int]:
                 idx = t.find(pref)
                 if idx >= 0:
                     after = t[idx + len(pref):idx + len(pref) + 5]
-                    if re.search(r"\d", after):
+                    if _RE_DIGIT.search(after):
                         return None
-    if re.search(r"\b\d{4}-\d{1,2}-\d{1,2}\b", t):
+    if _RE_YMD_LOOSE.search(t):
         return None
-    if re.search(r"\b\d{1,2}[/-]\d{1,2}([/-]\d{2,4})?\b", t):
+    if _RE_NUMERIC_DATE.search(t):
         return None
     # Time patterns: "4 pm", "4:30 pm", "4am", etc. - don't treat as party size
-    if re.search(r"\b\d{1,2}(:\d{2})?\s*(am|pm)\b", t):
+    if _RE_CLOCK_AMPM.search(t):
         return None
 
     # Fallback: a plain number, but keep it reasonable
-    m = re.search(r"\b(\d+)\b", t)
+    m = _RE_NUMBER.search(t)
     if m:
         n = int(m.group(1))
         if 1 <= n <= 200:
@@ -19480,15 +21364,17 @@ def extract_phone(text: str) -> Optional[str]:
         return None
 
     # Prefer explicit 10-digit runs anywhere in the string
-    digits_only = re.sub(r"\D+", "", s)
+    digits_only = _RE_NON_DIGITS.sub("", s)
+    if len(digits_only) < 10:
+        return None  # both formats below need ten digits
 
     # Try to find a 10-digit chunk inside the full digit stream (e.g., '...2157779999')
-    m = re.search(r"(\d{10})", digits_only)
+    m = _RE_TEN_DIGITS.search(digits_only)
     if m:
         return m.group(1)
 
     # Try common separated formats: (215) 777-9999, 215-777-9999, 1 215 777 9999
-    m = re.search(r"(?:\b1\D*)?(\d{3})\D*(\d{3})\D*(\d{4})\b", s)
+    m = _RE_US_PHONE.search(s)
     if m:
         return f"{m.group(1)}{m.group(2)}{m.group(3)}"
 
@@ -19503,61 +21389,58 @@ def extract_name(text: str) -> Optional[str]:
     lower = raw.lower().strip()
 
     # Don't treat reservation trigger words as a person's name
-    trigger_words = {
-        "reservation", "reserve", "reserving", "book", "booking", "book a table",
-        "reserva", "reservar", "réservation", "réservation"
-    }
-    if lower in trigger_words:
+    if lower in _NAME_TRIGGER_WORDS:
         return None
 
     # If message contains 'party', take words before 'party'
     if "party" in lower:
         pre = raw[:lower.find("party")].strip()
-        pre = re.sub(r"[^A-Za-z\s\-'\.]", "", pre).strip()
-        pre = re.sub(r"\s+", " ", pre)
+        pre = _RE_NAME_JUNK.sub("", pre).strip()
+        pre = _RE_WS.sub(" ", pre)
         if 1 <= len(pre) <= 40:
             return pre
 
     # Otherwise, take leading letters until the first digit
-    name_part = ""
-    for ch in raw:
-        if ch.isdigit():
-            break
-        name_part += ch
-    name_part = name_part.strip()
-    name_part = re.sub(r"\s+", " ", name_part)
-    name_part = re.sub(r"[^A-Za-z\s\-'\.]", "", name_part).strip()
+    name_part = _RE_LEADING_NONDIGITS.match(raw).group(0).strip()
+    name_part = _RE_WS.sub(" ", name_part)
+    name_part = _RE_NAME_JUNK.sub("", name_part).strip()
     if 1 <= len(name_part) <= 40:
         return name_part
 
     return None
 
 
-def extract_time(text: str) -> Optional[str]:
-    t = text.lower().strip()
+def extract_time(text: str, lower: Optional[str] = None) -> Optional[str]:
+    # Every format below needs a digit; most chat turns have none.
+    if not _RE_DIGIT.search(text):
+        return None
+    t = lower if lower is not None else text.lower().strip()
     # 7pm / 7 pm / 19:30
-    m = re.search(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b", t)
+    m = _RE_TIME_AMPM.search(t)
     if m:
         hh = int(m.group(1))
         mm = m.group(2) or "00"
         ap = m.group(3)
         return f"{hh}:{mm} {ap}"
-    m = re.search(r"\b(\d{1,2}):(\d{2})\b", t)
+    m = _RE_TIME_24H.search(t)
     if m:
         return f"{m.group(1)}:{m.group(2)}"
     return None
 
 
-def extract_date(text: str) -> Optional[str]:
+def extract_date(text: str, lower: Optional[str] = None) -> Optional[str]:
+    # Every format below (ISO, US, month + day, fuzzy "feb") needs a day number.
+    if not _RE_DIGIT.search(text):
+        return None
     t = text.strip()
 
     # ISO: 2026-06-23
-    m = re.search(r"\b(20\d{2})-(\d{2})-(\d{2})\b", t)
+    m = _RE_DATE_ISO.search(t)
     if m:
         return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
 
     # US: 06/23/2026 or 6/23/26
-    m = re.search(r"\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b", t)
+    m = _RE_DATE_US.search(t)
     if m:
         mm = int(m.group(1))
         dd = int(m.group(2))
@@ -19566,47 +21449,28 @@ def extract_date(text: str) -> Optional[str]:
             yy += 2000
         return f"{yy:04d}-{mm:02d}-{dd:02d}"
 
-    # Month name + day (+ optional year)
-    lower = t.lower()
-    month_map = {
-        # English
-        "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3,
-        "april": 4, "apr": 4, "may": 5, "june": 6, "jun": 6, "july": 7, "jul": 7,
-        "august": 8, "aug": 8, "september": 9, "sep": 9, "sept": 9, "october": 10, "oct": 10,
-        "november": 11, "nov": 11, "december": 12, "dec": 12,
-        # Spanish
-        "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6, "julio": 7,
-        "agosto": 8, "septiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
-        # Portuguese
-        "janeiro": 1, "fevereiro": 2, "março": 3, "abril": 4, "maio": 5, "junho": 6, "julho": 7,
-        "agosto": 8, "setembro": 9, "outubro": 10, "novembro": 11, "dezembro": 12,
-        # French
-        "janvier": 1, "février": 2, "fevrier": 2, "mars": 3, "avril": 4, "mai": 5,
-        "juin": 6, "juillet": 7, "août": 8, "aout": 8, "septembre": 9, "octobre": 10,
-        "novembre": 11, "décembre": 12, "decembre": 12,
-    }
-
-    # Find month word, then day number
-    for word, mon in month_map.items():
-        if re.search(rf"\b{re.escape(word)}\b", lower):
-            m = re.search(rf"\b{re.escape(word)}\b\D*(\d{{1,2}})", lower)
-            if m:
-                dd = int(m.group(1))
-                y = 2026  # default year for World Cup focus
-                my = re.search(r"\b(20\d{2})\b", lower)
-                if my:
-                    y = int(my.group(1))
-                return f"{y:04d}-{mon:02d}-{dd:02d}"
+    # Month name + day (+ optional year): one scan for any month word followed by a day number
+    if lower is None:
+        lower = t.lower()
+    m = _RE_MONTH_DAY.search(lower)
+    if m:
+        mon = _MONTH_TO_NUM[m.group(1)]
+        dd = int(m.group(2))
+        y = 2026  # default year for World Cup focus
+        my = _RE_YEAR.search(lower)
+        if my:
+            y = int(my.group(1))
+        return f"{y:04d}-{mon:02d}-{dd:02d}"
     
     # Fuzzy match: handle partial month names like "fe" -> "feb"
     # Only try if we didn't find a full match above, and only for unambiguous prefixes
     # Check for common typos/abbreviations: "fe" -> february, "feb" -> february
     if lower.startswith("fe") and len(lower) >= 3:
-        m = re.search(r"^fe[b]?\D*(\d{1,2})", lower)
+        m = _RE_FEB_FUZZY.search(lower)
         if m:
             dd = int(m.group(1))
             y = 2026
-            my = re.search(r"\b(20\d{2})\b", lower)
+            my = _RE_YEAR.search(lower)
             if my:
                 y = int(my.group(1))
             return f"{y:04d}-02-{dd:02d}"
@@ -19614,7 +21478,7 @@ def extract_date(text: str) -> Optional[str]:
     return None
 
 
-def extract_name_candidate(text: str) -> Optional[str]:
+def extract_name_candidate(text: str, lower: Optional[str] = None) -> Optional[str]:
     """Best-effort name extraction from a mixed reservation message.
 
     Example:
@@ -19625,19 +21489,16 @@ def extract_name_candidate(text: str) -> Optional[str]:
         return None
 
     # Explicit patterns: "name is X", "my name is X", "under name X", "for name X"
-    m = re.search(
-        r"\b(?:my\s+name\s+is|name\s+is|under\s+name|for\s+name)\s+([A-Za-z][A-Za-z\s']{0,40})",
-        s,
-        flags=re.I,
-    )
+    m = _RE_NAME_IS.search(s)
     if m:
         name = m.group(1).strip()
         if name:
             return name
 
-    lower = s.lower().strip()
+    if lower is None:
+        lower = s.lower()
     # Don't treat trigger words as names
-    if lower in ["reservation", "reserva", "réservation", "reserve", "book", "book a table"]:
+    if lower in _NAME_CANDIDATE_TRIGGER_WORDS:
         return None
 
 
@@ -19647,42 +21508,12 @@ def extract_name_candidate(text: str) -> Optional[str]:
     # If the message clearly looks like a date/time/party-size description
     # (e.g. 'June 20, 2026 at 8 pm for 6 people'), skip heuristic name guessing
     # and let the bot explicitly ask for a name.
-    if re.search(r"\b(?:am|pm)\b", lower) or re.search(r"\bparty\s*(?:size)?\s*(?:is|=|:)?\s*\d+", lower) or re.search(r"\btable\s*(?:for|of)\s*\d+", lower):
+    if _RE_AMPM_WORD.search(lower) or _RE_PARTY_SIZE_N.search(lower) or _RE_TABLE_FOR_N.search(lower):
         return None
-    # Remove phone numbers (many formats)
-    s = re.sub(r"\b(?:\+?1\s*)?\(?\d{3}\)?[-.\s]*\d{3}[-.\s]*\d{4}\b", " ", s)
-
-    # Remove explicit party/table patterns
-    s = re.sub(r"\bparty\s*of\s*\d+\b", " ", s, flags=re.I)
-    s = re.sub(r"\btable\s*(?:for|of)\s*\d+\b", " ", s, flags=re.I)
-
-    # Remove time patterns (5pm, 5:30 pm, 17:00)
-    s = re.sub(r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b", " ", s, flags=re.I)
-    s = re.sub(r"\b\d{1,2}:\d{2}\b", " ", s)
-
-    # Remove ISO / slash dates
-    s = re.sub(r"\b20\d{2}-\d{2}-\d{2}\b", " ", s)
-    s = re.sub(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b", " ", s)
-
-    # Remove month-name dates (English/Spanish/Portuguese/French month words)
-    month_words = [
-        "january","jan","february","feb","march","mar","april","apr","may","june","jun","july","jul",
-        "august","aug","september","sep","sept","october","oct","november","nov","december","dec",
-        "enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre",
-        "janeiro","fevereiro","março","marco","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro",
-        "janvier","février","fevrier","mars","avril","mai","juin","juillet","août","aout","septembre","octobre","novembre","décembre","decembre",
-    ]
-    s = re.sub(r"\b(?:" + "|".join(re.escape(w) for w in month_words) + r")\b", " ", s, flags=re.I)
-
-    # Remove standalone small numbers (party size, day)
-    s = re.sub(r"\b\d{1,3}\b", " ", s)
-
-    # Remove reservation keywords
-    s = re.sub(r"\b(reservation|reserve|book|booking|table|party|for|of)\b", " ", s, flags=re.I)
-
-    # Keep letters/apostrophes/spaces only
-    s = re.sub(r"[^A-Za-z'\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    # Blank out phone numbers, party/table phrases, times, dates, month words, small numbers,
+    # reservation keywords and anything but letters/apostrophes in one pass (_RE_NAME_NOISE).
+    s = _RE_NAME_NOISE.sub(" ", s)
+    s = _RE_WS.sub(" ", s).strip()
 
     if not s:
         return None
@@ -19709,7 +21540,7 @@ def validate_date_iso(d_iso: str) -> bool:
 def apply_business_rules(lead: Dict[str, Any]) -> Optional[str]:
     # closed date check
     d_iso = lead.get("date", "")
-    if d_iso and d_iso in set(BUSINESS_RULES.get("closed_dates", [])):
+    if d_iso and d_iso in _closed_dates_set():
         return "closed"
 
     # party size check
@@ -19727,25 +21558,25 @@ def recall_text(sess: Dict[str, Any], session_id: Optional[str] = None) -> str:
 
 def next_question(sess: Dict[str, Any]) -> str:
     lang = sess.get("lang", "en")
-    L = LANG[lang]
     lead = sess["lead"]
 
     if not lead.get("date"):
-        return L["ask_date"]
+        return tr(lang, "ask_date")
     if not lead.get("time"):
-        return L["ask_time"]
+        return tr(lang, "ask_time")
     if not lead.get("party_size"):
-        return L["ask_party"]
+        return tr(lang, "ask_party")
     if not lead.get("name"):
-        return L["ask_name"]
+        return tr(lang, "ask_name")
     if not lead.get("phone"):
-        return L["ask_phone"]
+        return tr(lang, "ask_phone")
     return ""
 
 
 # ============================================================
 # Public endpoints
 # ============================================================
+@functools.lru_cache(maxsize=256)
 def norm_lang(lang: str) -> str:
     lang = (lang or "en").lower().strip()
     return lang if lang in ("en","es","pt","fr") else "en"
@@ -19759,28 +21590,19 @@ def _local_country_list() -> List[str]:
     Some fixture sources include *placeholders* during qualification or bracket setup
     (e.g., "1A", "2B", "DEN/MKD/CZE/IRL"). We intentionally filter those out so the
     Fan Zone selector only shows real teams.
-    """
-    def _is_real_team(name: str) -> bool:
-        n = (name or "").strip()
-        if not n:
-            return False
-        # Common placeholders / undecided tokens
-        if n.lower() in {"tbd", "to be decided", "to be determined", "winner", "loser", "n/a"}:
-            return False
-        # Group/slot placeholders like "1A", "2B", "3ABCDF" etc.
-        if re.fullmatch(r"\d+[A-Za-z]{1,10}", n):
-            return False
-        # Any remaining digits usually indicate placeholders ("Match 12", "3rd Place", etc.)
-        if any(ch.isdigit() for ch in n):
-            return False
-        # Slash-delimited options are not a single participant (e.g., "BOL/SUR/IRQ")
-        if "/" in n:
-            return False
-        return True
 
+    The result is cached per fixtures list: it is only recomputed after load_all_matches()
+    returns a new list (i.e. the fixtures were reloaded).
+    """
+    global _LOCAL_COUNTRIES_CACHE
     try:
+        matches = load_all_matches() or []
+        src, cached = _LOCAL_COUNTRIES_CACHE
+        if src is matches and cached:
+            return list(cached)
+
         teams = set()
-        for match in load_all_matches() or []:
+        for match in matches:
             h = (match.get("home") or "").strip()
             a = (match.get("away") or "").strip()
             if _is_real_team(h):
@@ -19794,7 +21616,9 @@ def _local_country_list() -> List[str]:
             # Ensure hosts present even if a fixture source omits them.
             for host in ["United States", "Canada", "Mexico"]:
                 teams.add(host)
-            return sorted(teams)
+            result = tuple(sorted(teams))
+            _LOCAL_COUNTRIES_CACHE = (matches, result)
+            return list(result)
     except Exception:
         pass
 
@@ -19833,60 +21657,17 @@ def _fetch_qualified_teams_remote() -> List[str]:
     if not html_blob:
         return []
 
-    # 2) Find the "Qualified teams" section and then choose the most likely table.
-    # We do NOT assume the first table is the right one (Wikipedia pages often have
-    # navigation/other tables near section headers).
-    anchor_pos = -1
-    for anchor in (
-        'id="Qualified_teams"',
-        'id="Qualified_teams_and_rankings"',
-        'id="Qualified_teams_and_rankings"',
-        'id="Qualified_teams_and_rankings"',
-    ):
-        anchor_pos = html_blob.find(anchor)
-        if anchor_pos != -1:
-            break
-    if anchor_pos == -1:
-        # Some renderings use a <span id="Qualified_teams"> marker.
-        anchor_pos = html_blob.find('<span id="Qualified_teams"')
-    if anchor_pos == -1:
-        return []
-
-    sub = html_blob[anchor_pos:]
-
-    # Grab a few candidate wikitables and pick the first one that looks like a
-    # qualified-teams table (must contain a "Team" header AND a "Method/Qualification"-ish header).
-    candidates = re.findall(
-        r"<table[^>]*class=\"[^\"]*wikitable[^\"]*\"[^>]*>.*?</table>",
-        sub,
-        flags=re.S | re.I,
-    )
-
-    def _looks_like_qualified_table(tbl: str) -> bool:
-        """Heuristic: pick the actual "Qualified teams" table, not nearby nav/summary tables."""
-        t = tbl.lower()
-        # Must have a "Team" header.
-        if not re.search(r">\s*team\s*<", t):
-            return False
-        # Must have at least one of the usual columns.
-        if not any(k in t for k in ["qualification", "qualified", "method", "date"]):
-            return False
-        # Should not be a navbox.
-        if "navbox" in t or "nowrap" in t and "navbox" in t:
-            return False
-        return True
-
-    table = ""
-    for cand in candidates[:6]:
-        if _looks_like_qualified_table(cand):
-            table = cand
-            break
-    if not table and candidates:
-        table = candidates[0]
-    if not table:
+    if lxml is not None:
+        try:
+            names = _qualified_names_lxml(html_blob)
+        except Exception:
+            names = _qualified_names_regex(html_blob)
+    else:
+        names = _qualified_names_regex(html_blob)
+    if names is None:
         return []
 
-    # 3) Extract team names from the first column of each row.
+    # 3) Drop header/confederation rows and duplicates.
     teams: List[str] = []
     skip_exact = {
         "team",
@@ -19908,27 +21689,7 @@ def _fetch_qualified_teams_remote() -> List[str]:
         "to be determined",
     ]
 
-    for row in re.findall(r"<tr[^>]*>(.*?)</tr>", table, flags=re.S | re.I):
-        # First cell in the row
-        cell_m = re.search(r"<t[hd][^>]*>(.*?)</t[hd]>", row, flags=re.S | re.I)
-        if not cell_m:
-            continue
-        cell = cell_m.group(1)
-
-        # Prefer the first wiki link text that isn't a File:/Category:/Help: etc.
-        link_m = None
-        for m in re.finditer(r"<a[^>]+href=\"([^\"]+)\"[^>]*>([^<]+)</a>", cell, flags=re.I):
-            href = (m.group(1) or "").strip()
-            txt = (m.group(2) or "").strip()
-            if not txt:
-                continue
-            if href.startswith("/wiki/") and ":" not in href:
-                link_m = m
-                break
-        name = (link_m.group(2) if link_m else re.sub(r"<[^>]+>", " ", cell))
-        name = re.sub(r"\s+", " ", name).strip()
-        name = re.sub(r"\s*\[\d+\]\s*", " ", name).strip()
-
+    for name in names:
         low = name.lower()
         if not name or low in skip_exact:
             continue
@@ -19999,17 +21760,35 @@ _live_payload_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
 _stand_payload_cache: Dict[str, Dict[str, Any]] = {}
 _payload_cache_ttl_sec = 15
 
-def _json_with_etag(payload: Dict[str, Any]):
-    """Return JSON with a stable ETag header (always 200).
+def _json_with_etag(payload: Dict[str, Any], cache_entry: Optional[Dict[str, Any]] = None):
+    """Return JSON with a stable ETag header.
+
+    Why 200 by default: some fetch() code treats HTTP 304 as an error (res.ok === false),
+    which can look like the app is 'broken'. Responses are no-store, so browsers never
+    revalidate on their own; only a client that explicitly sends If-None-Match gets a 304.
 
-    Why: some fetch() code treats HTTP 304 as an error (res.ok === false),
-    which can look like the app is 'broken'. This keeps reliability benefits
-    (ETag + short server cache) without ever returning 304.
+    cache_entry: the server-cache dict holding this payload; the encoded body + ETag are
+    kept on it ("_wire") so cache hits skip serialization and hashing.
     """
-    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
-    etag = hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
-    resp = jsonify(payload)
-    resp.headers["ETag"] = f"\"{etag}\""
+    wire = cache_entry.get("_wire") if cache_entry is not None else None
+    if wire is None:
+        body = None
+        if orjson is not None:
+            try:
+                body = orjson.dumps(payload, default=app.json.default, option=_OrjsonProvider._OPTS)
+            except Exception:
+                body = None
+        if body is None:
+            body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        wire = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+        if cache_entry is not None:
+            cache_entry["_wire"] = wire
+    body, etag = wire
+    if _etag_matches(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(body, mimetype=app.json.mimetype)
+    resp.set_etag(etag)
     resp.headers["Cache-Control"] = "no-store"
     return resp
 
@@ -20026,38 +21805,34 @@ def _compute_group_standings(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
         so the Groups tab never renders empty.
       - If scores are present (home_score/away_score), it updates P/W/D/L/GF/GA/PTS.
     """
-    groups: Dict[str, Dict[str, Any]] = {}
-
-    def ensure_team(g: str, team: str):
-        if not team:
-            return
-        groups.setdefault(g, {})
-        groups[g].setdefault(team, {
-            "team": team,
-            "p": 0, "w": 0, "d": 0, "l": 0,
-            "gf": 0, "ga": 0, "gd": 0,
-            "pts": 0,
-        })
+    groups: Dict[str, Dict[str, _StandingRow]] = {}
 
-    # Pass 1: seed groups + team list from *all* group fixtures (scores or not)
+    # One pass: seed groups + team list from *all* group fixtures (scores or not),
+    # and apply results where scores exist.
     for m in matches:
-        stage = (m.get("stage") or "").strip()
-        if not stage.lower().startswith("group"):
+        g = (m.get("stage") or "").strip()
+        if not g.lower().startswith("group"):
             continue
-        g = stage
         home = (m.get("home") or "").strip() or "TBD"
         away = (m.get("away") or "").strip() or "TBD"
         # Avoid polluting tables with TBD vs TBD when teams aren't known yet
+        if home == "TBD" and away == "TBD":
+            continue
+        teams = groups.get(g)
+        if teams is None:
+            teams = groups[g] = {}
+        ht = at = None
         if home != "TBD":
-            ensure_team(g, home)
+            ht = teams.get(home)
+            if ht is None:
+                ht = teams[home] = _StandingRow(home)
         if away != "TBD":
-            ensure_team(g, away)
-
-    # Pass 2: apply results where scores exist
-    for m in matches:
-        stage = (m.get("stage") or "").strip()
-        if not stage.lower().startswith("group"):
+            at = teams.get(away)
+            if at is None:
+                at = teams[away] = _StandingRow(away)
+        if ht is None or at is None:
             continue
+
         hs = m.get("home_score")
         as_ = m.get("away_score")
         if hs is None or as_ is None:
@@ -20067,56 +21842,36 @@ def _compute_group_standings(matches: List[Dict[str, Any]]) -> Dict[str, Any]:
         except Exception:
             continue
 
-        g = stage
-        home = (m.get("home") or "").strip() or "TBD"
-        away = (m.get("away") or "").strip() or "TBD"
-        if home == "TBD" or away == "TBD":
-            continue
-
-        ensure_team(g, home)
-        ensure_team(g, away)
-
-        ht = groups[g][home]
-        at = groups[g][away]
-
-        ht["p"] += 1; at["p"] += 1
-        ht["gf"] += hs; ht["ga"] += as_
-        at["gf"] += as_; at["ga"] += hs
+        ht.p += 1; at.p += 1
+        ht.gf += hs; ht.ga += as_
+        at.gf += as_; at.ga += hs
 
         if hs > as_:
-            ht["w"] += 1; at["l"] += 1
-            ht["pts"] += 3
+            ht.w += 1; at.l += 1
+            ht.pts += 3
         elif hs < as_:
-            at["w"] += 1; ht["l"] += 1
-            at["pts"] += 3
+            at.w += 1; ht.l += 1
+            at.pts += 3
         else:
-            ht["d"] += 1; at["d"] += 1
-            ht["pts"] += 1; at["pts"] += 1
+            ht.d += 1; at.d += 1
+            ht.pts += 1; at.pts += 1
 
-    # finalize GD + sorting
+    # finalize sorting + GD
     out: Dict[str, Any] = {}
     for g, teams in groups.items():
         rows = list(teams.values())
-        for r in rows:
-            r["gd"] = int(r["gf"]) - int(r["ga"])
         # If no points yet, keep a stable alphabetical order; otherwise standard sorting.
-        any_points = any(int(r.get("pts", 0) or 0) > 0 or int(r.get("p", 0) or 0) > 0 for r in rows)
-        if any_points:
-            rows.sort(key=lambda r: (r["pts"], r["gd"], r["gf"], r["team"]), reverse=True)
+        if any(r.pts > 0 or r.p > 0 for r in rows):
+            rows.sort(key=_standing_sort_key, reverse=True)
         else:
-            rows.sort(key=lambda r: (r["team"],))
-        out[g] = rows
+            rows.sort(key=operator.attrgetter("team"))
+        out[g] = [r.as_dict() for r in rows]
 
     return out
 
 
 def _hesc(s: Any) -> str:
-    s = "" if s is None else str(s)
-    return (s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-             .replace("'", "&#39;"))
+    return ("" if s is None else str(s)).translate(_HTML_ESCAPE_TABLE)
 
 
 # ============================================================
@@ -20131,9 +21886,13 @@ DATA_DIR = os.environ.get("DATA_DIR", os.path.join("/tmp", "worldcup_app_data"))
 os.makedirs(DATA_DIR, exist_ok=True)
 CONFIG_FILE = os.path.join(DATA_DIR, "app_config_{venue}.json")
 AUDIT_LOG_FILE = os.path.join(DATA_DIR, "audit_log.jsonl")
+# Byte offset of the newest file entry per event name (8-byte little-endian, one file per event).
+AUDIT_INDEX_DIR = AUDIT_LOG_FILE + ".idx"
 
 NOTIFICATIONS_FILE = os.path.join(DATA_DIR, "notifications.jsonl")
 NOTIFY_WEBHOOK_URL = os.environ.get("NOTIFY_WEBHOOK_URL", "").strip()
+# notifications.jsonl is cut back to the newest 3/4 of this many bytes once it grows past it.
+NOTIFICATIONS_MAX_BYTES = int(os.environ.get("NOTIFICATIONS_MAX_BYTES", str(8 * 1024 * 1024)))
 
 def _notify(event: str, details: Optional[Dict[str, Any]] = None, targets: Optional[List[str]] = None, level: str = "info") -> None:
     """
@@ -20152,19 +21911,11 @@ def _notify(event: str, details: Optional[Dict[str, Any]] = None, targets: Optio
             "targets": targets,
             "details": details or {},
         }
-        os.makedirs(os.path.dirname(NOTIFICATIONS_FILE), exist_ok=True)
-        with open(NOTIFICATIONS_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        raw = _dumps_json_compact(entry) + b"\n"
+        _jsonl_append(NOTIFICATIONS_FILE, raw, NOTIFICATIONS_MAX_BYTES)
         if NOTIFY_WEBHOOK_URL:
             try:
-                payload = json.dumps(entry).encode("utf-8")
-                req = urllib.request.Request(
-                    NOTIFY_WEBHOOK_URL,
-                    data=payload,
-                    headers={"Content-Type": "application/json"},
-                    method="POST",
-                )
-                urllib.request.urlopen(req, timeout=3)  # nosec - best effort
+                _NOTIFY_POOL.submit(_post_notify_webhook, raw[:-1])
             except Exception:
                 pass
     except Exception:
@@ -20190,24 +21941,8 @@ def _audit(event: str, details: Optional[Dict[str, Any]] = None) -> None:
         # --- Resolve venue consistently (NO request/body fallback) ---
         vid = _venue_id() if "_venue_id" in globals() else "default"
 
-        # --- 1) Redis write (per-venue) ---
-        try:
-            if "_redis_init_if_needed" in globals():
-                _redis_init_if_needed()
-            if globals().get("_REDIS_ENABLED") and globals().get("_REDIS"):
-                rkey = f"{_REDIS_NS}:{vid}:audit_log"
-                _REDIS.lpush(rkey, json.dumps(entry, ensure_ascii=False))
-                _REDIS.ltrim(rkey, 0, 2000)  # keep last ~2000 entries
-        except Exception:
-            pass
-
-        # --- 2) File fallback (legacy / dev) ---
-        try:
-            os.makedirs(os.path.dirname(AUDIT_LOG_FILE), exist_ok=True)
-            with open(AUDIT_LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-        except Exception:
-            pass
+        # Redis (per-venue) + file fallback, batched off the request thread
+        _audit_enqueue(vid, entry)
 
     except Exception:
         pass
@@ -20219,22 +21954,36 @@ def _audit(event: str, details: Optional[Dict[str, Any]] = None) -> None:
 # -----------------------------
 _CONFIG_CACHE: Dict[str, Any] = {}   # keyed by venue_id -> {"ts":..., "cfg":...}
 _LEADS_CACHE: Dict[str, Any] = {}    # keyed by venue_id -> {"ts":..., "rows":...}
-_sessions: Dict[str, Dict[str, Any]] = {}  # in-memory chat/reservation sessions
+_sessions = SessionStore()  # in-memory chat/reservation sessions
 
 
 def _last_audit_event(event_name: str, scan_limit: int = 800) -> Optional[Dict[str, Any]]:
-    """Return the most recent audit entry for a given event (best-effort)."""
+    """Return the most recent audit entry for a given event (best-effort).
+
+    One seek via the offset index (AUDIT_INDEX_DIR); if that is missing or no longer points
+    at this event, scan back through the last `scan_limit` lines.
+    """
+    _audit_flush_now()
     try:
         if not os.path.exists(AUDIT_LOG_FILE):
             return None
-        with open(AUDIT_LOG_FILE, "r", encoding="utf-8") as f:
-            lines = f.readlines()[-max(50, min(int(scan_limit), 5000)):]
-        for ln in reversed(lines):
-            ln = (ln or "").strip()
+        pos = _audit_index_offset(event_name)
+        if pos is not None:
+            try:
+                with open(AUDIT_LOG_FILE, "rb") as f:
+                    f.seek(pos)
+                    e = _loads_json_bytes(f.readline())
+                if isinstance(e, dict) and e.get("event") == event_name:
+                    return e
+            except Exception:
+                pass
+        n = max(50, min(int(scan_limit), 5000))
+        for ln in itertools.islice(_iter_lines_reverse(AUDIT_LOG_FILE), n):
+            ln = ln.strip()
             if not ln:
                 continue
             try:
-                e = json.loads(ln)
+                e = _loads_json_bytes(ln)
             except Exception:
                 continue
             if e.get("event") == event_name:
@@ -20247,18 +21996,14 @@ def _last_audit_event(event_name: str, scan_limit: int = 800) -> Optional[Dict[s
 def _safe_read_json(path: str) -> dict:
     try:
         if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f) or {}
+            return _read_json_bytes(path) or {}
     except Exception:
         pass
     return {}
 
 def _safe_write_json(path: str, data: dict) -> None:
     try:
-        tmp = path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
-        os.replace(tmp, path)
+        _atomic_write_bytes(path, _dumps_json_pretty(data))
     except Exception:
         pass
 
@@ -20270,81 +22015,38 @@ def _ensure_ws(gc, title: str, venue_id: Optional[str] = None):
         return sh.add_worksheet(title=title, rows=2000, cols=20)
 
 def get_config() -> Dict[str, str]:
+    """Venue config: defaults < venue fan_zone < legacy CONFIG_FILE < Config sheet (cached per venue).
+
+    Fresh for CONFIG_CACHE_SECONDS; up to CONFIG_STALE_SECONDS the cached dict is still served
+    while one background refresh per venue rebuilds it. Only a cold/invalidated cache blocks.
+    """
     vid = _venue_id()
     cache = _CONFIG_CACHE.setdefault(vid, {"ts": 0.0, "cfg": None})
 
     now = time.time()
     cached = cache.get("cfg")
-    if isinstance(cached, dict) and (now - float(cache.get("ts", 0.0)) < 5.0):
-        return dict(cached)
-
-    cfg: Dict[str, str] = {
-        "poll_sponsor_text": "",
-        "match_of_day_id": "",
-        "motd_home": "",
-        "motd_away": "",
-        "motd_datetime_utc": "",
-        "poll_lock_mode": "auto",
-        "ops_pause_reservations": "false",
-        "ops_vip_only": "false",
-        "ops_waitlist_mode": "false",
-    }
-
-    # Sponsor and fan_zone: always from venue config (what admin sets); no hardcoded fallback.
-    try:
-        venue_cfg_path = os.path.join(VENUES_DIR, f"{vid}.json")
-        if os.path.exists(venue_cfg_path):
-            with open(venue_cfg_path, "r", encoding="utf-8") as f:
-                vcfg = json.load(f) or {}
-            fan_zone = vcfg.get("fan_zone") or {}
-            if isinstance(fan_zone, dict):
-                for k, v in fan_zone.items():
-                    if str(k).startswith("_"):
-                        continue
-                    cfg[str(k)] = "" if v is None else str(v)
-    except Exception:
-        pass
-
-    # Legacy: also check the old CONFIG_FILE location (for back-compat)
-    path = str(CONFIG_FILE).replace("{venue}", vid)
-    local = _safe_read_json(path)
-    if isinstance(local, dict):
-        for k, v in local.items():
-            if str(k).startswith("_"):
-                continue
-            # Only apply if not already set from venue config
-            if str(k) not in cfg or cfg.get(str(k), "") == "":
-                cfg[str(k)] = "" if v is None else str(v)
-
-    try:
-        gc = get_gspread_client()
-        ws = _ensure_ws(gc, "Config", venue_id=vid)
-        rows = ws.get_all_values()
-        for r in rows[1:]:
-            if len(r) >= 2 and r[0]:
-                k = r[0]
-                v = r[1]
-                if (k not in cfg) or (cfg.get(k, "") == ""):
-                    cfg[k] = v
-    except Exception:
-        pass
-
+    if isinstance(cached, dict):
+        age = now - float(cache.get("ts", 0.0))
+        if age < CONFIG_CACHE_SECONDS:
+            return dict(cached)
+        if age < CONFIG_STALE_SECONDS:
+            _schedule_config_refresh(vid, cache, cached)
+            return dict(cached)
+
+    cfg = _build_config(vid)
     cache["ts"] = now
     cache["cfg"] = dict(cfg)
     return cfg
 
 def _cfg_bool(cfg: Dict[str, Any], key: str, default: bool = False) -> bool:
-    try:
-        v = cfg.get(key)
-        if isinstance(v, bool):
-            return v
-        s = str(v or "").strip().lower()
-        if s in ("1","true","yes","y","on"):
-            return True
-        if s in ("0","false","no","n","off",""):
-            return False
-    except Exception:
-        pass
+    v = cfg.get(key)
+    if v is True or v is False:
+        return v
+    s = str(v or "").strip().lower()
+    if s in _CFG_TRUE:
+        return True
+    if s in _CFG_FALSE:
+        return False
     return bool(default)
 
 def get_ops(cfg: Optional[Dict[str, Any]] = None) -> Dict[str, bool]:
@@ -20366,28 +22068,30 @@ def set_config(pairs: Dict[str, str]) -> Dict[str, str]:
         clean[str(k)] = "" if v is None else str(v)
 
     path = str(CONFIG_FILE).replace("{venue}", vid)
-    local = _safe_read_json(path)
-    if not isinstance(local, dict):
-        local = {}
+    local = _read_local_config(path)
     local.update(clean)
     local["_updated_at"] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    _safe_write_json(path, local)
+    _write_local_config(path, local)
 
     try:
         gc = get_gspread_client()
         ws = _ensure_ws(gc, "Config", venue_id=vid)
 
-        rows = ws.get_all_values()
-        if not rows:
+        # Only column A (the keys) is needed to locate rows; values are never read here.
+        keys = with_backoff(ws.col_values)(1)
+        if not keys:
             ws.append_row(["key", "value"])
-            rows = ws.get_all_values()
-
-        existing = {r[0]: (i + 1) for i, r in enumerate(rows) if len(r) >= 1 and r[0]}
-        for k, v in clean.items():
-            if k in existing:
-                ws.update_cell(existing[k], 2, v)
-            else:
-                ws.append_row([k, v])
+            keys = ["key"]
+
+        # One batch_update for existing keys + one append_rows for new ones (was a call per key).
+        # Value input options match the old update_cell (USER_ENTERED) / append_row (RAW) calls.
+        existing = {k: (i + 1) for i, k in enumerate(keys) if k}
+        updates = [{"range": f"B{existing[k]}", "values": [[v]]} for k, v in clean.items() if k in existing]
+        new_rows = [[k, v] for k, v in clean.items() if k not in existing]
+        if updates:
+            with_backoff(ws.batch_update)(updates, value_input_option="USER_ENTERED")
+        if new_rows:
+            with_rate_limit_backoff(ws.append_rows)(new_rows, value_input_option="RAW")
     except Exception:
         pass
 
@@ -20401,7 +22105,7 @@ def _match_id(m: Dict[str, Any]) -> str:
     home = (m.get("home") or "").strip()
     away = (m.get("away") or "").strip()
     base = f"{dt}|{home}|{away}"
-    base = re.sub(r"[^A-Za-z0-9|:_-]+", "_", base)
+    base = _RE_MATCH_ID_UNSAFE.sub("_", base)
     return base[:180]
 
 def _get_match_of_day() -> Optional[Dict[str, Any]]:
@@ -20433,17 +22137,22 @@ def _get_match_of_day() -> Optional[Dict[str, Any]]:
     except Exception:
         matches = []
 
-    if override_id:
-        for m in matches:
-            if _match_id(m) == override_id:
-                return m
+    if not matches:
+        return None
+    keys, by_id = _motd_index(matches)
+
+    if override_id and override_id in by_id:
+        return by_id[override_id]
 
     # Default: next upcoming match globally (all matches is already sorted by datetime_utc)
     now_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if keys is not None:
+        i = bisect.bisect_left(keys, now_utc)
+        return matches[i] if i < len(matches) else matches[0]
     for m in matches:
         if (m.get("datetime_utc") or "") >= now_utc:
             return m
-    return matches[0] if matches else None
+    return matches[0]
 
 
 def _poll_is_locked(match: Optional[Dict[str, Any]]) -> bool:
@@ -20509,10 +22218,18 @@ def _poll_match_bucket(match_id: str) -> Dict[str, Any]:
     return bucket
 
 def _poll_has_voted(match_id: str, client_id: str) -> Optional[str]:
+    if not _REDIS_ENABLED:
+        with _POLL_LOCK:
+            bucket = _poll_tallies(_venue_id()).get(match_id)
+            return bucket["clients"].get(client_id) if bucket else None
     bucket = _poll_match_bucket(match_id)
     return (bucket.get("clients") or {}).get(client_id)
 
 def _poll_counts(match_id: str) -> Dict[str, int]:
+    if not _REDIS_ENABLED:
+        with _POLL_LOCK:
+            bucket = _poll_tallies(_venue_id()).get(match_id)
+            return dict(bucket["counts"]) if bucket else {}
     bucket = _poll_match_bucket(match_id)
     counts = bucket.get("counts") or {}
     out: Dict[str, int] = {}
@@ -20528,6 +22245,16 @@ def _poll_record_vote(match_id: str, client_id: str, team: str) -> bool:
     if not (match_id and client_id and team):
         return False
 
+    if not _REDIS_ENABLED:
+        vid = _venue_id()
+        with _POLL_LOCK:
+            bucket = _poll_tallies(vid).get(match_id)
+            if bucket and client_id in bucket["clients"]:
+                return False  # already voted
+            line = _dumps_json_compact({"match_id": match_id, "client_id": client_id, "team": team})
+            _append_bytes(POLL_VOTES_JSONL.replace("{venue}", vid), line + b"\n")
+            return _poll_tallies(vid)[match_id]["clients"].get(client_id) == team
+
     data = _poll_store_read()
     matches = data.get("matches", {})
     bucket = matches.get(match_id) or {}
@@ -20565,19 +22292,23 @@ def _poll_client_id(provided: str) -> str:
     if p:
         return p[:120]
     try:
+        # The derived id only depends on request headers: hash once per request.
+        cached = getattr(g, "_poll_cid", None)
+        if cached:
+            return cached
         ua = (request.headers.get("User-Agent") or "").strip()
         al = (request.headers.get("Accept-Language") or "").strip()
-        ip = (request.headers.get("X-Forwarded-For") or request.remote_addr or "").split(",")[0].strip()
+        ip = (request.headers.get("X-Forwarded-For") or request.remote_addr or "").partition(",")[0].strip()
         raw = f"{ip}|{ua}|{al}"
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+        # Non-cryptographic id: blake2b/16 is cheaper than sha256 and still 32 hex chars.
+        g._poll_cid = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+        return g._poll_cid
     except Exception:
         return "anon"
 
 def _append_lead_local(row: dict) -> None:
     try:
-        os.makedirs(os.path.dirname(LEADS_STORE_PATH), exist_ok=True)
-        with open(LEADS_STORE_PATH, "a", encoding="utf-8") as f:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        _jsonl_append(LEADS_STORE_PATH, _dumps_json_compact(row) + b"\n")
     except Exception:
         pass
 
@@ -20592,7 +22323,7 @@ def _extract_row_num_from_updated_range(updated_range: str) -> int:
         if "!" in updated_range:
             updated_range = updated_range.split("!", 1)[1]
         first = updated_range.split(":", 1)[0]
-        m = re.search(r"(\d+)$", first)
+        m = _RE_TRAILING_NUM.search(first)
         return int(m.group(1)) if m else 0
     except Exception:
         return 0
@@ -20687,63 +22418,86 @@ def _get_super_admin_key():
 # =========================
 def _demo_mode_enabled() -> bool:
     try:
-        # Explicit header wins (used by Super Admin UI fetches)
-        if str(request.headers.get("X-Demo-Mode","")).strip() in ("1","true","yes","on"):
-            return True
-    except Exception:
-        pass
-    try:
-        # Cookie set by /super/api/demo_mode
-        if str(request.cookies.get("demo_mode","")).strip() in ("1","true","yes","on"):
-            return True
+        # Explicit header wins (used by Super Admin UI fetches); cookie is set by /super/api/demo_mode
+        sources = (
+            request.headers.get("X-Demo-Mode", ""),
+            request.cookies.get("demo_mode", ""),
+            request.args.get("demo", ""),
+        )
     except Exception:
-        pass
-    try:
-        if str(request.args.get("demo","")).strip() in ("1","true","yes","on"):
+        # No request bound
+        return False
+    for v in sources:
+        if v and v.strip().lower() in _TRUTHY:
             return True
-    except Exception:
-        pass
     return False
 
 def _mask_phone(v: str) -> str:
     s = str(v or "").strip()
     if not s:
         return ""
-    digits = re.sub(r"\D+", "", s)
+    digits = _RE_NON_DIGITS.sub("", s)
     if len(digits) >= 4:
         return "•••-•••-" + digits[-4:]
     return "•••"
 
+# user @ first-domain-label . [middle labels .] tld
+_EMAIL_MASK_RE = re.compile(r"^([^@]*)@([^.]*)\.(?:.*\.)?([^.]*)$", re.S)
+
 def _mask_email(v: str) -> str:
     s = str(v or "").strip()
     if "@" not in s:
         return "•••"
-    user, dom = s.split("@", 1)
-    u = (user[:1] + "•••") if user else "•••"
-    # keep TLD hint
-    parts = dom.split(".")
-    if len(parts) >= 2:
-        d = (parts[0][:1] + "•••") + "." + parts[-1]
-    else:
-        d = dom[:1] + "•••"
-    return u + "@" + d
+    m = _EMAIL_MASK_RE.match(s)
+    if m:
+        # keep TLD hint
+        user, first, tld = m.groups()
+        return user[:1] + "•••@" + first[:1] + "•••." + tld
+    user, _, dom = s.partition("@")
+    return user[:1] + "•••@" + dom[:1] + "•••"
+
+# Common PII fields across your lead schemas -> masker
+_MASK_FNS = (("phone", _mask_phone), ("email", _mask_email))
 
 def _apply_demo_mask_to_lead(item: Dict[str, Any]) -> Dict[str, Any]:
-    x = dict(item or {})
-    # Common fields across your lead schemas
-    if "phone" in x:
-        x["phone"] = _mask_phone(x.get("phone"))
-    if "email" in x:
-        x["email"] = _mask_email(x.get("email"))
-    if "contact" in x and isinstance(x.get("contact"), str):
+    if not item:
+        return {}
+    c = item.get("contact")
+    if not (isinstance(c, str) or "phone" in item or "email" in item):
+        # Nothing to mask: hand back the original (callers never mutate the result)
+        return item
+    x = item.copy()
+    for k, fn in _MASK_FNS:
+        if k in x:
+            x[k] = fn(x[k])
+    if isinstance(c, str):
         # if contact stores phone/email
-        c = x.get("contact") or ""
-        if "@" in c:
-            x["contact"] = _mask_email(c)
-        else:
-            x["contact"] = _mask_phone(c)
+        x["contact"] = _mask_email(c) if "@" in c else _mask_phone(c)
     return x
 
+def _apply_demo_mask_to_leads(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """_apply_demo_mask_to_lead over a page of items (maskers bound to locals for the loop)."""
+    mask_phone, mask_email, fns = _mask_phone, _mask_email, _MASK_FNS
+    out: List[Dict[str, Any]] = []
+    add = out.append
+    for item in items:
+        if not item:
+            add({})
+            continue
+        c = item.get("contact")
+        is_str = isinstance(c, str)
+        if not (is_str or "phone" in item or "email" in item):
+            add(item)
+            continue
+        x = item.copy()
+        for k, fn in fns:
+            if k in x:
+                x[k] = fn(x[k])
+        if is_str:
+            x["contact"] = mask_email(c) if "@" in c else mask_phone(c)
+        add(x)
+    return out
+
 def _is_super_admin_request():
     try:
         sk = _get_super_admin_key()
@@ -20768,6 +22522,7 @@ def _require_super_admin():
 
 
 if __name__ == "__main__":
+    start_lead_writer()
     port = int(os.environ.get("PORT", 5050))
     app.run(host="0.0.0.0", port=port, debug=False)
 # SIZE_PAD_START
@@ -20787,43 +22542,60 @@ def _ops_redis_key() -> str:
 def _fanzone_redis_key() -> str:
     return f"{_REDIS_NS}:{_venue_id()}:fanzone_state"
 
+# Ops state is one level deep: toggles default False, audit fields default None
+_OPS_STATE_DEFAULT = {
+    **dict.fromkeys(("pause", "viponly", "waitlist", "notify"), False),
+    **dict.fromkeys(("updated_at", "updated_by", "updated_role"), None),
+}
+
 def _ops_state_default():
-    return {"pause": False, "viponly": False, "waitlist": False, "notify": False,
-            "updated_at": None, "updated_by": None, "updated_role": None}
+    return dict(_OPS_STATE_DEFAULT)
 
 def _load_ops_state() -> Dict[str, Any]:
     if _REDIS_ENABLED:
-        st = _redis_get_json(_ops_redis_key(), default=None)
+        st = _redis_state_cached(_ops_redis_key(), OPS_STATE_TTL_SECONDS)
         if isinstance(st, dict):
-            return _deep_merge(_ops_state_default(), st)
+            # Flat schema: a C-level dict merge is equivalent to _deep_merge here
+            return {**_OPS_STATE_DEFAULT, **st}
     return _ops_state_default()
 
 def _save_ops_state(patch: Dict[str, Any], actor: str, role: str) -> Dict[str, Any]:
-    st = _deep_merge(_load_ops_state(), patch or {})
-    st["updated_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if _REDIS_ENABLED:
+        key = _ops_redis_key()
+        merged = _redis_merge_ops(key, patch or {}, actor, role)
+        if merged is not None:
+            _redis_state_store(key, merged)
+            return {**_OPS_STATE_DEFAULT, **merged}
+        _REDIS_STATE_CACHE.pop(key, None)  # merge below must start from the stored state
+    # Flat schema (same top-level merge as _OPS_MERGE_LUA); _load_ops_state returns a fresh dict
+    st = _load_ops_state()
+    st.update(patch or {})
+    st["updated_at"] = _utc_z_now()
     st["updated_by"] = actor
     st["updated_role"] = role
     if _REDIS_ENABLED:
-        _redis_set_json(_ops_redis_key(), st)
+        _redis_set_pack(_ops_redis_key(), st)
+        _redis_state_store(_ops_redis_key(), dict(st))
     return st
 
 def _load_fanzone_state() -> Dict[str, Any]:
     if _REDIS_ENABLED:
-        st = _redis_get_json(_fanzone_redis_key(), default=None)
+        st = _redis_state_cached(_fanzone_redis_key(), FANZONE_STATE_TTL_SECONDS)
         if isinstance(st, dict):
-            return st
+            return dict(st)
     st = _safe_read_json_file(POLL_STORE_FILE, default={})
     return st if isinstance(st, dict) else {}
 
 def _save_fanzone_state(st: Dict[str, Any], actor: str, role: str) -> Dict[str, Any]:
     st2 = st if isinstance(st, dict) else {}
     st2["_meta"] = {
-        "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "updated_at": _utc_z_now(),
         "updated_by": actor,
         "updated_role": role,
     }
     if _REDIS_ENABLED:
-        _redis_set_json(_fanzone_redis_key(), st2)
+        _redis_set_pack(_fanzone_redis_key(), st2)
+        _redis_state_store(_fanzone_redis_key(), dict(st2))
     else:
         _safe_write_json_file(POLL_STORE_FILE, st2)
     return st2
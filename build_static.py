@@ -0,0 +1,43 @@
+"""Pre-render /menu.json into MENU_PRERENDER_DIR (default prerender/) so a front proxy can serve it without Python.
+
+Writes, for every supported language:
+  menu.<lang>.json      identity body (byte-identical to GET /menu.json?lang=<lang>)
+  menu.<lang>.json.gz   gzip body (for gzip_static-style serving)
+  menu.<lang>.json.br   brotli body (only when the brotli package is installed)
+plus menu.etags.json mapping each file name to the strong ETag /menu.json sends for it.
+
+The files reflect the menu at build time (built-in menu, or an admin override already on disk).
+An admin menu edit deletes them (app._menu_cache_clear), so the proxy must only serve a file that
+exists and fall through to Flask otherwise (e.g. nginx `try_files $uri @flask`). Requests with
+extra params (?category=...) always go to Flask. The directory is not under static/, so Flask
+never serves these files itself.
+
+Usage (repo root):  python build_static.py
+"""
+import json
+import os
+
+import app as wc
+
+_SUFFIX = {"": ".json", "gzip": ".json.gz", "br": ".json.br"}
+
+
+def build(out_dir: str = wc.MENU_PRERENDER_DIR) -> dict:
+    os.makedirs(out_dir, exist_ok=True)
+    encodings = ["", "gzip"] + (["br"] if wc.brotli is not None else [])
+    etags = {}
+    for lang in wc.SUPPORTED_LANGS:
+        for enc in encodings:
+            name = f"menu.{lang}{_SUFFIX[enc]}"
+            with open(os.path.join(out_dir, name), "wb") as f:
+                f.write(wc._menu_json_bytes(lang, enc))
+            etags[name] = f'"{wc._menu_etag(lang, enc)}"'
+    with open(os.path.join(out_dir, "menu.etags.json"), "w", encoding="utf-8") as f:
+        json.dump(etags, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return etags
+
+
+if __name__ == "__main__":
+    for name, etag in build().items():
+        print(f"{name}  {etag}")
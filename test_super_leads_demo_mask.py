@@ -0,0 +1,38 @@
+import pytest
+
+import app as wc
+
+HEADER = ["timestamp", "name", "phone", "status"]
+ROWS = [
+    HEADER,
+    ["2026-06-11T18:00:00", "Ana", "+1 214 555 0199", "New"],
+    ["2026-06-11T19:00:00", "Ben", "+1 469 555 0142", "New"],
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(wc, "_require_super_admin", lambda: (True, None))
+    monkeypatch.setattr(wc, "_sorted_venue_ids", lambda: ("demo-venue",))
+    monkeypatch.setattr(wc, "_venue_is_active", lambda vid: True)
+    monkeypatch.setattr(wc, "read_leads", lambda limit=0, venue_id=None: [list(r) for r in ROWS])
+    return wc.app.test_client()
+
+
+def _total(client, q):
+    r = client.get("/super/api/leads", query_string={"q": q})
+    assert r.status_code == 200
+    return r.get_json()["total"]
+
+
+def test_demo_mode_search_ignores_masked_phone_digits(client, monkeypatch):
+    monkeypatch.setattr(wc, "_demo_mode_server", lambda: True)
+    # "214 555" is hidden by the mask (only the last 4 digits are shown)
+    assert _total(client, "214 555") == 0
+    assert _total(client, "0199") == 1
+    assert _total(client, "ana") == 1
+
+
+def test_search_matches_raw_phone_outside_demo_mode(client, monkeypatch):
+    monkeypatch.setattr(wc, "_demo_mode_server", lambda: False)
+    assert _total(client, "214 555") == 1
@@ -2,7 +2,8 @@ import os
 # Marker set BEFORE importing app.py so production guard can verify WSGI path.
 os.environ["WCG_WSGI"] = "1"
 
-from app import app as application
+from app import app as application, start_lead_writer
 
 app = application
 application.config["WSGI_LOADED"] = True
+start_lead_writer()